@@ -5,28 +5,71 @@ Baton-driven shared-state coordination for vibespec fix/triage gate loops.
 from __future__ import annotations
 
 import argparse
+import copy
+import errno
 import hashlib
 import json
 import os
 import re
+import secrets
+import select
 import shlex
+import signal
+import socket
+import socketserver
+import sqlite3
+import stat
 import subprocess
 import sys
 import tempfile
+import threading
 import time
 from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
 
+try:
+    from . import discovery
+except ImportError:
+    import discovery
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms use the lock-file fallback
+    fcntl = None
+
 TERMINAL_STATUSES = {"done", "aborted", "blocked"}
 ACTORS = {"fix", "triage"}
 GATE_NAME = "all-defects"
+GATE_NAME_RE = re.compile(r"[a-z0-9][a-z0-9_-]{0,63}")
+ARCHIVED_GATE_MARKER = "-archived-"
 PROTOCOL_VERSION = 3
+TURN_LOCK_TIMEOUT_SECONDS = 10.0
+TURN_LOCK_BACKOFF_SECONDS = (0.01, 0.25)
+TURN_LOCK_STALE_SECONDS = 300.0
 REPO_GATE_PROFILE_RELATIVE_PATH = "specs/gate-profile.json"
+DISCOVERY_SNAPSHOT_FILENAME = "discovery-snapshot.json"
+JOURNAL_FSYNC_BATCH = 32
+JOURNAL_COMPACT_ENTRIES = 256
+SERVE_CONNECT_TIMEOUT_SECONDS = 0.5
+REVIEW_LEASE_SECONDS = 900.0
+FIX_SHARD_LEASE_SECONDS = 3600.0
+STORAGE_BACKEND_ENV = "VIBESPEC_AGENT_SYNC_STORAGE"
+STORAGE_BACKENDS = ("json", "sqlite")
+SQLITE_STORAGE_FILENAME = "coordination.sqlite3"
+SQLITE_BUSY_TIMEOUT_SECONDS = 30.0
+PROGRESS_FAMILY_LABELS = {
+    "progress": "Progress",
+    "coverage-progress": "Coverage progress",
+}
+WHITE_BOX_PATH_TOKEN_RE = re.compile(r"[\w.-]+(?:/[\w.-]+)+")
+WHITE_BOX_NAME_TOKEN_RE = re.compile(r"\w+")
+WHITE_BOX_COMPOUND_TOKEN_RE = re.compile(r"\w+(?:[-.]\w+)+")
 QUALITY_TARGET_ID = "VISION.QUALITY_DETECTION"
 QUALITY_TARGET_SOURCE_PROJECT = "project-specs"
 QUALITY_TARGET_SOURCE_TEMPLATE = "vibespec-template"
 COORDINATION_MODEL = "coordinator-plus-one-worker"
+MULTI_WORKER_COORDINATION_MODEL = "coordinator-plus-n-workers"
 COORDINATION_AUTHORITY = {
     "type": "installed-skill",
     "skill_name": "subagent-baton",
@@ -43,6 +86,8 @@ WORKER_STATES = {
     WORKER_STATE_RELEASED,
     WORKER_STATE_OWNER,
 }
+FIX_SHARD_RELEASED = "released"
+FIX_SHARD_SUBMITTED = "submitted"
 WORKER_CONTROL_MARKERS = [
     "ITERATION_DONE_WORKER_CONTINUE",
     "BATON_READY_FOR_COORDINATOR",
@@ -69,6 +114,32 @@ QUALITY_DEFECT_TYPES = [
     "blind_wait",
 ]
 PROGRESS_DECISIONS = {"aligned", "defect", "blocked"}
+PROGRESS_BATCH_STRING_FIELDS = {"target", "decision", "defect_type", "evidence_summary"}
+TRIAGE_PROGRESS_BATCH_FIELDS = (
+    "target",
+    "defect_type",
+    "decision",
+    "evidence_summary",
+    "evidence_files",
+    "reviewed_anchor_files",
+    "reviewed_context_files",
+    "notes",
+    "defect_ids",
+)
+COVERAGE_PROGRESS_BATCH_FIELDS = (
+    "target",
+    "decision",
+    "evidence_summary",
+    "evidence_files",
+    "reviewed_test_files",
+    "reviewed_source_files",
+    "notes",
+    "defect_ids",
+)
+BATCH_PROGRESS_COMMANDS = {
+    "publish-triage-progress-batch",
+    "publish-test-coverage-progress-batch",
+}
 GATE_PROFILE = {
     "description": (
         "Unified review-first triage gate covering semantic drift, quality review, "
@@ -184,6 +255,804 @@ def write_json_atomic(path: Path, payload: dict) -> None:
             tmp_path.unlink()
 
 
+def process_is_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except (PermissionError, OSError):
+        return True
+    return True
+
+
+class TurnLock:
+    """Blocking, stale-aware mutex serializing gate state transitions.
+
+    Uses `fcntl.flock` where available, so the kernel drops the lock when its
+    holder dies; elsewhere an exclusive-create lock file is broken once its
+    owner is dead or older than `TURN_LOCK_STALE_SECONDS`. Owner metadata left
+    behind at acquisition time means the previous holder died mid-transition
+    and is counted as a stale break in the contention metrics.
+    """
+
+    def __init__(self, lease_dir: Path, timeout: float = TURN_LOCK_TIMEOUT_SECONDS):
+        self.lease_dir = lease_dir
+        self.lock_path = lease_dir / "turn.lock"
+        self.owner_path = lease_dir / "turn.owner.json"
+        self.stats_path = lease_dir / "turn-lock-stats.json"
+        self.timeout = timeout
+
+    @contextmanager
+    def hold(self):
+        self.lease_dir.mkdir(parents=True, exist_ok=True)
+        if self.lock_path.is_dir():
+            # Pre-flock protocol used an mkdir lock that a killed process never removed.
+            try:
+                self.lock_path.rmdir()
+            except OSError:
+                pass
+
+        started = time.monotonic()
+        delay, max_delay = TURN_LOCK_BACKOFF_SECONDS
+        attempts = 0
+        while True:
+            handle = self._try_acquire()
+            if handle is not None:
+                break
+            attempts += 1
+            if time.monotonic() - started >= self.timeout:
+                raise CoordinationError(
+                    "Turn lock is currently held by another transition"
+                    f"{self._owner_hint()}; gave up after {self.timeout:.1f}s."
+                )
+            time.sleep(delay)
+            delay = min(delay * 2, max_delay)
+
+        try:
+            stale_owner = self.read_owner()
+            write_json_atomic(
+                self.owner_path,
+                {"pid": os.getpid(), "host": socket.gethostname(), "acquired_at": utc_now()},
+            )
+            if attempts or stale_owner is not None:
+                self._record_contention(time.monotonic() - started, attempts, stale_owner)
+            yield
+        finally:
+            self.owner_path.unlink(missing_ok=True)
+            self._release(handle)
+
+    def _try_acquire(self) -> int | None:
+        if fcntl is not None:
+            fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                os.close(fd)
+                return None
+            return fd
+        try:
+            return os.open(self.lock_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        except FileExistsError:
+            if self._fallback_lock_is_stale():
+                self.lock_path.unlink(missing_ok=True)
+            return None
+
+    def _release(self, fd: int) -> None:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+            os.close(fd)
+            return
+        os.close(fd)
+        self.lock_path.unlink(missing_ok=True)
+
+    def _fallback_lock_is_stale(self) -> bool:
+        owner = self.read_owner()
+        if owner and owner.get("host") == socket.gethostname():
+            return not process_is_alive(int(owner.get("pid", 0)))
+        try:
+            age = time.time() - self.lock_path.stat().st_mtime
+        except OSError:
+            return False
+        return age > TURN_LOCK_STALE_SECONDS
+
+    def read_owner(self) -> dict | None:
+        try:
+            return json.loads(self.owner_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def _owner_hint(self) -> str:
+        owner = self.read_owner()
+        if not owner:
+            return ""
+        return f" (pid {owner.get('pid')} on {owner.get('host')} since {owner.get('acquired_at')})"
+
+    def stats(self) -> dict:
+        try:
+            return json.loads(self.stats_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {
+                "contended_acquisitions": 0,
+                "total_wait_ms": 0.0,
+                "max_wait_ms": 0.0,
+                "retries": 0,
+                "stale_breaks": 0,
+                "last_contention_at": None,
+            }
+
+    def _record_contention(self, waited: float, attempts: int, stale_owner: dict | None) -> None:
+        stats = self.stats()
+        waited_ms = round(waited * 1000, 3)
+        if attempts:
+            stats["contended_acquisitions"] += 1
+            stats["total_wait_ms"] = round(stats["total_wait_ms"] + waited_ms, 3)
+            stats["max_wait_ms"] = max(stats["max_wait_ms"], waited_ms)
+            stats["retries"] += attempts
+        if stale_owner is not None:
+            stats["stale_breaks"] += 1
+            stats["last_stale_owner"] = stale_owner
+        stats["last_contention_at"] = utc_now()
+        write_json_atomic(self.stats_path, stats)
+
+    def describe(self) -> dict:
+        return {"owner": self.read_owner(), "stats": self.stats()}
+
+
+class StateWakeups:
+    """Wake `wait_for_turn` callers as soon as gate state is rewritten.
+
+    Each waiting process listens on its own FIFO in `wakeup_dir`; writers poke
+    every FIFO after replacing the state file. Platforms without `os.mkfifo`
+    fall back to plain polling.
+    """
+
+    def __init__(self, wakeup_dir: Path):
+        self.wakeup_dir = wakeup_dir
+
+    @contextmanager
+    def listen(self):
+        if not hasattr(os, "mkfifo"):
+            yield None
+            return
+        fifo_path = self.wakeup_dir / f"{os.getpid()}-{secrets.token_hex(4)}.fifo"
+        try:
+            self.wakeup_dir.mkdir(parents=True, exist_ok=True)
+            os.mkfifo(fifo_path, 0o600)
+            # Opening read-write keeps a writer attached, so select() never sees EOF.
+            fd = os.open(fifo_path, os.O_RDWR | os.O_NONBLOCK)
+        except OSError:
+            yield None
+            return
+        try:
+            yield fd
+        finally:
+            os.close(fd)
+            try:
+                fifo_path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def wait(self, channel: int | None, timeout: float) -> bool:
+        """Block up to `timeout` seconds; returns True when a writer signalled."""
+        if channel is None:
+            time.sleep(timeout)
+            return False
+        readable, _, _ = select.select([channel], [], [], timeout)
+        if not readable:
+            return False
+        try:
+            while os.read(channel, 4096):
+                pass
+        except BlockingIOError:
+            pass
+        return True
+
+    def notify(self) -> None:
+        if not self.wakeup_dir.is_dir():
+            return
+        for fifo_path in self.wakeup_dir.glob("*.fifo"):
+            try:
+                fd = os.open(fifo_path, os.O_WRONLY | os.O_NONBLOCK)
+            except OSError as exc:
+                if exc.errno == errno.ENXIO:
+                    # No reader: the waiting process died without cleaning up.
+                    fifo_path.unlink(missing_ok=True)
+                continue
+            try:
+                os.write(fd, b"\n")
+            except BlockingIOError:
+                pass
+            finally:
+                os.close(fd)
+
+
+class ProgressUnitTable:
+    """Required progress units of one submission phase, keyed by `(target, defect_type)`.
+
+    The unit list is materialized once per submission and stored next to the
+    progress records, so publishing a unit or checking phase completion does
+    not rediscover specs and source components from disk.
+    """
+
+    def __init__(self, units: list[dict[str, object]]):
+        self.units = units
+        self.unit_ids = {str(unit["unit_id"]) for unit in units}
+        self.by_key: dict[tuple[str, str | None], list[dict[str, object]]] = {}
+        for unit in units:
+            key = (str(unit["target"]), unit.get("defect_type"))
+            self.by_key.setdefault(key, []).append(unit)
+
+    def matching(self, target: str, defect_type: str | None) -> list[dict[str, object]]:
+        return self.by_key.get((target, defect_type), [])
+
+    @classmethod
+    def load_or_materialize(cls, path: Path, build_units) -> "ProgressUnitTable":
+        if path.is_file():
+            try:
+                payload = json.loads(path.read_text(encoding="utf-8"))
+            except json.JSONDecodeError as exc:
+                raise CoordinationError(
+                    f"Progress unit table `{path}` must be valid JSON."
+                ) from exc
+            units = payload.get("units") if isinstance(payload, dict) else None
+            if not isinstance(units, list):
+                raise CoordinationError(
+                    f"Progress unit table `{path}` must include a `units` list."
+                )
+            return cls(units)
+        units = build_units()
+        write_json_atomic(path, {"created_at": utc_now(), "units": units})
+        return cls(units)
+
+
+class UnitLeases:
+    """Time-bounded reviewer claims on the progress units of one phase.
+
+    Read and written only under the turn lock. Leases past `expires_at` (epoch
+    seconds) are dropped on load, so units claimed by a reviewer that crashed
+    return to the queue.
+    """
+
+    def __init__(self, path: Path, leases: dict[str, dict]):
+        self.path = path
+        self.leases = leases
+
+    @classmethod
+    def load(cls, path: Path, now: float) -> "UnitLeases":
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return cls(path, {})
+        except json.JSONDecodeError as exc:
+            raise CoordinationError(f"Unit lease file `{path}` must be valid JSON.") from exc
+        leases = payload.get("leases") if isinstance(payload, dict) else None
+        if not isinstance(leases, dict):
+            raise CoordinationError(f"Unit lease file `{path}` must include a `leases` object.")
+        return cls(
+            path,
+            {
+                unit_id: lease
+                for unit_id, lease in leases.items()
+                if float(lease.get("expires_at", 0)) > now
+            },
+        )
+
+    def holder(self, unit_id: str) -> str | None:
+        lease = self.leases.get(unit_id)
+        return None if lease is None else str(lease["reviewer"])
+
+    def save(self) -> None:
+        write_json_atomic(self.path, {"leases": self.leases})
+
+
+class StateJournal:
+    """Gate state kept as a snapshot plus an append-only journal of transition deltas.
+
+    `state/current.json` holds the last compacted state and `journal.jsonl` one
+    compact `{"rev", "set", "unset"}` line per later transition. Readers replay
+    lines newer than the snapshot's `state_revision` and keep the result, so
+    the next read only parses lines appended since. Appends are fsynced every
+    `JOURNAL_FSYNC_BATCH` lines; every `JOURNAL_COMPACT_ENTRIES` lines the state
+    is rewritten as a new snapshot and the journal starts over. Writers must
+    hold the turn lock.
+    """
+
+    def __init__(self, snapshot_path: Path, journal_path: Path):
+        self.snapshot_path = snapshot_path
+        self.journal_path = journal_path
+        self._mutex = threading.Lock()
+        self._cache: dict | None = None
+
+    def signature(self) -> tuple:
+        return (file_signature(self.snapshot_path), file_signature(self.journal_path))
+
+    def read(self) -> dict:
+        with self._mutex:
+            return copy.deepcopy(self._replay()["state"])
+
+    def write(self, state: dict) -> None:
+        with self._mutex:
+            cache = self._replay() if self.snapshot_path.exists() else None
+            if (
+                cache is None
+                or int(state.get("state_revision", 0)) <= int(cache["state"].get("state_revision", 0))
+                or cache["entries"] >= JOURNAL_COMPACT_ENTRIES
+            ):
+                self._compact(state)
+                return
+            base = cache["state"]
+            delta = {
+                "rev": state["state_revision"],
+                "set": {
+                    key: value
+                    for key, value in state.items()
+                    if key not in base or base[key] != value
+                },
+                "unset": sorted(key for key in base if key not in state),
+            }
+            line = (json.dumps(delta, separators=(",", ":"), sort_keys=True) + "\n").encode("utf-8")
+            fd = os.open(self.journal_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, line)
+                if (cache["entries"] + 1) % JOURNAL_FSYNC_BATCH == 0:
+                    os.fsync(fd)
+                journal_ino = os.fstat(fd).st_ino
+            finally:
+                os.close(fd)
+            cache.update(
+                state=copy.deepcopy(state),
+                journal_ino=journal_ino,
+                offset=cache["offset"] + len(line),
+                entries=cache["entries"] + 1,
+            )
+
+    def _compact(self, state: dict) -> None:
+        write_json_atomic(self.snapshot_path, state)
+        # The snapshot lands first: if we stop here, its revision already
+        # shadows every line still left in the old journal.
+        fd, tmp_name = tempfile.mkstemp(
+            dir=str(self.snapshot_path.parent), prefix=self.journal_path.name, suffix=".tmp"
+        )
+        os.close(fd)
+        os.replace(tmp_name, self.journal_path)
+        journal_signature = file_signature(self.journal_path)
+        self._cache = {
+            "snapshot": file_signature(self.snapshot_path),
+            "journal_ino": journal_signature[0] if journal_signature else None,
+            "offset": 0,
+            "entries": 0,
+            "state": copy.deepcopy(state),
+        }
+
+    def _replay(self) -> dict:
+        cache = self._cache
+        journal_signature = file_signature(self.journal_path)
+        if (
+            cache is not None
+            and journal_signature is not None
+            and cache["snapshot"] == file_signature(self.snapshot_path)
+            and cache["journal_ino"] == journal_signature[0]
+            and journal_signature[2] >= cache["offset"]
+        ):
+            if journal_signature[2] > cache["offset"]:
+                with open(self.journal_path, "rb") as handle:
+                    handle.seek(cache["offset"])
+                    self._apply_lines(cache, handle.read())
+            return cache
+
+        # Read the journal before the snapshot: lines compacted in between are
+        # then shadowed by the newer snapshot's revision instead of being lost.
+        try:
+            with open(self.journal_path, "rb") as handle:
+                raw_journal = handle.read()
+                journal_ino = os.fstat(handle.fileno()).st_ino
+        except FileNotFoundError:
+            raw_journal, journal_ino = b"", None
+        with open(self.snapshot_path, "rb") as handle:
+            state = json.loads(handle.read())
+            snapshot_stat = os.fstat(handle.fileno())
+        cache = {
+            "snapshot": (snapshot_stat.st_ino, snapshot_stat.st_mtime_ns, snapshot_stat.st_size),
+            "journal_ino": journal_ino,
+            "offset": 0,
+            "entries": 0,
+            "state": state,
+        }
+        self._apply_lines(cache, raw_journal)
+        self._cache = cache
+        return cache
+
+    @staticmethod
+    def _apply_lines(cache: dict, raw: bytes) -> None:
+        # A line without its newline is still being appended; pick it up next read.
+        complete = raw[: raw.rfind(b"\n") + 1]
+        state = cache["state"]
+        for line in complete.splitlines():
+            if not line.strip():
+                continue
+            delta = json.loads(line)
+            cache["entries"] += 1
+            if int(delta["rev"]) <= int(state.get("state_revision", 0)):
+                continue
+            state.update(delta["set"])
+            for key in delta["unset"]:
+                state.pop(key, None)
+        cache["offset"] += len(complete)
+
+
+class JsonProgressStorage:
+    """Progress records as one JSON file per unit under the gate task directory.
+
+    `family` is `progress` for triage units and `coverage-progress` for
+    coverage units; `phase` is the defect class or coverage kind.
+    """
+
+    name = "json"
+
+    def __init__(self, root: Path, task_dir: Path):
+        self.root = root
+        self.task_dir = task_dir
+
+    def _phase_dir(self, family: str, submission_id: int, phase: str) -> Path:
+        return self.task_dir / family / f"submission-{submission_id:04d}" / phase
+
+    def _record_path(self, family: str, submission_id: int, phase: str, unit_id: str) -> Path:
+        digest = hashlib.sha1(unit_id.encode("utf-8")).hexdigest()[:10]
+        slug = sanitize_progress_slug(unit_id)
+        return self._phase_dir(family, submission_id, phase) / f"{slug}-{digest}.json"
+
+    def write_records(
+        self, family: str, submission_id: int, phase: str, records: list[dict]
+    ) -> list[str]:
+        """Write new unit records; refuse all of them if any unit already has one.
+
+        A write that fails partway removes the records already written, so a
+        retry of the batch does not trip over its own leftovers.
+        """
+        paths = [
+            self._record_path(family, submission_id, phase, record["unit_id"])
+            for record in records
+        ]
+        for path, record in zip(paths, records):
+            if path.exists():
+                raise CoordinationError(
+                    f"{PROGRESS_FAMILY_LABELS[family]} for `{record['unit_id']}` already exists. Reset the gate state before replacing it."
+                )
+        written: list[Path] = []
+        try:
+            for path, record in zip(paths, records):
+                write_json_atomic(path, record)
+                written.append(path)
+        except BaseException:
+            for path in written:
+                path.unlink(missing_ok=True)
+            raise
+        return [str(path.relative_to(self.root)) for path in paths]
+
+    def load_records(self, family: str, submission_id: int, phase: str) -> dict[str, dict]:
+        label = PROGRESS_FAMILY_LABELS[family]
+        records: dict[str, dict] = {}
+        phase_dir = self._phase_dir(family, submission_id, phase)
+        if not phase_dir.is_dir():
+            return records
+
+        for path in sorted(phase_dir.glob("*.json")):
+            try:
+                payload = json.loads(path.read_text(encoding="utf-8"))
+            except json.JSONDecodeError as exc:
+                raise CoordinationError(f"{label} artifact `{path}` must be valid JSON.") from exc
+            if not isinstance(payload, dict):
+                raise CoordinationError(f"{label} artifact `{path}` must be a JSON object.")
+            unit_id = str(payload.get("unit_id", "")).strip()
+            if not unit_id:
+                raise CoordinationError(f"{label} artifact `{path}` is missing `unit_id`.")
+            if unit_id in records:
+                raise CoordinationError(
+                    f"Duplicate {label.lower()} unit `{unit_id}` detected for submission {submission_id} / {phase}."
+                )
+            payload["_path"] = str(path.relative_to(self.root))
+            records[unit_id] = payload
+        return records
+
+
+class SqliteProgressStorage:
+    """Progress records as rows of one SQLite database in the gate task directory.
+
+    Records sit in a table keyed by `(family, submission_id, phase, unit_id)`,
+    so loading a phase is one indexed query and a batch is written in one
+    transaction. Each call opens its own connection, which keeps the storage
+    usable from the resident server's worker threads.
+    """
+
+    name = "sqlite"
+    SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS progress_units ("
+        " family TEXT NOT NULL,"
+        " submission_id INTEGER NOT NULL,"
+        " phase TEXT NOT NULL,"
+        " unit_id TEXT NOT NULL,"
+        " decision TEXT NOT NULL,"
+        " record TEXT NOT NULL,"
+        " PRIMARY KEY (family, submission_id, phase, unit_id)"
+        ")"
+    )
+
+    def __init__(self, root: Path, db_path: Path):
+        self.root = root
+        self.db_path = db_path
+
+    @contextmanager
+    def _connect(self):
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(
+            self.db_path, timeout=SQLITE_BUSY_TIMEOUT_SECONDS, isolation_level=None
+        )
+        try:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(self.SCHEMA)
+            yield connection
+        finally:
+            connection.close()
+
+    def _location(self, family: str, submission_id: int, phase: str, unit_id: str) -> str:
+        return (
+            f"{self.db_path.relative_to(self.root)}#{family}/"
+            f"submission-{submission_id:04d}/{phase}/{unit_id}"
+        )
+
+    def write_records(
+        self, family: str, submission_id: int, phase: str, records: list[dict]
+    ) -> list[str]:
+        """Insert new unit records in one transaction; refuse all of them if any unit exists."""
+        with self._connect() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                for record in records:
+                    try:
+                        connection.execute(
+                            "INSERT INTO progress_units"
+                            " (family, submission_id, phase, unit_id, decision, record)"
+                            " VALUES (?, ?, ?, ?, ?, ?)",
+                            (
+                                family,
+                                submission_id,
+                                phase,
+                                record["unit_id"],
+                                record["decision"],
+                                json.dumps(record, sort_keys=True),
+                            ),
+                        )
+                    except sqlite3.IntegrityError as exc:
+                        raise CoordinationError(
+                            f"{PROGRESS_FAMILY_LABELS[family]} for `{record['unit_id']}` already exists. Reset the gate state before replacing it."
+                        ) from exc
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+        return [
+            self._location(family, submission_id, phase, record["unit_id"])
+            for record in records
+        ]
+
+    def load_records(self, family: str, submission_id: int, phase: str) -> dict[str, dict]:
+        with self._connect() as connection:
+            rows = connection.execute(
+                "SELECT unit_id, record FROM progress_units"
+                " WHERE family = ? AND submission_id = ? AND phase = ?"
+                " ORDER BY unit_id",
+                (family, submission_id, phase),
+            ).fetchall()
+        records: dict[str, dict] = {}
+        for unit_id, raw_record in rows:
+            payload = json.loads(raw_record)
+            payload["_path"] = self._location(family, submission_id, phase, unit_id)
+            records[unit_id] = payload
+        return records
+
+
+def progress_storage(root: Path, task_dir: Path, backend: str | None = None):
+    """The progress storage selected by `backend` or `VIBESPEC_AGENT_SYNC_STORAGE` (default: json)."""
+    backend = (backend or os.environ.get(STORAGE_BACKEND_ENV) or "json").strip().lower()
+    if backend not in STORAGE_BACKENDS:
+        raise CoordinationError(
+            f"{STORAGE_BACKEND_ENV} must be one of: " + ", ".join(STORAGE_BACKENDS) + "."
+        )
+    if backend == "sqlite":
+        return SqliteProgressStorage(root, task_dir / SQLITE_STORAGE_FILENAME)
+    return JsonProgressStorage(root, task_dir)
+
+
+class DiscoverySnapshot:
+    """Discovery results for one worktree state, persisted under `.git/agent-sync/`.
+
+    Entries are keyed by what they discover plus the roots or globs they cover.
+    When the worktree fingerprint moves, only entries whose scope contains a
+    changed path are dropped; a new HEAD drops everything.
+    """
+
+    def __init__(self, path: Path, fingerprint: dict | None, entries: dict[str, dict]):
+        self.path = path
+        self.fingerprint = fingerprint
+        self.entries = entries
+        self.modified = False
+
+    @classmethod
+    def load(cls, path: Path, fingerprint: dict | None) -> "DiscoverySnapshot":
+        entries: dict[str, dict] = {}
+        if fingerprint is None:
+            return cls(path, None, entries)
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            payload = None
+        previous_dirty = None
+        if isinstance(payload, dict) and payload.get("head") == fingerprint["head"]:
+            previous_dirty = payload.get("dirty", {})
+            changed = {
+                rel_path
+                for rel_path in set(previous_dirty) | set(fingerprint["dirty"])
+                if previous_dirty.get(rel_path) != fingerprint["dirty"].get(rel_path)
+            }
+            for key, entry in payload.get("entries", {}).items():
+                if not scope_contains_any(entry.get("scopes"), changed):
+                    entries[key] = entry
+        snapshot = cls(path, fingerprint, entries)
+        snapshot.modified = previous_dirty != fingerprint["dirty"]
+        return snapshot
+
+    def get(self, key: str, scopes: list[str] | None, compute):
+        if self.fingerprint is None:
+            return compute()
+        entry = self.entries.get(key)
+        if entry is None:
+            entry = {"scopes": scopes, "value": compute()}
+            self.entries[key] = entry
+            self.modified = True
+        return copy.deepcopy(entry["value"])
+
+    def save(self) -> None:
+        if self.fingerprint is None or not self.modified:
+            return
+        write_json_atomic(self.path, {**self.fingerprint, "entries": self.entries})
+
+
+def worktree_fingerprint(root: Path) -> dict | None:
+    """HEAD plus the status and stat of every dirty, untracked or ignored path; `None` outside git.
+
+    Ignored paths are included because the default discovery walk finds them too.
+    """
+    code, head, _ = run_command(["git", "rev-parse", "--verify", "HEAD"], root)
+    if code != 0:
+        return None
+    code, status, _ = run_command(
+        ["git", "status", "--porcelain=v1", "-z", "--untracked-files=all", "--ignored=traditional"],
+        root,
+    )
+    if code != 0:
+        return None
+    dirty: dict[str, list] = {}
+    records = iter(status.split("\0"))
+    for record in records:
+        if len(record) < 4:
+            continue
+        status_code, rel_path = record[:2], record[3:]
+        if status_code[0] in "RC":
+            # Renames and copies are followed by their source path.
+            dirty[next(records, "")] = [status_code]
+        signature = file_signature(root / rel_path)
+        dirty[rel_path] = [status_code, *(signature[1:] if signature else ())]
+    return {"head": head.strip(), "dirty": dirty}
+
+
+def scope_contains_any(scopes: list[str] | None, rel_paths: set[str]) -> bool:
+    if not rel_paths:
+        return False
+    if scopes is None:
+        return True
+    for scope in scopes:
+        prefix = scope.strip("/")
+        if prefix in ("", "."):
+            return True
+        if any(rel_path == prefix or rel_path.startswith(prefix + "/") for rel_path in rel_paths):
+            return True
+    return False
+
+
+def glob_scope(pattern: str) -> str:
+    """Directory prefix of a glob pattern up to its first wildcard component."""
+    parts: list[str] = []
+    for part in Path(pattern).parts[:-1]:
+        if any(char in part for char in "*?["):
+            break
+        parts.append(part)
+    return "/".join(parts)
+
+
+def file_signature(path: Path) -> tuple | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
+def validate_gate_name(gate: str) -> str:
+    gate = gate.strip()
+    if not GATE_NAME_RE.fullmatch(gate) or ARCHIVED_GATE_MARKER in gate:
+        raise CoordinationError(
+            f"Gate namespace `{gate}` must be lowercase letters, digits, `-` or `_`, and must not contain `{ARCHIVED_GATE_MARKER}`."
+        )
+    return gate
+
+
+def gate_name_argument(value: str) -> str:
+    """argparse `type` for `--namespace`, rejecting names before any path is built from them."""
+    try:
+        return validate_gate_name(value)
+    except CoordinationError as exc:
+        raise argparse.ArgumentTypeError(str(exc)) from exc
+
+
+def read_jsonl_records(source: str) -> list[object]:
+    """Read JSON-lines records from a file path, or from stdin when `source` is `-`."""
+    if source == "-":
+        lines = sys.stdin.read().splitlines()
+    else:
+        try:
+            lines = Path(source).read_text(encoding="utf-8").splitlines()
+        except OSError as exc:
+            raise CoordinationError(f"Cannot read records from `{source}`: {exc}") from exc
+    records: list[object] = []
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            records.append(json.loads(line))
+        except json.JSONDecodeError as exc:
+            raise CoordinationError(
+                f"`{source}` line {line_number} must be a valid JSON record."
+            ) from exc
+    return records
+
+
+def batch_entry_fields(entries: list[object], allowed_fields: tuple[str, ...]) -> list[dict]:
+    """Check batch records and return keyword arguments for the single-record validator."""
+    if not entries:
+        raise CoordinationError("Progress batch must include at least one record.")
+    normalized: list[dict] = []
+    for index, entry in enumerate(entries, start=1):
+        if not isinstance(entry, dict):
+            raise CoordinationError(f"Progress batch record {index} must be a JSON object.")
+        unknown_fields = sorted(set(entry) - set(allowed_fields))
+        if unknown_fields:
+            raise CoordinationError(
+                f"Progress batch record {index} has unknown fields: "
+                + ", ".join(unknown_fields)
+                + "."
+            )
+        for field in ("target", "decision"):
+            if not isinstance(entry.get(field), str) or not entry[field].strip():
+                raise CoordinationError(
+                    f"Progress batch record {index} must include `{field}`."
+                )
+        for field in allowed_fields:
+            value = entry.get(field)
+            if value is None:
+                continue
+            if field in PROGRESS_BATCH_STRING_FIELDS:
+                if not isinstance(value, str):
+                    raise CoordinationError(
+                        f"Progress batch record {index}: `{field}` must be a string."
+                    )
+            elif not isinstance(value, list) or not all(isinstance(item, str) for item in value):
+                raise CoordinationError(
+                    f"Progress batch record {index}: `{field}` must be a list of strings."
+                )
+        normalized.append({field: entry.get(field) for field in allowed_fields})
+    return normalized
+
+
 def parse_key_value_pairs(entries: list[str] | None, label: str) -> dict[str, str]:
     parsed: dict[str, str] = {}
     for entry in entries or []:
@@ -239,7 +1108,7 @@ def resolve_quality_target(root: Path) -> dict[str, str]:
     }
 
 
-def gate_profile_payload(quality_target: dict[str, str]) -> dict:
+def gate_profile_payload(quality_target: dict[str, str], fix_worker_count: int = 1) -> dict:
     return {
         "description": GATE_PROFILE["description"],
         "triage_workflow": dict(GATE_PROFILE["triage_workflow"]),
@@ -248,10 +1117,11 @@ def gate_profile_payload(quality_target: dict[str, str]) -> dict:
         "quality_target_id": quality_target["quality_target_id"],
         "quality_target_source": quality_target["quality_target_source"],
         "quality_checklist": list(GATE_PROFILE["quality_checklist"]),
-        "coordination_model": COORDINATION_MODEL,
+        "coordination_model": coordination_model(fix_worker_count),
         "coordination_authority": dict(COORDINATION_AUTHORITY),
         "coordinator_actor": COORDINATOR_ACTOR,
         "worker_actor": WORKER_ACTOR,
+        "fix_worker_ids": fix_worker_ids(fix_worker_count),
         "worker_iteration_mode": "bounded",
         "worker_control_markers": list(WORKER_CONTROL_MARKERS),
     }
@@ -366,13 +1236,17 @@ def semantic_review_contract(defect_class: str | None) -> dict:
     }
 
 
+def sorted_markdown_files(root: Path) -> list[Path]:
+    return sorted(path for path in discovery.iter_tree_files(root) if path.suffix == ".md")
+
+
 def discover_specs_review_files(root: Path) -> list[str]:
     specs_root = root / "specs"
     if not specs_root.is_dir():
         return []
 
     discovered: list[str] = []
-    for path in sorted(specs_root.rglob("*.md")):
+    for path in sorted_markdown_files(specs_root):
         if "build" in path.parts:
             continue
         try:
@@ -382,6 +1256,22 @@ def discover_specs_review_files(root: Path) -> list[str]:
     return discovered
 
 
+def white_box_reference_tokens(text: str) -> set[str]:
+    """Identifier and relative-path tokens a white-box test may use to name its target.
+
+    Hyphenated or dotted names are also indexed up to each separator, so
+    `my-module.py` and `foo.test.ts` yield the stems `my-module` and `foo.test`.
+    """
+    tokens = set(WHITE_BOX_NAME_TOKEN_RE.findall(text))
+    for compound in WHITE_BOX_COMPOUND_TOKEN_RE.findall(text):
+        tokens.add(compound)
+        tokens.update(compound[: match.start()] for match in re.finditer(r"[-.]", compound))
+    for path_token in WHITE_BOX_PATH_TOKEN_RE.findall(text):
+        path_token = path_token.rstrip(".")
+        tokens.add(path_token[2:] if path_token.startswith("./") else path_token)
+    return tokens
+
+
 def extract_markdown_path_refs(text: str) -> list[str]:
     discovered: list[str] = []
     seen: set[str] = set()
@@ -448,7 +1338,7 @@ def discover_spec_context_files(root: Path) -> tuple[list[str], list[str]]:
     if not specs_root.is_dir():
         return discovered, unresolved
 
-    for spec_path in sorted(specs_root.rglob("*.md")):
+    for spec_path in sorted_markdown_files(specs_root):
         if "build" in spec_path.parts:
             continue
         text = spec_path.read_text(encoding="utf-8")
@@ -670,6 +1560,11 @@ def normalize_notes(entries: list[str] | None) -> list[str]:
     return [entry.strip() for entry in entries or [] if entry and entry.strip()]
 
 
+def normalize_reviewer(reviewer: str | None) -> str | None:
+    """A pool reviewer's name, or `None` when no reviewer is given."""
+    return (reviewer or "").strip() or None
+
+
 def normalize_evidence_summary(summary: str | None) -> str:
     if not summary or not summary.strip():
         raise CoordinationError("Triage reports must include `--evidence-summary`.")
@@ -688,6 +1583,85 @@ def parse_defect_evidence(entries: list[str] | None) -> dict[str, str]:
     return parse_key_value_pairs(entries, "Defect evidence")
 
 
+def coordination_model(fix_worker_count: int) -> str:
+    return COORDINATION_MODEL if fix_worker_count <= 1 else MULTI_WORKER_COORDINATION_MODEL
+
+
+def fix_worker_ids(fix_worker_count: int) -> list[str]:
+    if fix_worker_count <= 1:
+        return [WORKER_ACTOR]
+    return [f"{WORKER_ACTOR}-{index}" for index in range(1, fix_worker_count + 1)]
+
+
+def defect_targets(progress_records: dict[str, dict]) -> dict[str, list[str]]:
+    """Map each defect ID to the progress-unit targets that reported it."""
+    targets: dict[str, list[str]] = {}
+    for record in progress_records.values():
+        target = str(record.get("target", "")).strip()
+        for defect_id in record.get("defect_ids", []):
+            if target and target not in targets.setdefault(defect_id, []):
+                targets[defect_id].append(target)
+    return {defect_id: sorted(paths) for defect_id, paths in targets.items()}
+
+
+def shard_repair_plan(
+    active_repair_plan: list[dict], worker_ids: list[str], lease_expires_at: float
+) -> dict[str, dict]:
+    """Split repair-plan defects into disjoint per-worker shards.
+
+    Defects that share a target land in the same shard, so no two workers are
+    released onto the same file. Defects without targets touch unknown files,
+    so they all stay together in one shard. Shards are dealt largest-first to
+    the least-loaded worker; workers left without defects get no shard.
+    """
+    groups: list[dict] = []
+    group_by_target: dict[str, dict] = {}
+    untargeted: dict | None = None
+    for defect in active_repair_plan:
+        targets = list(defect.get("targets") or [])
+        if not targets:
+            if untargeted is None:
+                untargeted = {"defect_ids": [], "targets": set()}
+                groups.append(untargeted)
+            untargeted["defect_ids"].append(defect["id"])
+            continue
+        touched: list[dict] = []
+        for target in targets:
+            group = group_by_target.get(target)
+            if group is not None and not any(group is seen for seen in touched):
+                touched.append(group)
+        if touched:
+            group = touched[0]
+            for other in touched[1:]:
+                group["defect_ids"].extend(other["defect_ids"])
+                group["targets"].update(other["targets"])
+                groups[:] = [candidate for candidate in groups if candidate is not other]
+        else:
+            group = {"defect_ids": [], "targets": set()}
+            groups.append(group)
+        group["defect_ids"].append(defect["id"])
+        group["targets"].update(targets)
+        for target in group["targets"]:
+            group_by_target[target] = group
+
+    shards = {worker_id: {"defect_ids": [], "targets": set()} for worker_id in worker_ids}
+    for group in sorted(groups, key=lambda candidate: -len(candidate["defect_ids"])):
+        worker_id = min(worker_ids, key=lambda candidate: len(shards[candidate]["defect_ids"]))
+        shards[worker_id]["defect_ids"].extend(group["defect_ids"])
+        shards[worker_id]["targets"].update(group["targets"])
+    return {
+        worker_id: {
+            "defect_ids": shard["defect_ids"],
+            "targets": sorted(shard["targets"]),
+            "status": FIX_SHARD_RELEASED,
+            "lease_expires_at": lease_expires_at,
+            "submission": None,
+        }
+        for worker_id, shard in shards.items()
+        if shard["defect_ids"]
+    }
+
+
 def build_repair_plan(
     defects: list[dict[str, str]],
     defect_class: str,
@@ -743,6 +1717,7 @@ class BatonEngine:
                 status=state["status"],
                 active_owner=active_owner,
                 worker_state=worker_state,
+                worker_count=int(state.get("fix_worker_count", 1)),
             )
         )
         return state
@@ -762,6 +1737,7 @@ class BatonEngine:
                 status=next_state["status"],
                 active_owner=active_owner,
                 worker_state=worker_state,
+                worker_count=int(next_state.get("fix_worker_count", 1)),
             )
         )
         next_state["state_version"] = PROTOCOL_VERSION
@@ -801,10 +1777,11 @@ class BatonEngine:
         status: str,
         active_owner: str | None,
         worker_state: str,
+        worker_count: int = 1,
     ) -> dict:
         if status in TERMINAL_STATUSES:
             return {
-                "coordination_model": COORDINATION_MODEL,
+                "coordination_model": coordination_model(worker_count),
                 "coordination_authority": dict(COORDINATION_AUTHORITY),
                 "coordinator_actor": self.coordinator_actor,
                 "worker_actor": self.worker_actor,
@@ -827,7 +1804,7 @@ class BatonEngine:
             raise CoordinationError("Only the worker actor may use worker_state=`owner`.")
 
         return {
-            "coordination_model": COORDINATION_MODEL,
+            "coordination_model": coordination_model(worker_count),
             "coordination_authority": dict(COORDINATION_AUTHORITY),
             "coordinator_actor": self.coordinator_actor,
             "worker_actor": self.worker_actor,
@@ -840,13 +1817,14 @@ class BatonEngine:
 class VibespecGateAdapter:
     """Vibespec-specific gate state layered on the generic baton engine."""
 
-    def __init__(self, root: Path):
+    def __init__(self, root: Path, gate: str = GATE_NAME):
         self.root = root
+        self.gate = gate
 
-    def initial_state(self) -> dict:
+    def initial_state(self, fix_worker_count: int = 1) -> dict:
         quality_target = resolve_quality_target(self.root)
         return {
-            "gate": GATE_NAME,
+            "gate": self.gate,
             "quality_target_id": quality_target["quality_target_id"],
             "quality_target_source": quality_target["quality_target_source"],
             "status": "active",
@@ -862,6 +1840,8 @@ class VibespecGateAdapter:
             "coverage_report_id": 0,
             "open_defects": [],
             "active_repair_plan": [],
+            "fix_worker_count": fix_worker_count,
+            "fix_shards": {},
             "blocked_reason": None,
             "state_version": PROTOCOL_VERSION,
             "state_revision": 1,
@@ -879,7 +1859,7 @@ class VibespecGateAdapter:
                 "work_budget_required": False,
                 "auto_takeover": False,
             },
-            "gate_profile": gate_profile_payload(quality_target),
+            "gate_profile": gate_profile_payload(quality_target, fix_worker_count),
         }
 
     def reset_cycle_fields(self, state: dict) -> dict:
@@ -895,6 +1875,7 @@ class VibespecGateAdapter:
             "coverage_report_id": 0,
             "open_defects": [],
             "active_repair_plan": [],
+            "fix_shards": {},
             "blocked_reason": None,
             "progress_record_count": 0,
             "last_progress_unit_id": None,
@@ -920,6 +1901,7 @@ class VibespecGateAdapter:
             "coverage_report_id": 0,
             "open_defects": [],
             "active_repair_plan": [],
+            "fix_shards": {},
             "blocked_reason": None,
             "progress_record_count": 0,
             "last_progress_unit_id": None,
@@ -988,6 +1970,7 @@ class VibespecGateAdapter:
         open_defects: list[str],
         active_repair_plan: list[dict[str, str]],
         next_coverage_kind_index: int,
+        fix_worker_count: int = 1,
     ) -> tuple[dict, str | None, str]:
         coverage_complete = next_coverage_kind_index >= len(COVERAGE_KINDS)
         if coverage_complete and not open_defects:
@@ -1002,6 +1985,7 @@ class VibespecGateAdapter:
                     "published_coverage_kinds": published_coverage_kinds,
                     "open_defects": [],
                     "active_repair_plan": [],
+                    "fix_shards": {},
                     "coverage_report_id": report_id,
                     "blocked_reason": None,
                     "last_event": "coverage_audit_completed_clean",
@@ -1021,6 +2005,15 @@ class VibespecGateAdapter:
                     "published_coverage_kinds": published_coverage_kinds,
                     "open_defects": open_defects,
                     "active_repair_plan": active_repair_plan,
+                    "fix_shards": (
+                        shard_repair_plan(
+                            active_repair_plan,
+                            fix_worker_ids(fix_worker_count),
+                            time.time() + FIX_SHARD_LEASE_SECONDS,
+                        )
+                        if fix_worker_count > 1
+                        else {}
+                    ),
                     "coverage_report_id": report_id,
                     "blocked_reason": None,
                     "last_event": "coverage_audit_completed_with_repairs",
@@ -1050,22 +2043,31 @@ class VibespecGateAdapter:
 class CoordinationStore:
     """Vibespec gate adapter layered on a generic baton state engine."""
 
-    def __init__(self, root: str | Path):
+    def __init__(self, root: str | Path, gate: str = GATE_NAME):
         self.root = Path(root).resolve()
+        self.gate = validate_gate_name(gate)
         self.skill_root = Path(__file__).resolve().parent.parent
         self.git_dir = resolve_git_dir(self.root)
         self.sync_dir = self.git_dir / "agent-sync"
-        self.task_dir = self.sync_dir / "gate" / GATE_NAME
+        self.task_dir = self.sync_dir / "gate" / self.gate
         self.state_file = self.task_dir / "state" / "current.json"
-        self.lock_dir = self.task_dir / "lease" / "turn.lock"
+        self.journal = StateJournal(self.state_file, self.task_dir / "journal.jsonl")
+        self.storage = progress_storage(self.root, self.task_dir)
+        self.turn_lock = TurnLock(self.task_dir / "lease")
+        self._gate_profile_cache: tuple[tuple[int, int], dict] | None = None
+        self._white_box_token_cache: dict[str, tuple[tuple | None, set[str]]] = {}
+        self._progress_unit_tables: dict[Path, tuple[tuple | None, ProgressUnitTable]] = {}
+        self._discovery_scope = threading.local()
+        self.discovery_snapshot_path = self.sync_dir / DISCOVERY_SNAPSHOT_FILENAME
         self.submissions_dir = self.task_dir / "submissions"
         self.triage_dir = self.task_dir / "triage"
         self.progress_dir = self.task_dir / "progress"
+        self.wakeups = StateWakeups(self.sync_dir / "wakeup" / self.gate)
         self.engine = BatonEngine(
             coordinator_actor=COORDINATOR_ACTOR,
             worker_actor=WORKER_ACTOR,
         )
-        self.adapter = VibespecGateAdapter(self.root)
+        self.adapter = VibespecGateAdapter(self.root, self.gate)
 
     def ensure_task(self) -> dict:
         if self.state_file.exists():
@@ -1088,21 +2090,67 @@ class CoordinationStore:
                 active_owner=COORDINATOR_ACTOR,
                 worker_state=WORKER_STATE_DORMANT,
             )
-            write_json_atomic(self.state_file, next_state)
+            self._write_state(next_state)
             return next_state
 
-    def init_task(self) -> dict:
+    def init_task(self, fix_workers: int = 1) -> dict:
         if self.state_file.exists():
             raise CoordinationError("Unified gate is already initialized.")
+        if fix_workers < 1:
+            raise CoordinationError("Fix workers must be >= 1.")
+        if self.gate != GATE_NAME:
+            # Refuses a namespace the repo gate profile does not declare.
+            self._load_repo_gate_profile()
 
         initial_state = self.engine.initial_state(
-            self.adapter.initial_state(),
+            self.adapter.initial_state(fix_workers),
             active_owner=COORDINATOR_ACTOR,
             worker_state=WORKER_STATE_DORMANT,
         )
-        write_json_atomic(self.state_file, initial_state)
+        self._write_state(initial_state)
         return initial_state
 
+    def list_gates(self) -> dict:
+        """Summarize every gate namespace in this repo, initialized or only declared."""
+        gates_dir = self.sync_dir / "gate"
+        names: set[str] = set()
+        if gates_dir.is_dir():
+            names.update(
+                entry.name
+                for entry in gates_dir.iterdir()
+                if GATE_NAME_RE.fullmatch(entry.name)
+                and ARCHIVED_GATE_MARKER not in entry.name
+                and (entry / "state" / "current.json").is_file()
+            )
+        try:
+            declared = set(self._load_repo_gate_profile()["namespaces"])
+        except CoordinationError:
+            declared = set()
+        names.update(declared)
+
+        gates: list[dict] = []
+        for name in sorted(names):
+            store = self if name == self.gate else CoordinationStore(self.root, name)
+            entry = {
+                "gate": name,
+                "declared": name in declared,
+                "initialized": store.state_file.exists(),
+            }
+            if entry["initialized"]:
+                state = store.read_state()
+                entry.update(
+                    {
+                        "status": state.get("status"),
+                        "phase": state.get("phase"),
+                        "active_owner": state.get("active_owner"),
+                        "submission_id": state.get("submission_id"),
+                        "open_defect_count": len(state.get("open_defects", [])),
+                        "updated_at": state.get("updated_at"),
+                    }
+                )
+            gates.append(entry)
+        return {"gates": gates}
+
     def _state_is_current_protocol(self, state: dict) -> bool:
         return (
             int(state.get("state_version", 0)) == PROTOCOL_VERSION
@@ -1128,32 +2176,74 @@ class CoordinationStore:
             )
         os.replace(self.task_dir, archive_dir)
 
+    def _write_state(self, state: dict) -> None:
+        self.journal.write(state)
+        self.wakeups.notify()
+
     def read_state(self) -> dict:
         if not self.state_file.exists():
             raise CoordinationError("Unified gate has not been initialized yet.")
-        return json.loads(self.state_file.read_text(encoding="utf-8"))
+        return self.journal.read()
 
-    def inspect_actor(self, actor: str) -> dict:
+    def inspect_actor(self, actor: str, worker: str | None = None) -> dict:
         self._validate_actor(actor)
         state = self.ensure_task()
-        return self.engine.inspect_actor(state, actor)
+        verdict = self.engine.inspect_actor(state, actor)
+        if actor != WORKER_ACTOR or self._resolve_fix_worker(state, worker) is None:
+            return verdict
+        shard = state.get("fix_shards", {}).get(worker)
+        if verdict["result"] == "actionable" and (
+            shard is None or shard["status"] != FIX_SHARD_RELEASED
+        ):
+            return {"result": "wait", "state": state}
+        return verdict
+
+    def _resolve_fix_worker(self, state: dict, worker: str | None) -> str | None:
+        """Return the named fix worker in multi-worker gates, or `None` for a single worker."""
+        worker_ids = fix_worker_ids(int(state.get("fix_worker_count", 1)))
+        if len(worker_ids) == 1:
+            if worker is not None:
+                raise CoordinationError("This gate runs a single fix worker; omit `--worker`.")
+            return None
+        if worker not in worker_ids:
+            raise CoordinationError(
+                "This gate runs several fix workers; pass `--worker` as one of: "
+                + ", ".join(worker_ids)
+                + "."
+            )
+        return worker
 
     def wait_for_turn(
-        self, actor: str, poll_interval: float = 2.0, timeout: float | None = None
+        self,
+        actor: str,
+        poll_interval: float = 2.0,
+        timeout: float | None = None,
+        worker: str | None = None,
     ) -> dict:
         self._validate_actor(actor)
         if poll_interval <= 0:
             raise CoordinationError("Poll interval must be > 0.")
 
         started = time.monotonic()
-        while True:
-            verdict = self.inspect_actor(actor)
-            if verdict["result"] != "wait":
-                return verdict
-            if timeout is not None and (time.monotonic() - started) >= timeout:
-                verdict["result"] = "timeout"
-                return verdict
-            time.sleep(poll_interval)
+        with self.wakeups.listen() as channel:
+            # Sign before inspecting, so a write landing in between still re-checks.
+            seen = self.journal.signature()
+            verdict = self.inspect_actor(actor, worker)
+            while verdict["result"] == "wait":
+                remaining = None if timeout is None else timeout - (time.monotonic() - started)
+                if remaining is not None and remaining <= 0:
+                    verdict["result"] = "timeout"
+                    return verdict
+                self.wakeups.wait(
+                    channel, poll_interval if remaining is None else min(poll_interval, remaining)
+                )
+                # `poll_interval` is only a fallback; state is re-read only when the
+                # snapshot or journal actually changed.
+                signature = self.journal.signature()
+                if signature != seen:
+                    seen = signature
+                    verdict = self.inspect_actor(actor, worker)
+            return verdict
 
     def publish_submission(
         self,
@@ -1164,6 +2254,7 @@ class CoordinationStore:
         repair_responses: dict[str, str] | None = None,
         repair_rounds: int = 1,
         artifact_dir: str | None = None,
+        worker: str | None = None,
     ) -> dict:
         changed_files = list(changed_files or [])
         validation_summary = list(validation_summary or [])
@@ -1175,8 +2266,41 @@ class CoordinationStore:
         with self._short_lock():
             state = self.read_state()
             self._require_turn(state, "fix")
+            worker = self._resolve_fix_worker(state, worker)
+            shard = None
+            if worker is None:
+                required_responses = set(state["open_defects"])
+            else:
+                shard = state.get("fix_shards", {}).get(worker)
+                if shard is None or shard["status"] != FIX_SHARD_RELEASED:
+                    raise CoordinationError(
+                        f"Fix worker `{worker}` has no released shard to submit."
+                    )
+                required_responses = set(shard["defect_ids"])
+                foreign_responses = sorted(set(repair_responses) - required_responses)
+                if foreign_responses:
+                    raise CoordinationError(
+                        f"Fix worker `{worker}` may only respond to its own shard: "
+                        + ", ".join(foreign_responses)
+                        + "."
+                    )
+                foreign_files = sorted(
+                    path
+                    for path in changed_files
+                    if any(
+                        path in other["targets"]
+                        for other_worker, other in state["fix_shards"].items()
+                        if other_worker != worker
+                    )
+                )
+                if foreign_files:
+                    raise CoordinationError(
+                        f"Fix worker `{worker}` changed files released to other shards: "
+                        + ", ".join(foreign_files)
+                        + "."
+                    )
 
-            missing_responses = sorted(set(state["open_defects"]) - set(repair_responses))
+            missing_responses = sorted(required_responses - set(repair_responses))
             if missing_responses:
                 joined = ", ".join(missing_responses)
                 raise CoordinationError(
@@ -1195,7 +2319,7 @@ class CoordinationStore:
 
             submission_id = int(state["submission_id"]) + 1
             manifest = {
-                "gate": GATE_NAME,
+                "gate": self.gate,
                 "submission_id": submission_id,
                 "turn_id": state["turn_id"],
                 "actor": "fix",
@@ -1208,6 +2332,10 @@ class CoordinationStore:
                 "repair_rounds": repair_rounds,
                 "artifact_dir": artifact_manifest_path,
             }
+            if worker is not None:
+                next_state = self._publish_partial_submission(state, worker, manifest)
+                self._write_state(next_state)
+                return next_state
             write_json_atomic(
                 self.submissions_dir / f"submission-{submission_id:04d}.json", manifest
             )
@@ -1218,9 +2346,83 @@ class CoordinationStore:
                 active_owner=COORDINATOR_ACTOR,
                 worker_state=WORKER_STATE_DORMANT,
             )
-            write_json_atomic(self.state_file, next_state)
+            self._write_state(next_state)
             return next_state
 
+    def _publish_partial_submission(self, state: dict, worker: str, manifest: dict) -> dict:
+        """Record one worker's shard submission; the last shard in merges them all."""
+        submission_id = int(manifest["submission_id"])
+        shards = copy.deepcopy(state["fix_shards"])
+        partial_path = (
+            self.submissions_dir / f"submission-{submission_id:04d}" / f"{worker}.json"
+        )
+        write_json_atomic(
+            partial_path,
+            {**manifest, "worker": worker, "defect_ids": list(shards[worker]["defect_ids"])},
+        )
+        shards[worker].update(
+            status=FIX_SHARD_SUBMITTED, submission=str(partial_path.relative_to(self.root))
+        )
+        if any(shard["status"] != FIX_SHARD_SUBMITTED for shard in shards.values()):
+            return self.engine.transition(
+                state,
+                {
+                    "fix_shards": shards,
+                    "last_event": f"partial_submission_published:{worker}",
+                },
+                active_owner=WORKER_ACTOR,
+                worker_state=WORKER_STATE_OWNER,
+            )
+
+        # Reopened shards also carry the partials they submitted before a reassignment.
+        partial_paths = {
+            Path(path).stem: path
+            for shard in shards.values()
+            for path in [*shard.get("earlier_submissions", []), shard["submission"]]
+        }
+        partials = {
+            name: json.loads((self.root / path).read_text(encoding="utf-8"))
+            for name, path in partial_paths.items()
+        }
+        merged = {
+            **manifest,
+            "actor": "fix",
+            "base_rev": partials[next(iter(partials))]["base_rev"],
+            # The last worker to submit builds on every earlier shard.
+            "head_rev": manifest["head_rev"],
+            "changed_files": dedupe_strings(
+                [path for partial in partials.values() for path in partial["changed_files"]]
+            ),
+            "validation_summary": [
+                note for partial in partials.values() for note in partial["validation_summary"]
+            ],
+            "repair_responses": {
+                defect_id: response
+                for partial in partials.values()
+                for defect_id, response in partial["repair_responses"].items()
+            },
+            "repair_rounds": max(partial["repair_rounds"] for partial in partials.values()),
+            "artifact_dir": None,
+            "partial_submissions": {
+                name: {
+                    "path": partial_paths[name],
+                    "base_rev": partial["base_rev"],
+                    "head_rev": partial["head_rev"],
+                    "artifact_dir": partial["artifact_dir"],
+                }
+                for name, partial in partials.items()
+            },
+        }
+        write_json_atomic(
+            self.submissions_dir / f"submission-{submission_id:04d}.json", merged
+        )
+        return self.engine.transition(
+            state,
+            self.adapter.post_submission_fields(submission_id),
+            active_owner=COORDINATOR_ACTOR,
+            worker_state=WORKER_STATE_DORMANT,
+        )
+
     def publish_triage(
         self,
         submission_id: int,
@@ -1272,18 +2474,17 @@ class CoordinationStore:
                     f"Triage must publish `{expected_class}` next, not `{defect_class}`."
                 )
 
-            required_units = self._required_progress_units(defect_class)
+            unit_table = self._progress_unit_table(submission_id, defect_class)
+            required_unit_ids = unit_table.unit_ids
             progress_records = self._load_progress_records(submission_id, defect_class)
-            required_unit_ids = {str(unit["unit_id"]) for unit in required_units}
-            progress_unit_ids = set(progress_records)
-            missing_progress_units = sorted(required_unit_ids - progress_unit_ids)
+            missing_progress_units = sorted(required_unit_ids - set(progress_records))
             if missing_progress_units:
                 raise CoordinationError(
                     "Triage phase finalization is missing progress units: "
                     + ", ".join(missing_progress_units)
                     + "."
                 )
-            unexpected_progress_units = sorted(progress_unit_ids - required_unit_ids)
+            unexpected_progress_units = sorted(set(progress_records) - required_unit_ids)
             if unexpected_progress_units:
                 raise CoordinationError(
                     "Triage phase finalization includes unknown progress units: "
@@ -1307,7 +2508,7 @@ class CoordinationStore:
                 defect_class,
                 submission_id,
                 review_artifact,
-                required_units,
+                unit_table.units,
                 progress_records,
             )
 
@@ -1349,8 +2550,10 @@ class CoordinationStore:
                         + ", ".join(unexpected_progress_defect_ids)
                         + "."
                     )
+                targets = defect_targets(progress_records)
                 for defect in repair_plan:
                     defect["evidence"] = defect_evidence[defect["id"]].strip()
+                    defect["targets"] = targets.get(defect["id"], [])
             else:
                 non_aligned_progress = sorted(
                     unit_id
@@ -1366,7 +2569,7 @@ class CoordinationStore:
 
             report_id = int(state["triage_report_id"]) + 1
             report = {
-                "gate": GATE_NAME,
+                "gate": self.gate,
                 "quality_target_id": state["quality_target_id"],
                 "quality_target_source": state.get("quality_target_source"),
                 "report_id": report_id,
@@ -1415,7 +2618,7 @@ class CoordinationStore:
                 active_owner=active_owner,
                 worker_state=worker_state,
             )
-            write_json_atomic(self.state_file, next_state)
+            self._write_state(next_state)
             return next_state
 
     def run_triage_pass(
@@ -1434,33 +2637,136 @@ class CoordinationStore:
             return self._triage_runner_packet(state, result=verdict["result"])
 
         state = verdict["state"]
-        try:
-            if int(state.get("next_triage_class_index", 0)) < len(DEFECT_CLASSES):
-                probe = self._run_probe_suite(
-                    self._expected_triage_class(state), int(state["submission_id"])
-                )
-            else:
-                probe = self._build_coverage_probe(self._expected_coverage_kind(state))
-        except CoordinationError as exc:
-            blocked_state = self.mark_blocked(str(exc))
-            return self._triage_runner_packet(blocked_state, result="blocked")
-        return self._triage_runner_packet(state, result="actionable", probe=probe)
+        with self._discovery_snapshot_scope():
+            try:
+                if int(state.get("next_triage_class_index", 0)) < len(DEFECT_CLASSES):
+                    probe = self._run_probe_suite(
+                        self._expected_triage_class(state), int(state["submission_id"])
+                    )
+                else:
+                    probe = self._build_coverage_probe(self._expected_coverage_kind(state))
+            except CoordinationError as exc:
+                blocked_state = self.mark_blocked(str(exc))
+                return self._triage_runner_packet(blocked_state, result="blocked")
+            return self._triage_runner_packet(state, result="actionable", probe=probe)
 
     def run_fix_pass(
-        self, poll_interval: float = 2.0, timeout: float | None = None
+        self,
+        poll_interval: float = 2.0,
+        timeout: float | None = None,
+        worker: str | None = None,
     ) -> dict:
         self.ensure_task()
-        initial = self.inspect_actor("fix")
+        initial = self.inspect_actor("fix", worker)
         if initial["result"] == "wait" and timeout == 0:
-            return self._fix_runner_packet(initial["state"], result="wait")
+            return self._fix_runner_packet(initial["state"], result="wait", worker=worker)
 
-        verdict = self.wait_for_turn("fix", poll_interval=poll_interval, timeout=timeout)
+        verdict = self.wait_for_turn(
+            "fix", poll_interval=poll_interval, timeout=timeout, worker=worker
+        )
         if verdict["result"] != "actionable":
             state = verdict.get("state", self.read_state())
-            return self._fix_runner_packet(state, result=verdict["result"])
+            return self._fix_runner_packet(state, result=verdict["result"], worker=worker)
 
         state = verdict["state"]
-        return self._fix_runner_packet(state, result="actionable")
+        if worker is not None:
+            state = self._renew_fix_shard_lease(worker)
+        return self._fix_runner_packet(state, result="actionable", worker=worker)
+
+    def _renew_fix_shard_lease(self, worker: str) -> dict:
+        """Extend a worker's released shard lease once less than half of it is left."""
+
+        def renewal_due(state: dict) -> bool:
+            shard = state.get("fix_shards", {}).get(worker)
+            if shard is None or shard["status"] != FIX_SHARD_RELEASED:
+                return False
+            remaining = float(shard.get("lease_expires_at") or 0) - time.time()
+            return remaining < FIX_SHARD_LEASE_SECONDS / 2
+
+        state = self.read_state()
+        if not renewal_due(state):
+            return state
+        with self._short_lock():
+            state = self.read_state()
+            if not renewal_due(state):
+                return state
+            shards = copy.deepcopy(state["fix_shards"])
+            shards[worker]["lease_expires_at"] = time.time() + FIX_SHARD_LEASE_SECONDS
+            next_state = self.engine.transition(
+                state,
+                {"fix_shards": shards},
+                active_owner=WORKER_ACTOR,
+                worker_state=WORKER_STATE_OWNER,
+            )
+            self._write_state(next_state)
+            return next_state
+
+    def reassign_fix_shard(self, from_worker: str, to_worker: str, force: bool = False) -> dict:
+        """Move a released shard whose lease expired onto another fix worker.
+
+        A released shard of the receiving worker is merged with it. A shard it
+        already submitted is reopened for the moved defects, and its earlier
+        partial is kept for the final merge. `force` skips the expiry check
+        for a worker known to be gone.
+        """
+        with self._short_lock():
+            state = self.read_state()
+            self._require_turn(state, "fix")
+            worker_ids = fix_worker_ids(int(state.get("fix_worker_count", 1)))
+            for worker in (from_worker, to_worker):
+                if len(worker_ids) == 1 or worker not in worker_ids:
+                    raise CoordinationError(
+                        f"Unknown fix worker `{worker}`; expected one of: "
+                        + ", ".join(worker_ids)
+                        + "."
+                    )
+            if from_worker == to_worker:
+                raise CoordinationError("A fix shard must be reassigned to a different worker.")
+            shards = copy.deepcopy(state["fix_shards"])
+            source = shards.get(from_worker)
+            if source is None or source["status"] != FIX_SHARD_RELEASED:
+                raise CoordinationError(f"Fix worker `{from_worker}` has no released shard to reassign.")
+            now = time.time()
+            if not force and float(source.get("lease_expires_at") or 0) > now:
+                raise CoordinationError(
+                    f"The shard of fix worker `{from_worker}` is still leased; "
+                    "wait for it to expire or pass `--force`."
+                )
+            target = shards.get(to_worker)
+            if target is None:
+                target = {"defect_ids": [], "targets": [], "status": FIX_SHARD_RELEASED, "submission": None}
+            elif target["status"] == FIX_SHARD_SUBMITTED:
+                earlier = list(target.get("earlier_submissions", []))
+                submitted_path = self.root / target["submission"]
+                kept_path = submitted_path.with_name(
+                    f"{to_worker}.earlier-{len(earlier) + 1}.json"
+                )
+                os.replace(submitted_path, kept_path)
+                target = {
+                    **target,
+                    "defect_ids": [],
+                    "status": FIX_SHARD_RELEASED,
+                    "submission": None,
+                    "earlier_submissions": earlier + [str(kept_path.relative_to(self.root))],
+                }
+            del shards[from_worker]
+            shards[to_worker] = {
+                **target,
+                "defect_ids": sorted(set(target["defect_ids"]) | set(source["defect_ids"])),
+                "targets": sorted(set(target["targets"]) | set(source["targets"])),
+                "lease_expires_at": now + FIX_SHARD_LEASE_SECONDS,
+            }
+            next_state = self.engine.transition(
+                state,
+                {
+                    "fix_shards": shards,
+                    "last_event": f"fix_shard_reassigned:{from_worker}->{to_worker}",
+                },
+                active_owner=WORKER_ACTOR,
+                worker_state=WORKER_STATE_OWNER,
+            )
+            self._write_state(next_state)
+            return next_state
 
     def mark_blocked(self, reason: str) -> dict:
         reason = reason.strip()
@@ -1479,15 +2785,31 @@ class CoordinationStore:
                 active_owner=None,
                 worker_state=WORKER_STATE_DORMANT,
             )
-            write_json_atomic(self.state_file, next_state)
+            self._write_state(next_state)
             return next_state
 
     def _load_repo_gate_profile(self) -> dict:
+        """Return the validated repo gate profile, re-reading it only when the file changes.
+
+        The cache is keyed by the profile's `(mtime_ns, size)`; callers get a copy
+        so they can never mutate the memoized profile.
+        """
         profile_path = self.root / REPO_GATE_PROFILE_RELATIVE_PATH
-        if not profile_path.is_file():
+        try:
+            profile_stat = profile_path.stat()
+        except OSError:
+            profile_stat = None
+        if profile_stat is None or not stat.S_ISREG(profile_stat.st_mode):
+            self._gate_profile_cache = None
             raise CoordinationError(
                 f"Missing required repo gate profile `{REPO_GATE_PROFILE_RELATIVE_PATH}`."
             )
+        stamp = (profile_stat.st_mtime_ns, profile_stat.st_size)
+        if self._gate_profile_cache is None or self._gate_profile_cache[0] != stamp:
+            self._gate_profile_cache = (stamp, self._read_repo_gate_profile(profile_path))
+        return copy.deepcopy(self._gate_profile_cache[1])
+
+    def _read_repo_gate_profile(self, profile_path: Path) -> dict:
         try:
             payload = json.loads(profile_path.read_text(encoding="utf-8"))
         except json.JSONDecodeError as exc:
@@ -1530,6 +2852,30 @@ class CoordinationStore:
             label="gate profile triage.source_roots",
             required=True,
         )
+        namespaces = payload.get("namespaces", {})
+        if not isinstance(namespaces, dict):
+            raise CoordinationError(
+                f"`{REPO_GATE_PROFILE_RELATIVE_PATH}` `namespaces` must be an object keyed by gate namespace."
+            )
+        for namespace in namespaces:
+            validate_gate_name(namespace)
+        if self.gate in namespaces or self.gate != GATE_NAME:
+            # A namespace narrows the triage scope to its own spec and source roots.
+            scope = namespaces.get(self.gate)
+            if not isinstance(scope, dict):
+                raise CoordinationError(
+                    f"`{REPO_GATE_PROFILE_RELATIVE_PATH}` must declare `namespaces.{self.gate}`."
+                )
+            spec_roots = normalize_string_list(
+                scope.get("spec_roots", spec_roots),
+                label=f"gate profile namespaces.{self.gate}.spec_roots",
+                required=True,
+            )
+            source_roots = normalize_string_list(
+                scope.get("source_roots", source_roots),
+                label=f"gate profile namespaces.{self.gate}.source_roots",
+                required=True,
+            )
 
         black_box = coverage.get("black_box")
         if not isinstance(black_box, dict):
@@ -1600,6 +2946,8 @@ class CoordinationStore:
         return {
             "path": str(profile_path.relative_to(self.root)),
             "version": PROTOCOL_VERSION,
+            "gate": self.gate,
+            "namespaces": sorted(namespaces),
             "triage": {
                 "spec_roots": spec_roots,
                 "source_roots": source_roots,
@@ -1647,12 +2995,47 @@ class CoordinationStore:
             normalized_commands.append({"argv": argv, "display": shell_join(argv)})
         return normalized_commands
 
+    @contextmanager
+    def _discovery_snapshot_scope(self):
+        """Share one discovery snapshot across a probe and packet build on this thread."""
+        if getattr(self._discovery_scope, "snapshot", None) is not None:
+            yield
+            return
+        snapshot = DiscoverySnapshot.load(
+            self.discovery_snapshot_path, worktree_fingerprint(self.root)
+        )
+        self._discovery_scope.snapshot = snapshot
+        try:
+            yield
+        finally:
+            self._discovery_scope.snapshot = None
+            snapshot.save()
+
+    def _discovered(self, key: str, scopes: list[str] | None, compute):
+        snapshot = getattr(self._discovery_scope, "snapshot", None)
+        if snapshot is None:
+            return compute()
+        return snapshot.get(key, scopes, compute)
+
+    def _spec_context_files(self) -> tuple[list[str], list[str]]:
+        context_files, unresolved_context_refs = self._discovered(
+            "spec_context_files", None, lambda: discover_spec_context_files(self.root)
+        )
+        return context_files, unresolved_context_refs
+
     def _discover_profile_spec_files(self) -> list[str]:
-        profile = self._load_repo_gate_profile()
+        spec_roots = self._load_repo_gate_profile()["triage"]["spec_roots"]
+        return self._discovered(
+            "spec_files:" + json.dumps(spec_roots),
+            spec_roots,
+            lambda: self._scan_profile_spec_files(spec_roots),
+        )
+
+    def _scan_profile_spec_files(self, spec_roots: list[str]) -> list[str]:
         discovered: list[str] = []
-        for relative_root in profile["triage"]["spec_roots"]:
+        for relative_root in spec_roots:
             root_path = self.root / relative_root
-            for path in sorted(root_path.rglob("*.md")):
+            for path in sorted_markdown_files(root_path):
                 if "build" in path.parts:
                     continue
                 try:
@@ -1673,15 +3056,19 @@ class CoordinationStore:
         }
 
     def _resolve_test_globs(self, patterns: list[str]) -> list[str]:
+        return self._discovered(
+            "test_globs:" + json.dumps(patterns),
+            [glob_scope(pattern) for pattern in patterns],
+            lambda: self._scan_test_globs(patterns),
+        )
+
+    def _scan_test_globs(self, patterns: list[str]) -> list[str]:
         discovered: list[str] = []
-        for pattern in patterns:
-            matches = sorted(self.root.glob(pattern))
-            for path in matches:
-                if path.is_file():
-                    try:
-                        discovered.append(str(path.relative_to(self.root)))
-                    except ValueError:
-                        discovered.append(str(path))
+        for path in discovery.glob_tree_files(self.root, patterns):
+            try:
+                discovered.append(str(path.relative_to(self.root)))
+            except ValueError:
+                discovered.append(str(path))
         return dedupe_strings(discovered)
 
     def _black_box_contract_sections(self) -> list[str]:
@@ -1735,17 +3122,39 @@ class CoordinationStore:
         profile = self._load_repo_gate_profile()
         return self._resolve_test_globs(profile["coverage"]["white_box"]["test_globs"])
 
-    def _suggested_white_box_tests(self, target: str, white_box_tests: list[str]) -> list[str]:
-        target_stem = Path(target).stem
-        matches: list[str] = []
-        for test_file in white_box_tests:
-            text = (self.root / test_file).read_text(encoding="utf-8")
-            if target in text or target_stem in text:
-                matches.append(test_file)
-        return matches or list(white_box_tests)
+    def _white_box_test_index(self, white_box_tests: list[str]) -> dict[str, list[int]]:
+        """Map reference tokens to positions in `white_box_tests`, re-reading only changed files."""
+        previous = self._white_box_token_cache
+        current: dict[str, tuple[tuple | None, set[str]]] = {}
+        index: dict[str, list[int]] = {}
+        for position, test_file in enumerate(white_box_tests):
+            test_path = self.root / test_file
+            signature = file_signature(test_path)
+            cached = previous.get(test_file)
+            if cached is not None and cached[0] == signature:
+                tokens = cached[1]
+            else:
+                tokens = white_box_reference_tokens(test_path.read_text(encoding="utf-8"))
+            current[test_file] = (signature, tokens)
+            for token in tokens:
+                index.setdefault(token, []).append(position)
+        self._white_box_token_cache = current
+        return index
+
+    def _suggested_white_box_tests(
+        self,
+        target: str,
+        white_box_tests: list[str],
+        test_index: dict[str, list[int]],
+    ) -> list[str]:
+        positions = set(test_index.get(target, ())) | set(test_index.get(Path(target).stem, ()))
+        if not positions:
+            return list(white_box_tests)
+        return [white_box_tests[position] for position in sorted(positions)]
 
     def _white_box_coverage_units(self) -> list[dict[str, object]]:
         white_box_tests = self._white_box_test_files()
+        test_index = self._white_box_test_index(white_box_tests)
         units: list[dict[str, object]] = []
         for target in self._white_box_module_targets():
             units.append(
@@ -1754,7 +3163,7 @@ class CoordinationStore:
                     "target": target,
                     "defect_type": None,
                     "suggested_test_files": self._suggested_white_box_tests(
-                        target, white_box_tests
+                        target, white_box_tests, test_index
                     ),
                     "suggested_source_files": [target],
                 }
@@ -1763,7 +3172,7 @@ class CoordinationStore:
 
     def _spec_progress_units(self) -> list[dict[str, object]]:
         units: list[dict[str, object]] = []
-        context_files, _ = discover_spec_context_files(self.root)
+        context_files, _ = self._spec_context_files()
         for spec_file in self._discover_profile_spec_files():
             if spec_file == "specs/L0-VISION.md":
                 anchor_files: list[str] = []
@@ -1845,49 +3254,132 @@ class CoordinationStore:
             return self._white_box_coverage_units()
         raise CoordinationError(f"Unsupported coverage kind `{coverage_kind}`.")
 
-    def _progress_record_path(
-        self, submission_id: int, defect_class: str, unit_id: str
-    ) -> Path:
-        digest = hashlib.sha1(unit_id.encode("utf-8")).hexdigest()[:10]
-        slug = sanitize_progress_slug(unit_id)
-        return (
-            self.progress_dir
+    def _unit_table(self, table_path: Path, build_units) -> ProgressUnitTable:
+        cached = self._progress_unit_tables.get(table_path)
+        signature = file_signature(table_path)
+        if cached is not None and signature is not None and cached[0] == signature:
+            return cached[1]
+        table = ProgressUnitTable.load_or_materialize(table_path, build_units)
+        self._progress_unit_tables[table_path] = (file_signature(table_path), table)
+        return table
+
+    def _progress_unit_table(self, submission_id: int, defect_class: str) -> ProgressUnitTable:
+        if defect_class not in DEFECT_CLASSES:
+            raise CoordinationError(f"Unsupported defect class `{defect_class}`.")
+        return self._unit_table(
+            self.progress_dir / f"submission-{submission_id:04d}" / f"{defect_class}.units.json",
+            lambda: self._required_progress_units(defect_class),
+        )
+
+    def _coverage_unit_table(self, submission_id: int, coverage_kind: str) -> ProgressUnitTable:
+        if coverage_kind not in COVERAGE_KINDS:
+            raise CoordinationError(f"Unsupported coverage kind `{coverage_kind}`.")
+        return self._unit_table(
+            self.task_dir
+            / "coverage-progress"
             / f"submission-{submission_id:04d}"
-            / defect_class
-            / f"{slug}-{digest}.json"
+            / f"{coverage_kind}.units.json",
+            lambda: self._required_coverage_units(coverage_kind),
         )
 
     def _load_progress_records(
         self, submission_id: int, defect_class: str
     ) -> dict[str, dict]:
-        records: dict[str, dict] = {}
-        phase_dir = self.progress_dir / f"submission-{submission_id:04d}" / defect_class
-        if not phase_dir.is_dir():
-            return records
+        return self.storage.load_records("progress", submission_id, defect_class)
 
-        for path in sorted(phase_dir.glob("*.json")):
-            try:
-                payload = json.loads(path.read_text(encoding="utf-8"))
-            except json.JSONDecodeError as exc:
-                raise CoordinationError(
-                    f"Progress artifact `{path}` must be valid JSON."
-                ) from exc
-            if not isinstance(payload, dict):
-                raise CoordinationError(
-                    f"Progress artifact `{path}` must be a JSON object."
-                )
-            unit_id = str(payload.get("unit_id", "")).strip()
-            if not unit_id:
-                raise CoordinationError(
-                    f"Progress artifact `{path}` is missing `unit_id`."
-                )
-            if unit_id in records:
+    def _unit_leases_path(self, family: str, submission_id: int, phase: str) -> Path:
+        return self.task_dir / "unit-leases" / family / f"submission-{submission_id:04d}" / f"{phase}.json"
+
+    def _check_unit_leases(
+        self,
+        family: str,
+        submission_id: int,
+        phase: str,
+        records: list[dict],
+        reviewer: str | None,
+    ) -> UnitLeases:
+        """Refuse records for units leased to another reviewer; caller holds the lock."""
+        reviewer = normalize_reviewer(reviewer)
+        leases = UnitLeases.load(self._unit_leases_path(family, submission_id, phase), time.time())
+        for record in records:
+            holder = leases.holder(record["unit_id"])
+            if holder is not None and holder != reviewer:
                 raise CoordinationError(
-                    f"Duplicate progress unit `{unit_id}` detected for submission {submission_id} / {defect_class}."
+                    f"Progress unit `{record['unit_id']}` is leased to reviewer `{holder}`."
                 )
-            payload["_path"] = str(path.relative_to(self.root))
-            records[unit_id] = payload
-        return records
+        return leases
+
+    def _release_unit_leases(self, leases: UnitLeases, records: list[dict]) -> None:
+        released = [record["unit_id"] for record in records if record["unit_id"] in leases.leases]
+        for unit_id in released:
+            del leases.leases[unit_id]
+        if released:
+            leases.save()
+
+    def _review_phase_key(self, state: dict) -> tuple[int, str, str]:
+        """`(submission_id, family, phase)` of the phase reviewers are working on."""
+        submission_id = int(state["submission_id"])
+        if int(state.get("next_triage_class_index", 0)) < len(DEFECT_CLASSES):
+            return submission_id, "progress", self._expected_triage_class(state)
+        return submission_id, "coverage-progress", self._expected_coverage_kind(state)
+
+    def _review_phase(self, state: dict) -> tuple[str, str, ProgressUnitTable]:
+        submission_id, family, phase = self._review_phase_key(state)
+        if family == "progress":
+            return family, phase, self._progress_unit_table(submission_id, phase)
+        return family, phase, self._coverage_unit_table(submission_id, phase)
+
+    def claim_review_units(
+        self,
+        reviewer: str,
+        count: int = 1,
+        lease_seconds: float = REVIEW_LEASE_SECONDS,
+    ) -> dict:
+        """Lease up to `count` unreviewed units of the active phase to one reviewer.
+
+        Units the reviewer already holds are renewed first, so a restarted
+        reviewer resumes its own work; expired leases are free to claim.
+        """
+        reviewer = normalize_reviewer(reviewer)
+        if reviewer is None:
+            raise CoordinationError("Reviewer name must not be empty.")
+        if count < 1:
+            raise CoordinationError("Claim count must be >= 1.")
+        if lease_seconds <= 0:
+            raise CoordinationError("Lease seconds must be > 0.")
+
+        # Building the unit table can scan every module; keep it out of the turn lock.
+        state = self.read_state()
+        self._require_turn(state, "triage")
+        family, phase, unit_table = self._review_phase(state)
+        submission_id = int(state["submission_id"])
+        with self._short_lock():
+            state = self.read_state()
+            self._require_turn(state, "triage")
+            if self._review_phase_key(state) != (submission_id, family, phase):
+                raise CoordinationError("The review phase moved on while claiming; claim again.")
+            reviewed = set(self.storage.load_records(family, submission_id, phase))
+            now = time.time()
+            leases = UnitLeases.load(self._unit_leases_path(family, submission_id, phase), now)
+            pending = [unit for unit in unit_table.units if unit["unit_id"] not in reviewed]
+            own = [unit for unit in pending if leases.holder(unit["unit_id"]) == reviewer]
+            free = [unit for unit in pending if leases.holder(unit["unit_id"]) is None]
+            claimed = (own + free)[:count]
+            for unit in claimed:
+                leases.leases[unit["unit_id"]] = {"reviewer": reviewer, "expires_at": now + lease_seconds}
+            if claimed:
+                leases.save()
+        return {
+            "reviewer": reviewer,
+            "submission_id": submission_id,
+            "phase": phase,
+            "lease_expires_at": now + lease_seconds,
+            "units": claimed,
+            "unclaimed_unit_count": sum(
+                1 for unit in pending if leases.holder(unit["unit_id"]) is None
+            ),
+            "pending_unit_count": len(pending),
+        }
 
     def publish_triage_progress(
         self,
@@ -1902,11 +3394,80 @@ class CoordinationStore:
         reviewed_context_files: list[str] | None = None,
         notes: list[str] | None = None,
         defect_ids: list[str] | None = None,
+        reviewer: str | None = None,
+    ) -> dict:
+        if defect_class not in DEFECT_CLASSES:
+            raise CoordinationError(
+                "Defect class must be one of: " + ", ".join(DEFECT_CLASSES) + "."
+            )
+        entry = self._prepare_triage_progress(
+            self._progress_unit_table(submission_id, defect_class),
+            defect_class,
+            target=target,
+            defect_type=defect_type,
+            decision=decision,
+            evidence_summary=evidence_summary,
+            evidence_files=evidence_files,
+            reviewed_anchor_files=reviewed_anchor_files,
+            reviewed_context_files=reviewed_context_files,
+            notes=notes,
+            defect_ids=defect_ids,
+        )
+        with self._short_lock():
+            next_state, written = self._commit_triage_progress(
+                submission_id, defect_class, [entry], reviewer
+            )
+        record_path, record = written[0]
+        return {
+            "state": next_state,
+            "progress_record_path": record_path,
+            "progress_record": record,
+        }
+
+    def publish_triage_progress_batch(
+        self,
+        submission_id: int,
+        defect_class: str,
+        entries: list[dict],
+        reviewer: str | None = None,
     ) -> dict:
+        """Validate every entry against one unit table, then publish them in one transition."""
         if defect_class not in DEFECT_CLASSES:
             raise CoordinationError(
                 "Defect class must be one of: " + ", ".join(DEFECT_CLASSES) + "."
             )
+        unit_table = self._progress_unit_table(submission_id, defect_class)
+        prepared: list[dict] = []
+        for index, fields in enumerate(
+            batch_entry_fields(entries, TRIAGE_PROGRESS_BATCH_FIELDS), start=1
+        ):
+            try:
+                prepared.append(self._prepare_triage_progress(unit_table, defect_class, **fields))
+            except CoordinationError as exc:
+                raise CoordinationError(f"Progress batch record {index}: {exc}") from exc
+        with self._short_lock():
+            next_state, written = self._commit_triage_progress(
+                submission_id, defect_class, prepared, reviewer
+            )
+        return {
+            "state": next_state,
+            "progress_record_paths": [record_path for record_path, _ in written],
+        }
+
+    def _prepare_triage_progress(
+        self,
+        unit_table: ProgressUnitTable,
+        defect_class: str,
+        target: str,
+        defect_type: str | None,
+        decision: str,
+        evidence_summary: str | None = None,
+        evidence_files: list[str] | None = None,
+        reviewed_anchor_files: list[str] | None = None,
+        reviewed_context_files: list[str] | None = None,
+        notes: list[str] | None = None,
+        defect_ids: list[str] | None = None,
+    ) -> dict:
         if decision not in PROGRESS_DECISIONS:
             raise CoordinationError(
                 "Progress decision must be one of: "
@@ -1934,22 +3495,13 @@ class CoordinationStore:
                 f"`{defect_class}` progress must include `--defect-type`."
             )
 
-        required_units = {
-            unit["unit_id"]: unit for unit in self._required_progress_units(defect_class)
-        }
-        matching_units = [
-            unit
-            for unit in required_units.values()
-            if unit["target"] == target and unit["defect_type"] == defect_type
-        ]
+        matching_units = unit_table.matching(target, defect_type)
         if not matching_units:
             raise CoordinationError(
                 f"`{target}` with defect type `{defect_type}` is not a required progress unit for `{defect_class}`."
             )
         if len(matching_units) != 1:
             raise CoordinationError("Progress unit resolution must be unique.")
-        unit = matching_units[0]
-        unit_id = str(unit["unit_id"])
 
         if decision == "defect" and not defect_ids:
             raise CoordinationError(
@@ -1960,124 +3512,97 @@ class CoordinationStore:
                 "Only defect progress records may include `--defect-id`."
             )
 
-        with self._short_lock():
-            state = self.read_state()
-            self._require_turn(state, "triage")
-            current_submission = int(state["submission_id"])
-            if submission_id != current_submission:
-                raise CoordinationError(
-                    f"Triage progress must target latest submission_id={current_submission}."
-                )
-            expected_class = self._expected_triage_class(state)
-            if defect_class != expected_class:
-                raise CoordinationError(
-                    f"Triage progress must publish `{expected_class}` next, not `{defect_class}`."
-                )
-
-            record_path = self._progress_record_path(submission_id, defect_class, unit_id)
-            if record_path.exists():
-                raise CoordinationError(
-                    f"Progress for `{unit_id}` already exists. Reset the gate state before replacing it."
-                )
-
-            record = {
-                "gate": GATE_NAME,
-                "submission_id": submission_id,
-                "turn_id": state["turn_id"],
-                "actor": "triage",
-                "created_at": utc_now(),
-                "defect_class": defect_class,
-                "unit_id": unit_id,
-                "target": target,
-                "defect_type": defect_type,
-                "decision": decision,
-                "evidence_summary": evidence_summary,
-                "evidence_files": evidence_files,
-                "reviewed_anchor_files": reviewed_anchor_files,
-                "reviewed_context_files": reviewed_context_files,
-                "notes": notes,
-                "defect_ids": defect_ids,
-            }
-            write_json_atomic(record_path, record)
+        return {
+            "unit_id": str(matching_units[0]["unit_id"]),
+            "target": target,
+            "defect_type": defect_type,
+            "decision": decision,
+            "evidence_summary": evidence_summary,
+            "evidence_files": evidence_files,
+            "reviewed_anchor_files": reviewed_anchor_files,
+            "reviewed_context_files": reviewed_context_files,
+            "notes": notes,
+            "defect_ids": defect_ids,
+        }
 
-            next_state = self.engine.transition(
-                state,
-                {
-                    "status": state["status"],
-                    "phase": state["phase"],
-                    "fix_gate_open": state.get("fix_gate_open", False),
-                    "triage_status": state.get("triage_status"),
-                    "next_triage_class_index": state.get("next_triage_class_index", 0),
-                    "published_triage_classes": list(
-                        state.get("published_triage_classes", [])
-                    ),
-                    "open_defects": list(state.get("open_defects", [])),
-                    "active_repair_plan": list(state.get("active_repair_plan", [])),
-                    "blocked_reason": state.get("blocked_reason"),
-                    "triage_report_id": state.get("triage_report_id", 0),
-                    "submission_id": state.get("submission_id", 0),
-                    "triage_of_submission_id": state.get("triage_of_submission_id", 0),
-                    "progress_record_count": int(state.get("progress_record_count", 0))
-                    + 1,
-                    "last_progress_unit_id": unit_id,
-                    "last_event": f"triage_progress_published:{defect_class}",
-                },
-                active_owner=state.get("active_owner"),
-                worker_state=state.get("worker_state", WORKER_STATE_DORMANT),
+    def _commit_triage_progress(
+        self,
+        submission_id: int,
+        defect_class: str,
+        entries: list[dict],
+        reviewer: str | None = None,
+    ) -> tuple[dict, list[tuple[str, dict]]]:
+        """Write prepared progress records and bump state once; caller holds the lock."""
+        reviewer = normalize_reviewer(reviewer)
+        state = self.read_state()
+        self._require_turn(state, "triage")
+        current_submission = int(state["submission_id"])
+        if submission_id != current_submission:
+            raise CoordinationError(
+                f"Triage progress must target latest submission_id={current_submission}."
+            )
+        expected_class = self._expected_triage_class(state)
+        if defect_class != expected_class:
+            raise CoordinationError(
+                f"Triage progress must publish `{expected_class}` next, not `{defect_class}`."
             )
-            write_json_atomic(self.state_file, next_state)
-            return {
-                "state": next_state,
-                "progress_record_path": str(record_path.relative_to(self.root)),
-                "progress_record": record,
-            }
-
-    def _coverage_progress_record_path(
-        self, submission_id: int, coverage_kind: str, unit_id: str
-    ) -> Path:
-        digest = hashlib.sha1(unit_id.encode("utf-8")).hexdigest()[:10]
-        slug = sanitize_progress_slug(unit_id)
-        return (
-            self.task_dir
-            / "coverage-progress"
-            / f"submission-{submission_id:04d}"
-            / coverage_kind
-            / f"{slug}-{digest}.json"
-        )
-
-    def _load_coverage_progress_records(
-        self, submission_id: int, coverage_kind: str
-    ) -> dict[str, dict]:
-        records: dict[str, dict] = {}
-        phase_dir = (
-            self.task_dir / "coverage-progress" / f"submission-{submission_id:04d}" / coverage_kind
-        )
-        if not phase_dir.is_dir():
-            return records
 
-        for path in sorted(phase_dir.glob("*.json")):
-            try:
-                payload = json.loads(path.read_text(encoding="utf-8"))
-            except json.JSONDecodeError as exc:
-                raise CoordinationError(
-                    f"Coverage progress artifact `{path}` must be valid JSON."
-                ) from exc
-            if not isinstance(payload, dict):
-                raise CoordinationError(
-                    f"Coverage progress artifact `{path}` must be a JSON object."
-                )
-            unit_id = str(payload.get("unit_id", "")).strip()
-            if not unit_id:
-                raise CoordinationError(
-                    f"Coverage progress artifact `{path}` is missing `unit_id`."
-                )
-            if unit_id in records:
-                raise CoordinationError(
-                    f"Duplicate coverage progress unit `{unit_id}` detected for submission {submission_id} / {coverage_kind}."
-                )
-            payload["_path"] = str(path.relative_to(self.root))
-            records[unit_id] = payload
-        return records
+        records: list[dict] = []
+        seen_unit_ids: set[str] = set()
+        for entry in entries:
+            unit_id = entry["unit_id"]
+            if unit_id in seen_unit_ids:
+                raise CoordinationError(f"Progress batch publishes `{unit_id}` more than once.")
+            seen_unit_ids.add(unit_id)
+            records.append(
+                {
+                    "gate": self.gate,
+                    "submission_id": submission_id,
+                    "turn_id": state["turn_id"],
+                    "actor": "triage",
+                    "created_at": utc_now(),
+                    "defect_class": defect_class,
+                    **({"reviewer": reviewer} if reviewer is not None else {}),
+                    **entry,
+                }
+            )
+        leases = self._check_unit_leases("progress", submission_id, defect_class, records, reviewer)
+        paths = self.storage.write_records("progress", submission_id, defect_class, records)
+        self._release_unit_leases(leases, records)
+        written = list(zip(paths, records))
+
+        next_state = self.engine.transition(
+            state,
+            {
+                "status": state["status"],
+                "phase": state["phase"],
+                "fix_gate_open": state.get("fix_gate_open", False),
+                "triage_status": state.get("triage_status"),
+                "next_triage_class_index": state.get("next_triage_class_index", 0),
+                "published_triage_classes": list(
+                    state.get("published_triage_classes", [])
+                ),
+                "open_defects": list(state.get("open_defects", [])),
+                "active_repair_plan": list(state.get("active_repair_plan", [])),
+                "blocked_reason": state.get("blocked_reason"),
+                "triage_report_id": state.get("triage_report_id", 0),
+                "submission_id": state.get("submission_id", 0),
+                "triage_of_submission_id": state.get("triage_of_submission_id", 0),
+                "progress_record_count": int(state.get("progress_record_count", 0))
+                + len(written),
+                "last_progress_unit_id": entries[-1]["unit_id"],
+                "last_event": f"triage_progress_published:{defect_class}",
+            },
+            active_owner=state.get("active_owner"),
+            worker_state=state.get("worker_state", WORKER_STATE_DORMANT),
+        )
+        self._write_state(next_state)
+        return next_state, written
+
+    def _load_coverage_progress_records(
+        self, submission_id: int, coverage_kind: str
+    ) -> dict[str, dict]:
+        return self.storage.load_records("coverage-progress", submission_id, coverage_kind)
 
     def publish_test_coverage_progress(
         self,
@@ -2091,11 +3616,80 @@ class CoordinationStore:
         reviewed_source_files: list[str] | None = None,
         notes: list[str] | None = None,
         defect_ids: list[str] | None = None,
+        reviewer: str | None = None,
+    ) -> dict:
+        if coverage_kind not in COVERAGE_KINDS:
+            raise CoordinationError(
+                "Coverage kind must be one of: " + ", ".join(COVERAGE_KINDS) + "."
+            )
+        entry = self._prepare_coverage_progress(
+            self._coverage_unit_table(submission_id, coverage_kind),
+            coverage_kind,
+            target=target,
+            decision=decision,
+            evidence_summary=evidence_summary,
+            evidence_files=evidence_files,
+            reviewed_test_files=reviewed_test_files,
+            reviewed_source_files=reviewed_source_files,
+            notes=notes,
+            defect_ids=defect_ids,
+        )
+        with self._short_lock():
+            next_state, written = self._commit_coverage_progress(
+                submission_id, coverage_kind, [entry], reviewer
+            )
+        record_path, record = written[0]
+        return {
+            "state": next_state,
+            "coverage_progress_record_path": record_path,
+            "coverage_progress_record": record,
+        }
+
+    def publish_test_coverage_progress_batch(
+        self,
+        submission_id: int,
+        coverage_kind: str,
+        entries: list[dict],
+        reviewer: str | None = None,
     ) -> dict:
+        """Validate every entry against one unit table, then publish them in one transition."""
         if coverage_kind not in COVERAGE_KINDS:
             raise CoordinationError(
                 "Coverage kind must be one of: " + ", ".join(COVERAGE_KINDS) + "."
             )
+        unit_table = self._coverage_unit_table(submission_id, coverage_kind)
+        prepared: list[dict] = []
+        for index, fields in enumerate(
+            batch_entry_fields(entries, COVERAGE_PROGRESS_BATCH_FIELDS), start=1
+        ):
+            try:
+                prepared.append(
+                    self._prepare_coverage_progress(unit_table, coverage_kind, **fields)
+                )
+            except CoordinationError as exc:
+                raise CoordinationError(f"Progress batch record {index}: {exc}") from exc
+        with self._short_lock():
+            next_state, written = self._commit_coverage_progress(
+                submission_id, coverage_kind, prepared, reviewer
+            )
+        return {
+            "state": next_state,
+            "coverage_progress_record_paths": [record_path for record_path, _ in written],
+        }
+
+    def _prepare_coverage_progress(
+        self,
+        unit_table: ProgressUnitTable,
+        coverage_kind: str,
+        target: str,
+        decision: str,
+        evidence_summary: str | None = None,
+        evidence_files: list[str] | None = None,
+        reviewed_test_files: list[str] | None = None,
+        reviewed_source_files: list[str] | None = None,
+        notes: list[str] | None = None,
+        defect_ids: list[str] | None = None,
+    ) -> dict:
         if decision not in PROGRESS_DECISIONS:
             raise CoordinationError(
                 "Coverage progress decision must be one of: "
@@ -2125,107 +3719,119 @@ class CoordinationStore:
                 "Only coverage defect progress records may include `--defect-id`."
             )
 
-        required_units = {
-            unit["unit_id"]: unit for unit in self._required_coverage_units(coverage_kind)
-        }
-        matching_units = [
-            unit for unit in required_units.values() if unit["target"] == target
-        ]
+        matching_units = unit_table.matching(target, None)
         if not matching_units:
             raise CoordinationError(
                 f"`{target}` is not a required coverage unit for `{coverage_kind}`."
             )
         if len(matching_units) != 1:
             raise CoordinationError("Coverage unit resolution must be unique.")
-        unit = matching_units[0]
-        unit_id = str(unit["unit_id"])
 
-        with self._short_lock():
-            state = self.read_state()
-            self._require_turn(state, "triage")
-            if int(state.get("next_triage_class_index", 0)) < len(DEFECT_CLASSES):
-                raise CoordinationError(
-                    "Coverage audit cannot start until all three defect classes have been finalized."
-                )
-            expected_kind = self._expected_coverage_kind(state)
-            if coverage_kind != expected_kind:
-                raise CoordinationError(
-                    f"Coverage progress must publish `{expected_kind}` next, not `{coverage_kind}`."
-                )
-            current_submission = int(state["submission_id"])
-            if submission_id != current_submission:
-                raise CoordinationError(
-                    f"Coverage progress must target latest submission_id={current_submission}."
-                )
+        return {
+            "unit_id": str(matching_units[0]["unit_id"]),
+            "target": target,
+            "decision": decision,
+            "evidence_summary": evidence_summary,
+            "evidence_files": evidence_files,
+            "reviewed_test_files": reviewed_test_files,
+            "reviewed_source_files": reviewed_source_files,
+            "notes": notes,
+            "defect_ids": defect_ids,
+        }
 
-            record_path = self._coverage_progress_record_path(
-                submission_id, coverage_kind, unit_id
+    def _commit_coverage_progress(
+        self,
+        submission_id: int,
+        coverage_kind: str,
+        entries: list[dict],
+        reviewer: str | None = None,
+    ) -> tuple[dict, list[tuple[str, dict]]]:
+        """Write prepared coverage records and bump state once; caller holds the lock."""
+        reviewer = normalize_reviewer(reviewer)
+        state = self.read_state()
+        self._require_turn(state, "triage")
+        if int(state.get("next_triage_class_index", 0)) < len(DEFECT_CLASSES):
+            raise CoordinationError(
+                "Coverage audit cannot start until all three defect classes have been finalized."
+            )
+        expected_kind = self._expected_coverage_kind(state)
+        if coverage_kind != expected_kind:
+            raise CoordinationError(
+                f"Coverage progress must publish `{expected_kind}` next, not `{coverage_kind}`."
+            )
+        current_submission = int(state["submission_id"])
+        if submission_id != current_submission:
+            raise CoordinationError(
+                f"Coverage progress must target latest submission_id={current_submission}."
             )
-            if record_path.exists():
+
+        records: list[dict] = []
+        seen_unit_ids: set[str] = set()
+        for entry in entries:
+            unit_id = entry["unit_id"]
+            if unit_id in seen_unit_ids:
                 raise CoordinationError(
-                    f"Coverage progress for `{unit_id}` already exists. Reset the gate state before replacing it."
+                    f"Coverage progress batch publishes `{unit_id}` more than once."
                 )
-
-            record = {
-                "gate": GATE_NAME,
-                "submission_id": submission_id,
-                "turn_id": state["turn_id"],
-                "actor": "triage",
-                "created_at": utc_now(),
-                "coverage_kind": coverage_kind,
-                "unit_id": unit_id,
-                "target": target,
-                "decision": decision,
-                "evidence_summary": evidence_summary,
-                "evidence_files": evidence_files,
-                "reviewed_test_files": reviewed_test_files,
-                "reviewed_source_files": reviewed_source_files,
-                "notes": notes,
-                "defect_ids": defect_ids,
-            }
-            write_json_atomic(record_path, record)
-
-            next_state = self.engine.transition(
-                state,
+            seen_unit_ids.add(unit_id)
+            records.append(
                 {
-                    "status": state["status"],
-                    "phase": state["phase"],
-                    "fix_gate_open": state.get("fix_gate_open", False),
-                    "triage_status": state.get("triage_status"),
-                    "next_triage_class_index": state.get("next_triage_class_index", 0),
-                    "published_triage_classes": list(
-                        state.get("published_triage_classes", [])
-                    ),
-                    "coverage_kind_index": state.get("coverage_kind_index", 0),
-                    "published_coverage_kinds": list(
-                        state.get("published_coverage_kinds", [])
-                    ),
-                    "coverage_status": "scanning",
-                    "open_defects": list(state.get("open_defects", [])),
-                    "active_repair_plan": list(state.get("active_repair_plan", [])),
-                    "blocked_reason": state.get("blocked_reason"),
-                    "triage_report_id": state.get("triage_report_id", 0),
-                    "coverage_report_id": state.get("coverage_report_id", 0),
-                    "submission_id": state.get("submission_id", 0),
-                    "triage_of_submission_id": state.get("triage_of_submission_id", 0),
-                    "progress_record_count": state.get("progress_record_count", 0),
-                    "last_progress_unit_id": state.get("last_progress_unit_id"),
-                    "coverage_progress_record_count": int(
-                        state.get("coverage_progress_record_count", 0)
-                    )
-                    + 1,
-                    "last_coverage_unit_id": unit_id,
-                    "last_event": f"coverage_progress_published:{coverage_kind}",
-                },
-                active_owner=state.get("active_owner"),
-                worker_state=state.get("worker_state", WORKER_STATE_DORMANT),
+                    "gate": self.gate,
+                    "submission_id": submission_id,
+                    "turn_id": state["turn_id"],
+                    "actor": "triage",
+                    "created_at": utc_now(),
+                    "coverage_kind": coverage_kind,
+                    **({"reviewer": reviewer} if reviewer is not None else {}),
+                    **entry,
+                }
             )
-            write_json_atomic(self.state_file, next_state)
-            return {
-                "state": next_state,
-                "coverage_progress_record_path": str(record_path.relative_to(self.root)),
-                "coverage_progress_record": record,
-            }
+        leases = self._check_unit_leases(
+            "coverage-progress", submission_id, coverage_kind, records, reviewer
+        )
+        paths = self.storage.write_records(
+            "coverage-progress", submission_id, coverage_kind, records
+        )
+        self._release_unit_leases(leases, records)
+        written = list(zip(paths, records))
+
+        next_state = self.engine.transition(
+            state,
+            {
+                "status": state["status"],
+                "phase": state["phase"],
+                "fix_gate_open": state.get("fix_gate_open", False),
+                "triage_status": state.get("triage_status"),
+                "next_triage_class_index": state.get("next_triage_class_index", 0),
+                "published_triage_classes": list(
+                    state.get("published_triage_classes", [])
+                ),
+                "coverage_kind_index": state.get("coverage_kind_index", 0),
+                "published_coverage_kinds": list(
+                    state.get("published_coverage_kinds", [])
+                ),
+                "coverage_status": "scanning",
+                "open_defects": list(state.get("open_defects", [])),
+                "active_repair_plan": list(state.get("active_repair_plan", [])),
+                "blocked_reason": state.get("blocked_reason"),
+                "triage_report_id": state.get("triage_report_id", 0),
+                "coverage_report_id": state.get("coverage_report_id", 0),
+                "submission_id": state.get("submission_id", 0),
+                "triage_of_submission_id": state.get("triage_of_submission_id", 0),
+                "progress_record_count": state.get("progress_record_count", 0),
+                "last_progress_unit_id": state.get("last_progress_unit_id"),
+                "coverage_progress_record_count": int(
+                    state.get("coverage_progress_record_count", 0)
+                )
+                + len(written),
+                "last_coverage_unit_id": entries[-1]["unit_id"],
+                "last_event": f"coverage_progress_published:{coverage_kind}",
+            },
+            active_owner=state.get("active_owner"),
+            worker_state=state.get("worker_state", WORKER_STATE_DORMANT),
+        )
+        self._write_state(next_state)
+        return next_state, written
 
     def _resolve_coverage_artifact_path(self, artifact_path: str) -> Path:
         return self._resolve_review_artifact_path(artifact_path)
@@ -2398,20 +4004,19 @@ class CoordinationStore:
                     "Rejected coverage audits must include at least one defect."
                 )
 
-            required_units = self._required_coverage_units(coverage_kind)
+            unit_table = self._coverage_unit_table(submission_id, coverage_kind)
+            required_unit_ids = unit_table.unit_ids
             progress_records = self._load_coverage_progress_records(
                 submission_id, coverage_kind
             )
-            required_unit_ids = {str(unit["unit_id"]) for unit in required_units}
-            progress_unit_ids = set(progress_records)
-            missing_progress_units = sorted(required_unit_ids - progress_unit_ids)
+            missing_progress_units = sorted(required_unit_ids - set(progress_records))
             if missing_progress_units:
                 raise CoordinationError(
                     "Coverage audit finalization is missing progress units: "
                     + ", ".join(missing_progress_units)
                     + "."
                 )
-            unexpected_progress_units = sorted(progress_unit_ids - required_unit_ids)
+            unexpected_progress_units = sorted(set(progress_records) - required_unit_ids)
             if unexpected_progress_units:
                 raise CoordinationError(
                     "Coverage audit finalization includes unknown progress units: "
@@ -2435,7 +4040,7 @@ class CoordinationStore:
                 coverage_kind,
                 submission_id,
                 review_artifact,
-                required_units,
+                unit_table.units,
                 progress_records,
             )
 
@@ -2472,7 +4077,9 @@ class CoordinationStore:
                         + ", ".join(unexpected_progress_defect_ids)
                         + "."
                     )
+                targets = defect_targets(progress_records)
                 for defect in repair_plan:
+                    defect["targets"] = targets.get(defect["id"], [])
                     evidence = defect_evidence.get(defect["id"], "").strip()
                     if not evidence:
                         raise CoordinationError(
@@ -2497,7 +4104,7 @@ class CoordinationStore:
                 self.task_dir / "coverage" / f"coverage-{report_id:04d}.json"
             )
             report = {
-                "gate": GATE_NAME,
+                "gate": self.gate,
                 "coverage_report_id": report_id,
                 "submission_id": submission_id,
                 "turn_id": state["turn_id"],
@@ -2537,6 +4144,7 @@ class CoordinationStore:
                 open_defects=open_defects,
                 active_repair_plan=active_repair_plan,
                 next_coverage_kind_index=next_coverage_kind_index,
+                fix_worker_count=int(state.get("fix_worker_count", 1)),
             )
             next_state = self.engine.transition(
                 state,
@@ -2544,7 +4152,7 @@ class CoordinationStore:
                 active_owner=active_owner,
                 worker_state=worker_state,
             )
-            write_json_atomic(self.state_file, next_state)
+            self._write_state(next_state)
             return next_state
 
     def _run_probe_suite(self, defect_class: str, submission_id: int) -> dict:
@@ -2603,7 +4211,7 @@ class CoordinationStore:
             f"repo gate profile: {deferred_run_plan['profile_path']}",
             "Semantic review first: do not execute deferred run commands during spec-drift triage.",
         ]
-        context_files, unresolved_context_refs = discover_spec_context_files(self.root)
+        context_files, unresolved_context_refs = self._spec_context_files()
         if context_files:
             notes.append("spec context files: " + ", ".join(context_files))
         else:
@@ -2730,16 +4338,20 @@ class CoordinationStore:
         }
 
     def _discover_source_review_files(self) -> list[str]:
+        source_roots = self._discover_quality_source_roots()
+        return self._discovered(
+            "source_review_files:" + json.dumps(source_roots),
+            source_roots,
+            lambda: self._scan_source_review_files(source_roots),
+        )
+
+    def _scan_source_review_files(self, source_roots: list[str]) -> list[str]:
         discovered: list[str] = []
-        for source_root in self._discover_quality_source_roots():
+        for source_root in source_roots:
             root_path = self.root / source_root
             if not root_path.is_dir():
                 continue
-            for path in sorted(root_path.rglob("*")):
-                if not path.is_file():
-                    continue
-                if any(part in QUALITY_PROBE_IGNORED_PARTS for part in path.parts):
-                    continue
+            for path in discovery.iter_tree_files(root_path, QUALITY_PROBE_IGNORED_PARTS):
                 if not is_reviewable_text_file(path):
                     continue
                 try:
@@ -2751,8 +4363,17 @@ class CoordinationStore:
     def _discover_source_component_review_order(
         self, source_roots: list[str] | None = None
     ) -> list[dict[str, object]]:
-        review_order: list[dict[str, object]] = []
         roots = source_roots or self._discover_quality_source_roots()
+        return self._discovered(
+            "source_component_review_order:" + json.dumps(roots),
+            roots,
+            lambda: self._scan_source_component_review_order(roots),
+        )
+
+    def _scan_source_component_review_order(
+        self, roots: list[str]
+    ) -> list[dict[str, object]]:
+        review_order: list[dict[str, object]] = []
         for source_root in roots:
             root_path = self.root / source_root
             if not root_path.is_dir():
@@ -2850,20 +4471,23 @@ class CoordinationStore:
         }
 
     def _discover_quality_source_roots(self) -> list[str]:
-        profile = self._load_repo_gate_profile()
+        source_roots = self._load_repo_gate_profile()["triage"]["source_roots"]
+        return self._discovered(
+            "quality_source_roots:" + json.dumps(source_roots),
+            source_roots,
+            lambda: self._scan_quality_source_roots(source_roots),
+        )
+
+    def _scan_quality_source_roots(self, source_roots: list[str]) -> list[str]:
         discovered: list[str] = []
-        for relative_root in profile["triage"]["source_roots"]:
+        for relative_root in source_roots:
             root_path = self.root / relative_root
             if self._source_root_has_supported_files(root_path):
                 discovered.append(relative_root)
         return discovered
 
     def _source_root_has_supported_files(self, source_root: Path) -> bool:
-        for path in source_root.rglob("*"):
-            if not path.is_file():
-                continue
-            if any(part in QUALITY_PROBE_IGNORED_PARTS for part in path.parts):
-                continue
+        for path in discovery.iter_tree_files(source_root, QUALITY_PROBE_IGNORED_PARTS):
             if is_reviewable_text_file(path):
                 return True
         return False
@@ -3059,6 +4683,12 @@ class CoordinationStore:
 
     def _triage_runner_packet(
         self, state: dict, result: str, probe: dict | None = None
+    ) -> dict:
+        with self._discovery_snapshot_scope():
+            return self._build_triage_runner_packet(state, result, probe)
+
+    def _build_triage_runner_packet(
+        self, state: dict, result: str, probe: dict | None = None
     ) -> dict:
         profile_error = None
         try:
@@ -3074,7 +4704,7 @@ class CoordinationStore:
             black_box_tests = []
             white_box_tests = []
             profile_error = str(exc)
-        context_files, unresolved_context_refs = discover_spec_context_files(self.root)
+        context_files, unresolved_context_refs = self._spec_context_files()
         full_file_review_contract = {
             "must_read_full_files": True,
             "must_not_judge_from_snippets_only": True,
@@ -3103,7 +4733,7 @@ class CoordinationStore:
             "full_file_review_contract": full_file_review_contract,
             "progress_artifact_contract": {
                 "required": True,
-                "path_hint": ".git/agent-sync/gate/all-defects/progress/submission-<id>/<defect-class>/<unit>.json",
+                "path_hint": f".git/agent-sync/gate/{self.gate}/progress/submission-<id>/<defect-class>/<unit>.json",
                 "required_fields": [
                     "defect_class",
                     "unit_id",
@@ -3121,7 +4751,7 @@ class CoordinationStore:
             },
             "coverage_progress_artifact_contract": {
                 "required": True,
-                "path_hint": ".git/agent-sync/gate/all-defects/coverage-progress/submission-<id>/<coverage-kind>/<unit>.json",
+                "path_hint": f".git/agent-sync/gate/{self.gate}/coverage-progress/submission-<id>/<coverage-kind>/<unit>.json",
                 "required_fields": [
                     "coverage_kind",
                     "unit_id",
@@ -3138,7 +4768,7 @@ class CoordinationStore:
             },
             "review_artifact_contract": {
                 "required": True,
-                "path_hint": ".git/agent-sync/gate/all-defects/reviews/<defect-class>-final.json",
+                "path_hint": f".git/agent-sync/gate/{self.gate}/reviews/<defect-class>-final.json",
                 "required_fields": [
                     "defect_class",
                     "summary",
@@ -3152,7 +4782,7 @@ class CoordinationStore:
             },
             "coverage_artifact_contract": {
                 "required": True,
-                "path_hint": ".git/agent-sync/gate/all-defects/coverage/coverage-<id>.json",
+                "path_hint": f".git/agent-sync/gate/{self.gate}/coverage/coverage-<id>.json",
                 "required_fields": [
                     "coverage_kind",
                     "summary",
@@ -3187,7 +4817,9 @@ class CoordinationStore:
         if result == "actionable":
             if int(state.get("next_triage_class_index", 0)) < len(DEFECT_CLASSES):
                 defect_class = self._expected_triage_class(state)
-                required_progress_units = self._required_progress_units(defect_class)
+                required_progress_units = self._progress_unit_table(
+                    int(state["submission_id"]), defect_class
+                ).units
                 packet.update(
                     {
                         "semantic_review_contract": semantic_review_contract(defect_class),
@@ -3229,8 +4861,9 @@ class CoordinationStore:
                 )
             else:
                 coverage_kind = self._expected_coverage_kind(state)
-                black_box_queue = self._required_coverage_units("black-box")
-                white_box_queue = self._required_coverage_units("white-box")
+                submission_id = int(state["submission_id"])
+                black_box_queue = self._coverage_unit_table(submission_id, "black-box").units
+                white_box_queue = self._coverage_unit_table(submission_id, "white-box").units
                 coverage_queue = (
                     black_box_queue if coverage_kind == "black-box" else white_box_queue
                 )
@@ -3268,7 +4901,20 @@ class CoordinationStore:
             packet["quality_review_contract"] = None
         return packet
 
-    def _fix_runner_packet(self, state: dict, result: str) -> dict:
+    def _fix_runner_packet(self, state: dict, result: str, worker: str | None = None) -> dict:
+        shard = state.get("fix_shards", {}).get(worker) if worker is not None else None
+        active_repair_plan = list(state.get("active_repair_plan", []))
+        open_defects = list(state.get("open_defects", []))
+        submission_allowed = state.get("active_owner") == "fix"
+        if worker is not None:
+            shard_defect_ids = set(shard["defect_ids"]) if shard else set()
+            active_repair_plan = [
+                defect for defect in active_repair_plan if defect["id"] in shard_defect_ids
+            ]
+            open_defects = [defect_id for defect_id in open_defects if defect_id in shard_defect_ids]
+            submission_allowed = submission_allowed and bool(
+                shard and shard["status"] == FIX_SHARD_RELEASED
+            )
         triage_fallback_recommended = (
             result == "wait"
             and state.get("status") == "active"
@@ -3283,10 +4929,12 @@ class CoordinationStore:
             "baton_contract": self._baton_contract(state),
             "state_version": state.get("state_version"),
             "state_revision": state.get("state_revision"),
-            "active_repair_plan": list(state.get("active_repair_plan", [])),
-            "open_defects": list(state.get("open_defects", [])),
+            "worker": worker,
+            "fix_shard": shard,
+            "active_repair_plan": active_repair_plan,
+            "open_defects": open_defects,
             "triage_status": state.get("triage_status"),
-            "submission_allowed": state.get("active_owner") == "fix",
+            "submission_allowed": submission_allowed,
             "triage_fallback_recommended": triage_fallback_recommended,
             "triage_fallback_entrypoint": (
                 "python3 scripts/agent_sync.py run-triage-pass"
@@ -3335,6 +4983,7 @@ class CoordinationStore:
             ),
             "coordinator_actor": state.get("coordinator_actor", COORDINATOR_ACTOR),
             "worker_actor": state.get("worker_actor", WORKER_ACTOR),
+            "fix_worker_ids": fix_worker_ids(int(state.get("fix_worker_count", 1))),
             "active_owner": state.get("active_owner"),
             "worker_state": state.get("worker_state"),
             "bounded_worker_iterations": True,
@@ -3344,18 +4993,8 @@ class CoordinationStore:
 
     @contextmanager
     def _short_lock(self):
-        self.lock_dir.parent.mkdir(parents=True, exist_ok=True)
-        try:
-            os.mkdir(self.lock_dir)
-        except FileExistsError as exc:
-            raise CoordinationError(
-                "Turn lock is currently held by another transition."
-            ) from exc
-        try:
+        with self.turn_lock.hold():
             yield
-        finally:
-            if self.lock_dir.exists():
-                self.lock_dir.rmdir()
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -3367,13 +5006,39 @@ def build_parser() -> argparse.ArgumentParser:
         default=".",
         help="Repository root containing .git/ or where .git/ should be created.",
     )
+    parser.add_argument(
+        "--namespace",
+        dest="gate",
+        type=gate_name_argument,
+        default=GATE_NAME,
+        help=f"Gate namespace to operate on (default: {GATE_NAME}); other namespaces take their spec/source roots from `namespaces` in the repo gate profile.",
+    )
+    parser.add_argument(
+        "--direct",
+        action="store_true",
+        help="Run in this process even when an `agent_sync.py serve` server is listening.",
+    )
 
     subparsers = parser.add_subparsers(dest="command", required=True)
 
-    subparsers.add_parser("init", help="Initialize the unified coordination gate.")
+    init_parser = subparsers.add_parser("init", help="Initialize the unified coordination gate.")
+    init_parser.add_argument(
+        "--fix-workers",
+        type=int,
+        default=1,
+        help="Number of named fix workers; above 1, repairs are released as disjoint per-worker shards.",
+    )
+    subparsers.add_parser(
+        "serve",
+        help="Run a resident server on a Unix socket under .git/agent-sync/serve/; later CLI calls for this repo are forwarded to it.",
+    )
     subparsers.add_parser(
         "state", help="Debug-only current coordination state; not the normal gate entrypoint."
     )
+    subparsers.add_parser(
+        "list-gates",
+        help="List initialized gate namespaces and namespaces declared in the repo gate profile.",
+    )
 
     triage_run_parser = subparsers.add_parser(
         "run-triage-pass",
@@ -3392,6 +5057,10 @@ def build_parser() -> argparse.ArgumentParser:
         help="Blocking fix entrypoint: wait until released repair work exists or the gate reaches a terminal state.",
     )
     fix_run_parser.add_argument("--poll-interval", type=float, default=2.0)
+    fix_run_parser.add_argument(
+        "--worker",
+        help="Fix worker name (fix-1, fix-2, ...) when the gate was initialized with --fix-workers > 1.",
+    )
     fix_run_parser.add_argument(
         "--timeout",
         type=float,
@@ -3504,6 +5173,78 @@ def build_parser() -> argparse.ArgumentParser:
         help="Repeatable stable defect ID when this coverage unit finds a gap.",
     )
 
+    triage_batch_parser = subparsers.add_parser(
+        "publish-triage-progress-batch",
+        help="Publish many triage review unit records for the active defect class in one transition.",
+    )
+    triage_batch_parser.add_argument("--submission-id", required=True, type=int)
+    triage_batch_parser.add_argument(
+        "--defect-class",
+        required=True,
+        choices=DEFECT_CLASSES,
+    )
+    triage_batch_parser.add_argument(
+        "--records",
+        default="-",
+        help="JSONL file with one record per unit (fields: "
+        + ", ".join(TRIAGE_PROGRESS_BATCH_FIELDS)
+        + "); `-` reads stdin.",
+    )
+
+    coverage_batch_parser = subparsers.add_parser(
+        "publish-test-coverage-progress-batch",
+        help="Publish many coverage review unit records for the active coverage kind in one transition.",
+    )
+    coverage_batch_parser.add_argument("--submission-id", required=True, type=int)
+    coverage_batch_parser.add_argument(
+        "--coverage-kind",
+        required=True,
+        choices=COVERAGE_KINDS,
+    )
+    coverage_batch_parser.add_argument(
+        "--records",
+        default="-",
+        help="JSONL file with one record per unit (fields: "
+        + ", ".join(COVERAGE_PROGRESS_BATCH_FIELDS)
+        + "); `-` reads stdin.",
+    )
+
+    for progress_parser in (
+        triage_progress_parser,
+        coverage_progress_parser,
+        triage_batch_parser,
+        coverage_batch_parser,
+    ):
+        progress_parser.add_argument(
+            "--reviewer",
+            help="Reviewer publishing units it claimed with claim-review-units.",
+        )
+
+    claim_parser = subparsers.add_parser(
+        "claim-review-units",
+        help="Lease unreviewed units of the active triage or coverage phase to one reviewer in a pool.",
+    )
+    claim_parser.add_argument("--reviewer", required=True)
+    claim_parser.add_argument("--count", type=int, default=1)
+    claim_parser.add_argument(
+        "--lease-seconds",
+        type=float,
+        default=REVIEW_LEASE_SECONDS,
+        help="Seconds before an unpublished claim expires and the unit is re-queued.",
+    )
+
+    reassign_parser = subparsers.add_parser(
+        "reassign-fix-shard",
+        help="Move a fix worker's released shard, once its lease expired, onto another worker.",
+    )
+    reassign_parser.add_argument("--from-worker", required=True)
+    reassign_parser.add_argument("--to-worker", required=True)
+    reassign_parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Reassign even though the shard lease has not expired yet.",
+    )
+
     wait_parser = subparsers.add_parser(
         "wait", help="Debug-only wait helper; normal gate entry should use run-fix-pass or run-triage-pass."
     )
@@ -3541,6 +5282,10 @@ def build_parser() -> argparse.ArgumentParser:
         "--artifact-dir",
         help="Artifact directory under specs/build/ containing todo.md and auto-decisions.md.",
     )
+    submit_parser.add_argument(
+        "--worker",
+        help="Publish this worker's partial submission for its shard (multi-worker gates only).",
+    )
 
     triage_parser = subparsers.add_parser(
         "publish-triage",
@@ -3676,145 +5421,341 @@ def debug_command_payload(command: str, payload: dict) -> dict:
     }
 
 
+def dispatch_command(
+    store: CoordinationStore, args: argparse.Namespace, records: list[object] | None = None
+) -> tuple[int, dict]:
+    """Execute one parsed CLI command and return its exit code and JSON payload.
+
+    `records` carries batch progress records that a client already read, so the
+    server never reads `--records` relative to its own working directory.
+    """
+    if args.command == "init":
+        return 0, store.init_task(fix_workers=args.fix_workers)
+
+    if args.command == "list-gates":
+        return 0, store.list_gates()
+
+    if args.command == "state":
+        payload = debug_command_payload("state", store.ensure_task())
+        payload["turn_lock"] = store.turn_lock.describe()
+        return 0, payload
+
+    if args.command == "run-triage-pass":
+        result = store.run_triage_pass(
+            poll_interval=args.poll_interval,
+            timeout=args.timeout,
+        )
+        return (0 if result["result"] != "timeout" else 2), result
+
+    if args.command == "run-fix-pass":
+        result = store.run_fix_pass(
+            poll_interval=args.poll_interval,
+            timeout=args.timeout,
+            worker=args.worker,
+        )
+        return (0 if result["result"] != "timeout" else 2), result
+
+    if args.command == "publish-triage-progress":
+        return 0, store.publish_triage_progress(
+            submission_id=args.submission_id,
+            defect_class=args.defect_class,
+            target=args.target,
+            defect_type=args.defect_type,
+            decision=args.decision,
+            evidence_summary=args.evidence_summary,
+            evidence_files=args.evidence_files,
+            reviewed_anchor_files=args.reviewed_anchor_files,
+            reviewed_context_files=args.reviewed_context_files,
+            notes=args.notes,
+            defect_ids=args.defect_ids,
+            reviewer=args.reviewer,
+        )
+
+    if args.command == "publish-test-coverage-progress":
+        return 0, store.publish_test_coverage_progress(
+            submission_id=args.submission_id,
+            coverage_kind=args.coverage_kind,
+            target=args.target,
+            decision=args.decision,
+            evidence_summary=args.evidence_summary,
+            evidence_files=args.evidence_files,
+            reviewed_test_files=args.reviewed_test_files,
+            reviewed_source_files=args.reviewed_source_files,
+            notes=args.notes,
+            defect_ids=args.defect_ids,
+            reviewer=args.reviewer,
+        )
+
+    if args.command == "publish-triage-progress-batch":
+        return 0, store.publish_triage_progress_batch(
+            submission_id=args.submission_id,
+            defect_class=args.defect_class,
+            entries=read_jsonl_records(args.records) if records is None else records,
+            reviewer=args.reviewer,
+        )
+
+    if args.command == "publish-test-coverage-progress-batch":
+        return 0, store.publish_test_coverage_progress_batch(
+            submission_id=args.submission_id,
+            coverage_kind=args.coverage_kind,
+            entries=read_jsonl_records(args.records) if records is None else records,
+            reviewer=args.reviewer,
+        )
+
+    if args.command == "claim-review-units":
+        return 0, store.claim_review_units(
+            reviewer=args.reviewer,
+            count=args.count,
+            lease_seconds=args.lease_seconds,
+        )
+
+    if args.command == "reassign-fix-shard":
+        return 0, store.reassign_fix_shard(
+            from_worker=args.from_worker,
+            to_worker=args.to_worker,
+            force=args.force,
+        )
+
+    if args.command == "wait":
+        verdict = store.wait_for_turn(
+            actor=args.actor,
+            poll_interval=args.poll_interval,
+            timeout=args.timeout,
+        )
+        return (0 if verdict["result"] != "timeout" else 2), debug_command_payload(
+            "wait", verdict
+        )
+
+    if args.command == "publish-submission":
+        return 0, store.publish_submission(
+            base_rev=args.base_rev,
+            head_rev=args.head_rev,
+            changed_files=args.changed_files,
+            validation_summary=args.validation_notes,
+            repair_responses=parse_key_value_pairs(
+                args.repair_responses, "Repair response"
+            ),
+            repair_rounds=args.repair_rounds,
+            artifact_dir=args.artifact_dir,
+            worker=args.worker,
+        )
+
+    if args.command == "publish-triage":
+        return 0, store.publish_triage(
+            submission_id=args.submission_id,
+            decision=args.decision,
+            defects=parse_defects(args.defect),
+            defect_class=args.defect_class,
+            repair_logic=parse_key_value_pairs(
+                args.repair_logic, "Repair logic"
+            ),
+            evidence_summary=args.evidence_summary,
+            checks_run=args.checks_run,
+            notes=args.notes,
+            defect_evidence=parse_defect_evidence(args.defect_evidence),
+            review_artifact=args.review_artifact,
+        )
+
+    if args.command == "publish-test-coverage-audit":
+        return 0, store.publish_test_coverage_audit(
+            submission_id=args.submission_id,
+            coverage_kind=args.coverage_kind,
+            decision=args.decision,
+            defects=parse_defects(args.defect),
+            repair_logic=parse_key_value_pairs(
+                args.repair_logic, "Repair logic"
+            ),
+            evidence_summary=args.evidence_summary,
+            checks_run=args.checks_run,
+            notes=args.notes,
+            defect_evidence=parse_defect_evidence(args.defect_evidence),
+            review_artifact=args.review_artifact,
+        )
+
+    if args.command == "mark-blocked":
+        return 0, store.mark_blocked(reason=args.reason)
+
+    raise CoordinationError(f"Unsupported command: {args.command}")
+
+
+def serve_socket_path(root: str | Path, gate: str = GATE_NAME) -> Path:
+    """Socket of the gate server for `root`, in a per-user temp directory.
+
+    Unix socket paths are limited to about 100 bytes, which a deep `.git`
+    path plus a long gate name can exceed, so the file is named by a hash of
+    the git dir and gate instead.
+    """
+    gate = validate_gate_name(gate)
+    git_dir = resolve_git_dir(Path(root).resolve())
+    digest = hashlib.sha1(f"{git_dir}\0{gate}".encode("utf-8")).hexdigest()[:16]
+    user = os.getuid() if hasattr(os, "getuid") else "user"
+    return Path(tempfile.gettempdir()) / f"vibespec-{user}" / f"{digest}.sock"
+
+
+def owns_serve_socket_dir(socket_path: Path) -> bool:
+    """Whether the socket directory is a directory owned by this user and closed to others."""
+    try:
+        info = socket_path.parent.lstat()
+    except OSError:
+        return False
+    return (
+        stat.S_ISDIR(info.st_mode)
+        and info.st_uid == os.getuid()
+        and not info.st_mode & (stat.S_IRWXG | stat.S_IRWXO)
+    )
+
+
+def ensure_serve_socket_dir(socket_path: Path) -> None:
+    socket_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    if not owns_serve_socket_dir(socket_path):
+        raise CoordinationError(
+            f"Socket directory `{socket_path.parent}` must be owned by this user with mode 0700."
+        )
+
+
+class AgentSyncRequestHandler(socketserver.StreamRequestHandler):
+    """Answers JSON-lines requests of the form `{"argv": [...], "root": ..., "records": [...]}`."""
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            response = self.server.answer(line)
+            self.wfile.write((json.dumps(response, sort_keys=True) + "\n").encode("utf-8"))
+            self.wfile.flush()
+
+
+if hasattr(socket, "AF_UNIX"):
+
+    class AgentSyncServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+        """Resident gate server; one warm `CoordinationStore` shared by every connection.
+
+        Gate state stays on disk under the turn lock, so direct-mode CLI calls can
+        still run alongside the server; what the server saves is interpreter
+        startup and the store's profile, unit-table and discovery caches.
+        """
+
+        daemon_threads = True
+
+        def __init__(self, store: CoordinationStore, socket_path: Path):
+            self.store = store
+            self.socket_path = socket_path
+            self.parser = build_parser()
+            super().__init__(str(socket_path), AgentSyncRequestHandler)
+
+        def answer(self, line: bytes) -> dict:
+            try:
+                request = json.loads(line)
+            except json.JSONDecodeError:
+                return {"exit_code": 2, "error": "Request must be one JSON object per line."}
+            if not isinstance(request, dict) or not isinstance(request.get("argv"), list):
+                return {"exit_code": 2, "error": "Request must include an `argv` list."}
+            try:
+                args = self.parser.parse_args([str(token) for token in request["argv"]])
+            except SystemExit:
+                return {"exit_code": 2, "error": "Request `argv` is not a valid command."}
+            if args.command == "serve":
+                return {"exit_code": 2, "error": "The server cannot start another server."}
+            if Path(str(request.get("root", args.root))).resolve() != self.store.root:
+                return {"exit_code": 2, "error": f"This server only serves `{self.store.root}`."}
+            if args.gate != self.store.gate:
+                return {"exit_code": 2, "error": f"This server only serves namespace `{self.store.gate}`."}
+            try:
+                exit_code, payload = dispatch_command(self.store, args, request.get("records"))
+            except CoordinationError as exc:
+                return {"exit_code": 1, "error": str(exc)}
+            except Exception as exc:  # Keep serving other agents after a bug in one command.
+                return {"exit_code": 1, "error": f"Internal server error: {exc!r}"}
+            return {"exit_code": exit_code, "payload": payload}
+
+
+def serve(store: CoordinationStore) -> int:
+    if not hasattr(socket, "AF_UNIX"):
+        raise CoordinationError("`serve` requires Unix domain socket support.")
+    socket_path = serve_socket_path(store.root, store.gate)
+    ensure_serve_socket_dir(socket_path)
+    if socket_path.exists():
+        probe = {"argv": ["--namespace", store.gate, "state"], "root": str(store.root)}
+        if call_server(socket_path, probe) is not None:
+            raise CoordinationError(f"An agent_sync server is already listening on `{socket_path}`.")
+        socket_path.unlink()
+    try:
+        server = AgentSyncServer(store, socket_path)
+    except OSError as exc:
+        raise CoordinationError(f"Cannot listen on `{socket_path}`: {exc}") from exc
+    os.chmod(socket_path, 0o600)
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    print(f"agent_sync serving {store.root} on {socket_path}", file=sys.stderr, flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        socket_path.unlink(missing_ok=True)
+    return 0
+
+
+def call_server(socket_path: Path, request: dict) -> dict | None:
+    """Send one request to a running server; `None` means no server answered the connect."""
+    if not hasattr(socket, "AF_UNIX") or not socket_path.exists():
+        return None
+    if not owns_serve_socket_dir(socket_path):
+        # Another user could have planted this socket; never send it requests.
+        return None
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.settimeout(SERVE_CONNECT_TIMEOUT_SECONDS)
+        try:
+            client.connect(str(socket_path))
+        except OSError:
+            return None
+        # Once connected the request may already be applied, so never fall back after this.
+        client.settimeout(None)
+        client.sendall((json.dumps(request) + "\n").encode("utf-8"))
+        with client.makefile("rb") as stream:
+            line = stream.readline()
+    except OSError as exc:
+        raise CoordinationError(f"Lost connection to agent_sync server: {exc}") from exc
+    finally:
+        client.close()
+    if not line:
+        raise CoordinationError("agent_sync server closed the connection without a response.")
+    return json.loads(line)
+
+
 def main(argv: list[str] | None = None) -> int:
     parser = build_parser()
     args = parser.parse_args(argv)
 
     try:
-        store = CoordinationStore(args.root)
-
-        if args.command == "init":
-            print_json(store.init_task())
-            return 0
-
-        if args.command == "state":
-            print_json(debug_command_payload("state", store.ensure_task()))
-            return 0
-
-        if args.command == "run-triage-pass":
-            result = store.run_triage_pass(
-                poll_interval=args.poll_interval,
-                timeout=args.timeout,
-            )
-            print_json(result)
-            return 0 if result["result"] != "timeout" else 2
-
-        if args.command == "run-fix-pass":
-            result = store.run_fix_pass(
-                poll_interval=args.poll_interval,
-                timeout=args.timeout,
-            )
-            print_json(result)
-            return 0 if result["result"] != "timeout" else 2
-
-        if args.command == "publish-triage-progress":
-            print_json(
-                store.publish_triage_progress(
-                    submission_id=args.submission_id,
-                    defect_class=args.defect_class,
-                    target=args.target,
-                    defect_type=args.defect_type,
-                    decision=args.decision,
-                    evidence_summary=args.evidence_summary,
-                    evidence_files=args.evidence_files,
-                    reviewed_anchor_files=args.reviewed_anchor_files,
-                    reviewed_context_files=args.reviewed_context_files,
-                    notes=args.notes,
-                    defect_ids=args.defect_ids,
-                )
-            )
-            return 0
-
-        if args.command == "publish-test-coverage-progress":
-            print_json(
-                store.publish_test_coverage_progress(
-                    submission_id=args.submission_id,
-                    coverage_kind=args.coverage_kind,
-                    target=args.target,
-                    decision=args.decision,
-                    evidence_summary=args.evidence_summary,
-                    evidence_files=args.evidence_files,
-                    reviewed_test_files=args.reviewed_test_files,
-                    reviewed_source_files=args.reviewed_source_files,
-                    notes=args.notes,
-                    defect_ids=args.defect_ids,
-                )
-            )
-            return 0
-
-        if args.command == "wait":
-            verdict = store.wait_for_turn(
-                actor=args.actor,
-                poll_interval=args.poll_interval,
-                timeout=args.timeout,
-            )
-            print_json(debug_command_payload("wait", verdict))
-            return 0 if verdict["result"] != "timeout" else 2
-
-        if args.command == "publish-submission":
-            print_json(
-                store.publish_submission(
-                    base_rev=args.base_rev,
-                    head_rev=args.head_rev,
-                    changed_files=args.changed_files,
-                    validation_summary=args.validation_notes,
-                    repair_responses=parse_key_value_pairs(
-                        args.repair_responses, "Repair response"
-                    ),
-                    repair_rounds=args.repair_rounds,
-                    artifact_dir=args.artifact_dir,
-                )
-            )
-            return 0
-
-        if args.command == "publish-triage":
-            print_json(
-                store.publish_triage(
-                    submission_id=args.submission_id,
-                    decision=args.decision,
-                    defects=parse_defects(args.defect),
-                    defect_class=args.defect_class,
-                    repair_logic=parse_key_value_pairs(
-                        args.repair_logic, "Repair logic"
-                    ),
-                    evidence_summary=args.evidence_summary,
-                    checks_run=args.checks_run,
-                    notes=args.notes,
-                    defect_evidence=parse_defect_evidence(args.defect_evidence),
-                    review_artifact=args.review_artifact,
-                )
-            )
-            return 0
-
-        if args.command == "publish-test-coverage-audit":
-            print_json(
-                store.publish_test_coverage_audit(
-                    submission_id=args.submission_id,
-                    coverage_kind=args.coverage_kind,
-                    decision=args.decision,
-                    defects=parse_defects(args.defect),
-                    repair_logic=parse_key_value_pairs(
-                        args.repair_logic, "Repair logic"
-                    ),
-                    evidence_summary=args.evidence_summary,
-                    checks_run=args.checks_run,
-                    notes=args.notes,
-                    defect_evidence=parse_defect_evidence(args.defect_evidence),
-                    review_artifact=args.review_artifact,
-                )
-            )
-            return 0
-
-        if args.command == "mark-blocked":
-            print_json(store.mark_blocked(reason=args.reason))
-            return 0
-
-        parser.error(f"Unsupported command: {args.command}")
-        return 2
+        if args.command != "serve" and not args.direct:
+            request: dict = {
+                "argv": list(sys.argv[1:] if argv is None else argv),
+                "root": str(Path(args.root).resolve()),
+            }
+            if args.command in BATCH_PROGRESS_COMMANDS:
+                request["records"] = read_jsonl_records(args.records)
+            response = call_server(serve_socket_path(args.root, args.gate), request)
+            if response is not None:
+                if "error" in response:
+                    print(f"ERROR: {response['error']}", file=sys.stderr)
+                else:
+                    print_json(response["payload"])
+                return int(response["exit_code"])
+            records = request.get("records")
+        else:
+            records = None
+
+        store = CoordinationStore(args.root, args.gate)
+        if args.command == "serve":
+            return serve(store)
+        exit_code, payload = dispatch_command(store, args, records)
+        print_json(payload)
+        return exit_code
     except CoordinationError as exc:
         print(f"ERROR: {exc}", file=sys.stderr)
         return 1
 
-
 if __name__ == "__main__":
     sys.exit(main())
@@ -11,12 +11,12 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from textwrap import indent
 
+import discovery
 import validate
 
 
 SKILL_ROOT = Path(__file__).resolve().parent.parent
 COMMON_ASSETS = SKILL_ROOT / "assets" / "bootstrap" / "common"
-SUPPORTED_TEST_EXTENSIONS = {".py", ".js", ".ts", ".go", ".rs", ".cs"}
 
 LANGUAGE_ALIASES = {
     "python": "py",
@@ -208,8 +208,9 @@ def iter_spec_files(specs_dir: Path) -> list[Path]:
 
 def build_spec_model(specs_dir: Path) -> SpecModel:
     parsed = []
+    cache = validate.open_parse_cache(specs_dir)
     for spec_file in iter_spec_files(specs_dir):
-        data = validate.parse_spec_file(spec_file)
+        data = validate.parse_spec_file(spec_file, cache)
         if data:
             parsed.append((spec_file, data))
 
@@ -378,16 +379,12 @@ def assert_bootstrap_preconditions(repo_root: Path, specs_dir: Path) -> None:
         raise SystemExit(f"`specs/` validation failed before bootstrap:\n{joined}")
 
     src_dir = repo_root / "src"
-    if src_dir.exists() and any(path.is_file() for path in src_dir.rglob("*")):
+    if next(discovery.iter_tree_entries(src_dir), None) is not None:
         raise SystemExit("`src/` already contains files. Use `vibespec triage gate` / `vibespec fix gate` instead.")
 
     tests_dir = repo_root / "tests"
-    if tests_dir.exists():
-        supported = [
-            path for path in tests_dir.rglob("*") if path.suffix.lower() in SUPPORTED_TEST_EXTENSIONS
-        ]
-        if supported:
-            raise SystemExit("`tests/` already contains supported test files. `vibespec bootstrap impl` only handles specs-only repos.")
+    if validate.has_supported_test_files(tests_dir):
+        raise SystemExit("`tests/` already contains supported test files. `vibespec bootstrap impl` only handles specs-only repos.")
 
 
 def language_commands(lang: str) -> tuple[str, str]:
@@ -0,0 +1,231 @@
+"""
+Shared file discovery for vibespec scripts.
+
+Directory trees are walked with `os.scandir`, pruning ignored directories
+before descending into them and optionally honouring `.gitignore` files.
+Set `VIBESPEC_DISCOVERY=git` to list files with one `git ls-files` call
+instead; inside a git worktree this also skips every git-ignored file, and
+outside one it falls back to the walker.
+"""
+from __future__ import annotations
+
+import os
+import re
+import subprocess
+from pathlib import Path
+from typing import Iterator
+
+GITIGNORE_FILENAME = ".gitignore"
+DISCOVERY_MODE_ENV = "VIBESPEC_DISCOVERY"
+DISCOVERY_MODES = ("git", "walk")
+GIT_LIST_FILES_COMMAND = ("git", "ls-files", "-z", "--cached", "--others", "--exclude-standard")
+
+
+class GitignoreRule:
+    """One `.gitignore` pattern, scoped to the directory that declared it."""
+
+    def __init__(self, base: str, pattern: str):
+        self.negate = pattern.startswith("!")
+        if self.negate:
+            pattern = pattern[1:]
+        self.dir_only = pattern.endswith("/")
+        pattern = pattern.rstrip("/")
+        self.anchored = "/" in pattern
+        self.base = base
+        self.regex = re.compile(gitignore_pattern_to_regex(pattern.lstrip("/")))
+
+    def matches(self, rel_path: str, is_dir: bool) -> bool:
+        if self.dir_only and not is_dir:
+            return False
+        if self.base:
+            if not rel_path.startswith(self.base + "/"):
+                return False
+            rel_path = rel_path[len(self.base) + 1 :]
+        candidate = rel_path if self.anchored else rel_path.rsplit("/", 1)[-1]
+        return self.regex.fullmatch(candidate) is not None
+
+
+def gitignore_pattern_to_regex(pattern: str) -> str:
+    parts: list[str] = []
+    index = 0
+    while index < len(pattern):
+        char = pattern[index]
+        if pattern.startswith("**/", index):
+            parts.append("(?:.*/)?")
+            index += 3
+        elif pattern.startswith("**", index):
+            parts.append(".*")
+            index += 2
+        elif char == "*":
+            parts.append("[^/]*")
+            index += 1
+        elif char == "?":
+            parts.append("[^/]")
+            index += 1
+        elif char == "[":
+            end = pattern.find("]", index + 1)
+            if end == -1:
+                parts.append(re.escape(char))
+                index += 1
+            else:
+                body = pattern[index + 1 : end].replace("\\", "\\\\")
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                parts.append(f"[{body}]")
+                index = end + 1
+        elif char == "\\" and index + 1 < len(pattern):
+            parts.append(re.escape(pattern[index + 1]))
+            index += 2
+        else:
+            parts.append(re.escape(char))
+            index += 1
+    return "".join(parts)
+
+
+def load_gitignore_rules(directory: str, base: str) -> list[GitignoreRule]:
+    try:
+        with open(os.path.join(directory, GITIGNORE_FILENAME), encoding="utf-8") as handle:
+            lines = handle.read().splitlines()
+    except OSError:
+        return []
+    rules: list[GitignoreRule] = []
+    for raw_line in lines:
+        line = raw_line.rstrip()
+        if not line or line.startswith("#"):
+            continue
+        rules.append(GitignoreRule(base, line))
+    return rules
+
+
+def is_gitignored(rules: list[GitignoreRule], rel_path: str, is_dir: bool) -> bool:
+    ignored = False
+    for rule in rules:
+        if rule.matches(rel_path, is_dir):
+            ignored = not rule.negate
+    return ignored
+
+
+def iter_tree_entries(
+    root: Path,
+    ignored_dirs: set[str] | frozenset[str] = frozenset(),
+    respect_gitignore: bool = False,
+) -> Iterator[os.DirEntry]:
+    """Yield file entries under `root` in sorted depth-first order.
+
+    Directories named in `ignored_dirs` are skipped without being listed, and
+    symlinked directories are not followed. The yielded `os.DirEntry` objects
+    carry cached type and stat data so callers need not re-stat each path.
+    """
+    if not root.is_dir():
+        return
+    yield from _walk(str(root), "", ignored_dirs, [] if respect_gitignore else None)
+
+
+def _walk(
+    directory: str,
+    rel_dir: str,
+    ignored_dirs: set[str] | frozenset[str],
+    rules: list[GitignoreRule] | None,
+) -> Iterator[os.DirEntry]:
+    if rules is not None:
+        rules = rules + load_gitignore_rules(directory, rel_dir)
+    try:
+        with os.scandir(directory) as iterator:
+            entries = sorted(iterator, key=lambda entry: entry.name)
+    except OSError:
+        return
+    for entry in entries:
+        rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+        try:
+            is_dir = entry.is_dir(follow_symlinks=False)
+        except OSError:
+            continue
+        if is_dir:
+            if entry.name in ignored_dirs:
+                continue
+            if rules and is_gitignored(rules, rel_path, True):
+                continue
+            yield from _walk(entry.path, rel_path, ignored_dirs, rules)
+            continue
+        if rules and is_gitignored(rules, rel_path, False):
+            continue
+        try:
+            if not entry.is_file():
+                continue
+        except OSError:
+            continue
+        yield entry
+
+
+def discovery_mode(mode: str | None = None) -> str:
+    mode = (mode or os.environ.get(DISCOVERY_MODE_ENV) or "walk").strip().lower()
+    return mode if mode in DISCOVERY_MODES else "walk"
+
+
+def git_listed_files(root: Path) -> list[str] | None:
+    """Tracked and untracked-but-not-ignored files under `root`, relative to it.
+
+    Returns `None` when `root` is not inside a git worktree (or git is missing),
+    and also when git lists nothing, so callers fall back to walking the tree.
+    Entries are sorted component-wise to match the walker's depth-first order.
+    """
+    if not root.is_dir():
+        return None
+    try:
+        completed = subprocess.run(GIT_LIST_FILES_COMMAND, cwd=root, capture_output=True, check=False)
+    except OSError:
+        return None
+    if completed.returncode != 0:
+        return None
+    listed = {os.fsdecode(raw) for raw in completed.stdout.split(b"\0") if raw}
+    if not listed:
+        return None
+    return sorted(listed, key=lambda rel_path: rel_path.split("/"))
+
+
+def iter_tree_files(
+    root: Path,
+    ignored_dirs: set[str] | frozenset[str] = frozenset(),
+    respect_gitignore: bool = False,
+    mode: str | None = None,
+) -> Iterator[Path]:
+    """Yield files under `root` by walking, or from `git ls-files` in git mode.
+
+    Both backends skip directories named in `ignored_dirs`. The git listing
+    already excludes ignored files, so `respect_gitignore` only affects the walker.
+    """
+    listed = git_listed_files(root) if discovery_mode(mode) == "git" else None
+    if listed is None:
+        for entry in iter_tree_entries(root, ignored_dirs, respect_gitignore):
+            yield Path(entry.path)
+        return
+    for rel_path in listed:
+        parts = rel_path.split("/")
+        if ignored_dirs and any(part in ignored_dirs for part in parts[:-1]):
+            continue
+        path = root / rel_path
+        # `--cached` still lists tracked files deleted from the worktree.
+        if path.is_file():
+            yield path
+
+
+def glob_tree_files(root: Path, patterns: list[str], mode: str | None = None) -> list[Path]:
+    """Files under `root` matching each glob pattern in turn, without duplicates."""
+    listed = git_listed_files(root) if discovery_mode(mode) == "git" else None
+    matched: list[Path] = []
+    seen: set[Path] = set()
+    for pattern in patterns:
+        if listed is None:
+            candidates = sorted(path for path in root.glob(pattern) if path.is_file())
+        else:
+            regex = re.compile(gitignore_pattern_to_regex(pattern))
+            candidates = sorted(
+                root / rel_path
+                for rel_path in listed
+                if regex.fullmatch(rel_path) and (root / rel_path).is_file()
+            )
+        for path in candidates:
+            if path not in seen:
+                seen.add(path)
+                matched.append(path)
+    return matched
@@ -7,14 +7,38 @@ import os
 import re
 import sys
 import ast
+import cProfile
+import json
+import mmap
+import hashlib
+import tempfile
+import subprocess
+import time
 import yaml
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from pathlib import Path
 import argparse
 
+try:
+    from . import discovery
+except ImportError:
+    import discovery
+
 SUPPORTED_TEST_EXTENSIONS = {'.py', '.js', '.ts', '.go', '.rs', '.cs'}
 IMPORT_CHECK_EXTENSIONS = {'.py', '.js', '.ts', '.go', '.rs'}
 IGNORED_TEST_DIRS = {'bin', 'obj', '.git', '.hg', '.svn', '.pytest_cache', 'node_modules', 'target', '.venv', 'venv'}
 STATUS_ORDER = {"skeleton": 1, "logic": 2, "system": 3}
+# Bump whenever parse_spec_file output changes so cached parses are invalidated.
+PARSER_VERSION = 2
+PARSE_CACHE_DIRNAME = 'vibespec-cache'
+PARSE_CACHE_MAX_ENTRIES = 4096
+PARSE_CACHE_MANIFEST = 'manifest.idx'
+# Byte markers every annotation or C# contract method must contain; files
+# without them are skipped before decoding and AST parsing.
+VERIFY_SPEC_MARKER = b'verify_spec'
+CSHARP_CONTRACT_MARKER = b'Contracts_'
 VERIFY_SPEC_PATTERNS = [
     re.compile(
         r'(?m)^\s*@verify_spec\(\s*["\']([^"\']+)["\'](?:\s*,\s*mode\s*=\s*["\']([^"\']+)["\'])?'
@@ -58,17 +82,10 @@ def extract_rules_from_l1(references: dict) -> list:
     except yaml.YAMLError:
         return []
 
-def is_ignored_test_path(path: Path) -> bool:
-    return any(part in IGNORED_TEST_DIRS for part in path.parts)
-
-def iter_test_files(tests_root: Path, extensions: set) -> iter:
-    if not tests_root.exists():
-        return
-    for test_file in tests_root.rglob("*"):
-        if test_file.is_dir() or is_ignored_test_path(test_file):
-            continue
-        if test_file.suffix.lower() in extensions:
-            yield test_file
+def iter_test_files(tests_root: Path, extensions: set, respect_gitignore: bool = False) -> iter:
+    for path in discovery.iter_tree_files(tests_root, IGNORED_TEST_DIRS, respect_gitignore):
+        if path.suffix.lower() in extensions:
+            yield path
 
 def has_supported_test_files(tests_root: Path) -> bool:
     return any(True for _ in iter_test_files(tests_root, SUPPORTED_TEST_EXTENSIONS))
@@ -102,11 +119,106 @@ def resolve_tests_root(references_dir: Path, requested_tests_dir: Path) -> tuple
         )
     return requested_tests_dir, warnings
 
+PROFILE_COUNTERS = ('files_read', 'bytes_read', 'ast_parses', 'regex_evals')
+
+class ValidationProfile:
+    """Per-phase wall/CPU time and I/O counters collected for `--profile`.
+
+    Phases are sequential: `enter` closes the running phase before opening the
+    next, and counters are attributed to whichever phase is running.
+    """
+
+    def __init__(self):
+        self.phases = {}
+        self.current = None
+        self._started = None
+
+    def enter(self, name: str | None):
+        now = (time.perf_counter(), time.process_time())
+        if self.current is not None:
+            stats = self.phases[self.current]
+            stats['wall_ms'] += (now[0] - self._started[0]) * 1000
+            stats['cpu_ms'] += (now[1] - self._started[1]) * 1000
+        self.current, self._started = name, now
+        if name is not None and name not in self.phases:
+            self.phases[name] = {'wall_ms': 0.0, 'cpu_ms': 0.0, **{counter: 0 for counter in PROFILE_COUNTERS}}
+
+    def count(self, counter: str, amount: int = 1):
+        if self.current is not None:
+            self.phases[self.current][counter] += amount
+
+    def as_dict(self) -> dict:
+        phases = [{'phase': name, **stats} for name, stats in self.phases.items()]
+        totals = {key: sum(phase[key] for phase in phases) for key in ('wall_ms', 'cpu_ms', *PROFILE_COUNTERS)}
+        return {'phases': phases, 'total': totals}
+
+    def format_table(self) -> str:
+        data = self.as_dict()
+        columns = ('wall_ms', 'cpu_ms', *PROFILE_COUNTERS)
+        lines = [f"   {'phase':<16}" + "".join(f"{column:>13}" for column in columns)]
+        for row in data['phases'] + [{'phase': 'total', **data['total']}]:
+            cells = "".join(
+                f"{row[column]:>13.1f}" if isinstance(row[column], float) else f"{row[column]:>13}"
+                for column in columns
+            )
+            lines.append(f"   {row['phase']:<16}{cells}")
+        return "\n".join(lines)
+
+ACTIVE_PROFILE: ValidationProfile | None = None
+
+def profile_phase(name: str | None):
+    if ACTIVE_PROFILE is not None:
+        ACTIVE_PROFILE.enter(name)
+
+def profile_count(counter: str, amount: int = 1):
+    if ACTIVE_PROFILE is not None:
+        ACTIVE_PROFILE.count(counter, amount)
+
+def profile_read(size: int):
+    if ACTIVE_PROFILE is not None:
+        ACTIVE_PROFILE.count('files_read')
+        ACTIVE_PROFILE.count('bytes_read', size)
+
+@contextmanager
+def activate_profile(profile: ValidationProfile | None):
+    """Route phase marks and counters to `profile` for the duration of the block."""
+    global ACTIVE_PROFILE
+    previous, ACTIVE_PROFILE = ACTIVE_PROFILE, profile
+    try:
+        yield profile
+    finally:
+        if profile is not None:
+            profile.enter(None)
+        ACTIVE_PROFILE = previous
+
 def read_text_if_possible(path: Path) -> str | None:
     try:
-        return path.read_text(encoding='utf-8', errors='ignore')
+        content = path.read_text(encoding='utf-8', errors='ignore')
     except Exception:
         return None
+    profile_read(len(content))
+    return content
+
+def file_contains_marker(path: Path, markers: tuple) -> bool | None:
+    """Search raw file bytes for any marker; None means the file could not be mapped."""
+    try:
+        with open(path, 'rb') as handle:
+            size = os.fstat(handle.fileno()).st_size
+            profile_read(size)
+            if size == 0:
+                return False
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return any(mapped.find(marker) != -1 for marker in markers)
+    except (OSError, ValueError):
+        return None
+
+def file_stamp(path: Path) -> tuple:
+    """Return `(mtime_ns, size)` for change detection, or an empty tuple if unavailable."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return ()
+    return (stat.st_mtime_ns, stat.st_size)
 
 def merge_test_status(test_metadata: dict, spec_id: str, status: str):
     current = test_metadata.get(spec_id)
@@ -149,6 +261,7 @@ def decorator_name(node: ast.AST) -> str | None:
 
 def scan_python_verify_spec_annotations(content: str) -> list:
     matches = []
+    profile_count('ast_parses')
     try:
         tree = ast.parse(content)
     except SyntaxError:
@@ -191,6 +304,7 @@ def scan_test_file_verify_specs(test_file: Path, content: str) -> list:
 
 def scan_verify_spec_annotations(content: str) -> list:
     matches = []
+    profile_count('regex_evals', len(VERIFY_SPEC_PATTERNS))
     for pattern in VERIFY_SPEC_PATTERNS:
         for match in pattern.finditer(content):
             spec_id = match.group(1)
@@ -210,8 +324,45 @@ def extract_covers_l0_targets(body: str) -> set[str]:
                 targets.add(normalized)
     return targets
 
+class TraceabilityIndex:
+    """L1 `Covers L0` targets and export suffixes, built once per validation run."""
+
+    def __init__(self, references: dict):
+        self.item_covers = {}
+        self.covered_l0 = set()
+        self.export_suffixes = {}
+        for file_path, data in references.items():
+            if data['layer'] != 1:
+                continue
+            for item_id, item_data in data['items'].items():
+                targets = extract_covers_l0_targets(item_data.get('body', ''))
+                self.item_covers[(file_path, item_id)] = targets
+                self.covered_l0.update(targets)
+            # Section-level `> Covers L0:` annotations count as coverage too.
+            self.covered_l0.update(extract_covers_l0_targets(data.get('body', '')))
+            for export_id in data['exports']:
+                self._index_suffixes(export_id, export_id)
+                if export_id.endswith('_CMD'):
+                    self._index_suffixes(export_id[:-len('_CMD')], export_id)
+
+    def _index_suffixes(self, stem: str, export_id: str):
+        parts = stem.split('.')
+        for start in range(1, len(parts)):
+            self.export_suffixes.setdefault('.'.join(parts[start:]), export_id)
+
+    def covers_for(self, file_path, item_id: str) -> set:
+        return self.item_covers.get((file_path, item_id), set())
+
+    def covers_l0(self, l0_item_id: str, suffix: str) -> bool:
+        return (
+            l0_item_id in self.covered_l0
+            or suffix in self.covered_l0
+            or suffix in self.export_suffixes
+        )
+
 def scan_csharp_contract_methods(content: str) -> list:
     matches = []
+    profile_count('regex_evals')
     pattern = re.compile(
         r'\[(?:Fact|Theory)(?:Attribute)?(?P<args>\s*\([^)]*\))?\]\s*'
         r'(?:\[[^\]]+\]\s*)*'
@@ -227,49 +378,260 @@ def scan_csharp_contract_methods(content: str) -> list:
         matches.append((f"CONTRACTS.{section}.{name}", status))
     return matches
 
-def apply_custom_rules(rules: list, references: dict) -> tuple:
-    """Apply project-specific rules extracted from L1."""
-    errors, warnings = [], []
-    for rule in rules:
-        rule_id = rule.get('id', 'UNKNOWN')
-        layer = rule.get('layer')
-        rule_type = rule.get('type')
-        severity = rule.get('severity', 'warning')
-        message = rule.get('description', f"Rule {rule_id} violation")
-        
+class CustomRulePlan:
+    """`VIBE_SPEC_RULES` compiled once, so each item body is scanned once for all rules.
+
+    Rules are indexed by layer and `match_header`; all forbidden terms share a
+    single lookahead alternation, and patterns are compiled up front.
+    """
+
+    def __init__(self, rules: list):
+        self.rules = []
+        self.by_layer = {}
+        term_rules = {}
+        for index, rule in enumerate(rules):
+            rule_id = rule.get('id', 'UNKNOWN')
+            rule_type = rule.get('type')
+            compiled = {
+                'index': index,
+                'type': rule_type,
+                'severity': rule.get('severity', 'warning'),
+                'message': rule.get('description', f"Rule {rule_id} violation"),
+                'match_header': rule.get('match_header'),
+                'pattern': None,
+                'always': False,
+            }
+            if rule_type == 'forbidden_terms':
+                for term in rule.get('terms') or []:
+                    term = str(term)
+                    if not term:
+                        compiled['always'] = True
+                    term_rules.setdefault(term, set()).add(index)
+            elif rule_type in ('forbidden_pattern', 'required_pattern') and rule.get('pattern'):
+                compiled['pattern'] = re.compile(rule['pattern'])
+            self.rules.append(compiled)
+            self.by_layer.setdefault(str(rule.get('layer')), []).append(compiled)
+
+        # A lookahead match reports the longest term starting at each position;
+        # every shorter term that is its prefix occurs there too.
+        terms = sorted((term for term in term_rules if term), key=len, reverse=True)
+        self.term_hits = {
+            term: set().union(*(term_rules[other] for other in terms if term.startswith(other)))
+            for term in terms
+        }
+        self.terms_re = (
+            re.compile('(?=(' + '|'.join(re.escape(term) for term in terms) + '))') if terms else None
+        )
+
+    def rules_for(self, layer) -> list:
+        applicable = self.by_layer.get(str(layer), [])
+        if str(layer) != 'all':
+            applicable = applicable + self.by_layer.get('all', [])
+        return applicable
+
+    def forbidden_term_hits(self, body: str) -> set:
+        hits = set()
+        if self.terms_re is not None:
+            profile_count('regex_evals')
+            for match in self.terms_re.finditer(body):
+                hits |= self.term_hits[match.group(1)]
+        return hits
+
+    def apply(self, references: dict) -> tuple:
+        violations = []
+        sequence = 0
         for spec_id, data in references.items():
-            if layer != 'all' and str(data['layer']) != str(layer):
+            layer_rules = self.rules_for(data['layer'])
+            if not layer_rules:
                 continue
-
             for item_id, item_data in data.get('items', {}).items():
+                sequence += 1
                 header = item_data.get('header', '')
-                body = item_data.get('body', '')
-                match_header = rule.get('match_header')
-                if match_header and match_header not in header:
+                applicable = [
+                    rule for rule in layer_rules
+                    if not rule['match_header'] or rule['match_header'] in header
+                ]
+                if not applicable:
                     continue
-                
-                violation = False
-                if rule_type == 'forbidden_terms':
-                    for term in rule.get('terms', []):
-                        if term in body: violation = True; break
-                elif rule_type == 'forbidden_pattern':
-                    pattern = rule.get('pattern', '')
-                    if pattern and re.search(pattern, body): violation = True
-                elif rule_type == 'required_pattern':
-                    pattern = rule.get('pattern', '')
-                    if pattern and not re.search(pattern, body): violation = True
-                
-                if violation:
-                    msg = f"{spec_id}: {message}. Item `{item_id}`."
-                    if severity == 'error': errors.append(msg)
-                    else: warnings.append(msg)
-    return errors, warnings
-
-def parse_spec_file(spec_file: Path) -> dict:
+                body = item_data.get('body', '')
+                term_hits = None
+                for rule in applicable:
+                    violation = False
+                    if rule['type'] == 'forbidden_terms':
+                        if term_hits is None:
+                            term_hits = self.forbidden_term_hits(body)
+                        violation = rule['always'] or rule['index'] in term_hits
+                    elif rule['pattern'] is not None:
+                        profile_count('regex_evals')
+                        found = rule['pattern'].search(body) is not None
+                        violation = found if rule['type'] == 'forbidden_pattern' else not found
+                    if violation:
+                        violations.append(
+                            (rule['index'], sequence, rule['severity'], f"{spec_id}: {rule['message']}. Item `{item_id}`.")
+                        )
+
+        # Report in rule-major order, matching the original rules x files x items loop.
+        errors, warnings = [], []
+        for _index, _sequence, severity, msg in sorted(violations, key=lambda v: (v[0], v[1])):
+            if severity == 'error': errors.append(msg)
+            else: warnings.append(msg)
+        return errors, warnings
+
+def apply_custom_rules(rules: list, references: dict) -> tuple:
+    """Apply project-specific rules extracted from L1."""
+    return CustomRulePlan(rules).apply(references)
+
+def resolve_git_dir(start: Path) -> Path | None:
+    """Find the git dir of the repository containing `start`, if any."""
+    for candidate in [start, *start.parents]:
+        dot_git = candidate / '.git'
+        if dot_git.is_dir():
+            return dot_git
+        if dot_git.is_file():
+            content = dot_git.read_text(encoding='utf-8').strip()
+            if content.startswith('gitdir:'):
+                return (candidate / content.split(':', 1)[1].strip()).resolve()
+    return None
+
+class SpecParseCache:
+    """On-disk parse results keyed by spec path and validated by content hash + parser version.
+
+    A small manifest maps each entry key to its spec path, so pruning never
+    has to open the entries themselves.
+    """
+
+    def __init__(self, cache_dir: Path, max_entries: int = PARSE_CACHE_MAX_ENTRIES):
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self._written: dict[str, str] = {}
+
+    def _entry_path(self, spec_file: Path) -> Path:
+        key = hashlib.sha1(str(spec_file.resolve()).encode('utf-8')).hexdigest()
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, spec_file: Path, content_hash: str) -> dict | None:
+        try:
+            entry = json.loads(self._entry_path(spec_file).read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+        if entry.get('parser_version') != PARSER_VERSION or entry.get('content_hash') != content_hash:
+            return None
+        result = entry.get('result')
+        if not isinstance(result, dict):
+            return None
+        result['file'] = str(spec_file)
+        return result
+
+    def put(self, spec_file: Path, content_hash: str, result: dict) -> None:
+        entry = {
+            'parser_version': PARSER_VERSION,
+            'content_hash': content_hash,
+            'path': str(spec_file.resolve()),
+            'result': result,
+        }
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=str(self.cache_dir), suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as handle:
+                json.dump(entry, handle, separators=(',', ':'))
+            entry_path = self._entry_path(spec_file)
+            os.replace(tmp_name, entry_path)
+        except OSError:
+            return
+        self._written[entry_path.stem] = entry['path']
+
+    def _read_manifest(self) -> dict[str, str]:
+        try:
+            manifest = json.loads((self.cache_dir / PARSE_CACHE_MANIFEST).read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return {}
+        return manifest if isinstance(manifest, dict) else {}
+
+    def prune(self) -> None:
+        """Evict entries whose spec file disappeared, then the oldest beyond `max_entries`.
+
+        Entries missing from the manifest are evicted too; they are simply re-parsed.
+        """
+        if not self.cache_dir.is_dir():
+            return
+        manifest = {**self._read_manifest(), **self._written}
+        self._written = {}
+        live = []
+        for entry_path in self.cache_dir.glob('*.json'):
+            source = manifest.get(entry_path.stem)
+            if not isinstance(source, str) or not Path(source).is_file():
+                entry_path.unlink(missing_ok=True)
+                continue
+            try:
+                live.append((entry_path.stat().st_mtime, entry_path))
+            except OSError:
+                continue
+        live.sort(reverse=True)
+        for _mtime, entry_path in live[self.max_entries:]:
+            entry_path.unlink(missing_ok=True)
+        kept = {entry_path.stem: manifest[entry_path.stem] for _mtime, entry_path in live[:self.max_entries]}
+        try:
+            fd, tmp_name = tempfile.mkstemp(dir=str(self.cache_dir), suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as handle:
+                json.dump(kept, handle, separators=(',', ':'))
+            os.replace(tmp_name, self.cache_dir / PARSE_CACHE_MANIFEST)
+        except OSError:
+            return
+
+def open_parse_cache(references_dir: Path) -> SpecParseCache | None:
+    """Return the repo-local parse cache under `.git/`, or None outside a git checkout."""
+    git_dir = resolve_git_dir(references_dir.resolve())
+    if git_dir is None:
+        return None
+    return SpecParseCache(git_dir / PARSE_CACHE_DIRNAME)
+
+class SpecRecord(dict):
+    """Parsed spec or item mapping whose `body` is sliced lazily from the source text.
+
+    Records store only a `[start, end)` `span` into the shared file content, so
+    item bodies are never copied at parse time and cache entries carry no text.
+    """
+
+    __slots__ = ('_text',)
+
+    def __init__(self, text: str, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._text = text
+
+    def body(self) -> str:
+        start, end = dict.__getitem__(self, 'span')
+        # Item spans may run one past EOF: every body line ends with a newline.
+        return self._text[start:end] + ('\n' if start < end and end > len(self._text) else '')
+
+    def extend_to(self, end: int):
+        dict.__getitem__(self, 'span')[1] = end
+
+    def __getitem__(self, key):
+        if key == 'body':
+            return self.body()
+        return super().__getitem__(key)
+
+    def __contains__(self, key):
+        return key == 'body' or super().__contains__(key)
+
+    def get(self, key, default=None):
+        if key == 'body':
+            return self.body()
+        return super().get(key, default)
+
+def bind_spec_text(result: dict, content: str) -> SpecRecord:
+    """Reattach cached span-only parse output to the spec text it was parsed from."""
+    bound = SpecRecord(content, result)
+    bound['items'] = {
+        item_id: SpecRecord(content, item) for item_id, item in result.get('items', {}).items()
+    }
+    return bound
+
+def parse_spec_file(spec_file: Path, cache: SpecParseCache | None = None) -> dict:
     """Parse spec file, deriving layer/id from filename OR directory."""
     filename = spec_file.stem
     layer, spec_id = None, None
-    
+
     match = re.match(r'L(\d+)-(\w+)', filename)
     if match:
         layer, spec_id = int(match.group(1)), match.group(2)
@@ -278,8 +640,21 @@ def parse_spec_file(spec_file: Path) -> dict:
         match_parent = re.match(r'L(\d+)-(\w+)', parent_name)
         if match_parent: layer, spec_id = int(match_parent.group(1)), match_parent.group(2)
         else: return None
-    
+
     content = spec_file.read_text()
+    profile_read(len(content))
+    if cache is None:
+        return parse_spec_content(spec_file, content, layer, spec_id)
+    content_hash = hashlib.sha256(content.encode('utf-8', 'surrogatepass')).hexdigest()
+    cached = cache.get(spec_file, content_hash)
+    if cached is not None:
+        return bind_spec_text(cached, content)
+    result = parse_spec_content(spec_file, content, layer, spec_id)
+    cache.put(spec_file, content_hash, result)
+    return result
+
+def parse_spec_content(spec_file: Path, content: str, layer: int, spec_id: str) -> dict:
+    """Tokenize spec markdown into exports, references, and items."""
     fm_match = re.match(r'^---\n(.*?)\n---', content, re.DOTALL)
     version, body_start = None, 0
     if fm_match:
@@ -288,20 +663,21 @@ def parse_spec_file(spec_file: Path) -> dict:
         version = version_match.group(1) if version_match else None
         body_start = fm_match.end()
     
-    body = content[body_start:]
     exports, references, items = [], [], {}
     current_export, current_h2, current_h3 = None, None, None
-    lines = body.split('\n')
+    lines = content[body_start:].split('\n')
     in_code_block = False
-    
+    offset = body_start
+
     for i, line in enumerate(lines):
+        offset += len(line) + 1
         stripped = line.strip()
         if stripped.startswith('```') or stripped.startswith('~~~'):
             in_code_block = not in_code_block
-            if current_export and current_export in items: items[current_export]['body'] += line + '\n'
+            if current_export and current_export in items: items[current_export].extend_to(offset)
             continue
         if in_code_block:
-            if current_export and current_export in items: items[current_export]['body'] += line + '\n'
+            if current_export and current_export in items: items[current_export].extend_to(offset)
             continue
             
         h2_match = re.match(r'^## (?:\[([\w]+)\] )?([\w.]+)', stripped)
@@ -315,13 +691,13 @@ def parse_spec_file(spec_file: Path) -> dict:
                 if layer == 3: full_id = hid 
                 current_export = full_id
                 exports.append(full_id)
-                items[full_id] = {'header': stripped, 'body': '', 'line': i+1}
+                items[full_id] = SpecRecord(content, header=stripped, span=[offset, offset], line=i+1)
             else: current_export = None
             continue
 
         if stripped.startswith('### '):
             if layer == 3:
-                if current_export and current_export in items: items[current_export]['body'] += line + '\n'
+                if current_export and current_export in items: items[current_export].extend_to(offset)
                 continue
             hid = stripped[4:].strip()
             current_h3 = hid
@@ -335,13 +711,13 @@ def parse_spec_file(spec_file: Path) -> dict:
                      pass
                 current_export = full_id
                 exports.append(full_id)
-                items[full_id] = {'header': stripped, 'body': '', 'line': i+1}
+                items[full_id] = SpecRecord(content, header=stripped, span=[offset, offset], line=i+1)
             else: current_export = None
             continue
 
         if stripped.startswith('#### '):
             if layer == 3:
-                if current_export and current_export in items: items[current_export]['body'] += line + '\n'
+                if current_export and current_export in items: items[current_export].extend_to(offset)
                 continue
             hid = stripped[5:].strip()
             parent = current_h3 or current_h2
@@ -349,7 +725,7 @@ def parse_spec_file(spec_file: Path) -> dict:
                 full_id = f"{parent}.{hid}" if layer == 2 and parent else f"{spec_id}.{hid}"
                 current_export = full_id
                 exports.append(full_id)
-                items[full_id] = {'header': stripped, 'body': '', 'line': i+1}
+                items[full_id] = SpecRecord(content, header=stripped, span=[offset, offset], line=i+1)
             else: current_export = None
             continue
 
@@ -363,59 +739,187 @@ def parse_spec_file(spec_file: Path) -> dict:
                    full_id = f"{spec_id}.{hid}"
                 current_export = full_id
                 exports.append(full_id)
-                items[full_id] = {'header': stripped, 'body': '', 'line': i+1}
+                items[full_id] = SpecRecord(content, header=stripped, span=[offset, offset], line=i+1)
             else: current_export = None
             continue
 
         if current_export and current_export in items:
-            items[current_export]['body'] += line + '\n'
+            items[current_export].extend_to(offset)
             impl_matches = re.findall(r'Implements:\s*\[(?:Role|Component):\s*([A-Z][\w.]+)\]', line)
             impl_matches.extend(re.findall(r'_Implements:\s*([A-Z][\w.]+)_', line))
             for impl_id in impl_matches:
                 references.append({'id': impl_id, 'weight': 100, 'line': i+1, 'source_id': current_export})
 
-    return {'layer': layer, 'id': spec_id, 'version': version, 'exports': exports, 'references': references, 'file': str(spec_file), 'items': items, 'body': body}
+    return SpecRecord(
+        content, layer=layer, id=spec_id, version=version, exports=exports, references=references,
+        file=str(spec_file), items=items, span=[body_start, len(content)],
+    )
 
-def scan_existing_tests(tests_root: Path) -> dict:
-    """Scan tests and identify implementation phases (Skeleton, Logic, System)."""
-    test_metadata = {}
-    for test_file in iter_test_files(tests_root, SUPPORTED_TEST_EXTENSIONS):
-        content = read_text_if_possible(test_file)
-        if content is None:
-            continue
+def scan_imports(content: str) -> list:
+    imports = []
+    profile_count('regex_evals', 3)
+    imports.extend(re.findall(r'^\s*use\s+([a-zA-Z0-9_:]+)', content, re.MULTILINE))
+    imports.extend(re.findall(r'^\s*from\s+([a-zA-Z0-9_\.]+)', content, re.MULTILINE))
+    imports.extend(re.findall(r'^\s*import\s+([a-zA-Z0-9_\.]+)', content, re.MULTILINE))
+    return imports
+
+@dataclass
+class TestFileRecord:
+    __test__ = False
 
-        for spec_id, status in scan_test_file_verify_specs(test_file, content):
-            merge_test_status(test_metadata, spec_id, status)
+    path: Path
+    stamp: tuple = ()
+    verify_specs: list = field(default_factory=list)
+    contract_methods: list = field(default_factory=list)
+    imports: list = field(default_factory=list)
 
-        if test_file.suffix.lower() == '.cs':
-            for spec_id, status in scan_csharp_contract_methods(content):
+class TestIndex:
+    """Per-file test annotations, contract methods, and imports gathered in one walk."""
+
+    __test__ = False
+
+    def __init__(self, tests_root: Path, records: list, collect_imports: bool = False):
+        self.tests_root = tests_root
+        self.records = records
+        self.collect_imports = collect_imports
+
+    @classmethod
+    def build(cls, tests_root: Path, collect_imports: bool = False, previous: "TestIndex | None" = None, import_scope: set | None = None) -> "TestIndex":
+        """Scan `tests_root`, reusing records from `previous` whose file stamp is unchanged.
+
+        With `import_scope`, imports are collected only for those resolved paths.
+        """
+        scope_names = {path.name for path in import_scope} if import_scope is not None else None
+        reusable = {}
+        if previous is not None and previous.collect_imports == collect_imports:
+            reusable = {record.path: record for record in previous.records}
+        records = []
+        for test_file in iter_test_files(tests_root, SUPPORTED_TEST_EXTENSIONS):
+            stamp = file_stamp(test_file)
+            prior = reusable.get(test_file)
+            if prior is not None and stamp and prior.stamp == stamp:
+                records.append(prior)
+                continue
+            suffix = test_file.suffix.lower()
+            wants_imports = collect_imports and suffix in IMPORT_CHECK_EXTENSIONS
+            if wants_imports and scope_names is not None:
+                wants_imports = test_file.name in scope_names and test_file.resolve() in import_scope
+            if suffix == '.cs':
+                markers = (VERIFY_SPEC_MARKER, CSHARP_CONTRACT_MARKER)
+            else:
+                markers = (VERIFY_SPEC_MARKER,)
+            if not wants_imports and file_contains_marker(test_file, markers) is False:
+                records.append(TestFileRecord(test_file, stamp))
+                continue
+            content = read_text_if_possible(test_file)
+            if content is None:
+                continue
+            record = TestFileRecord(test_file, stamp)
+            if VERIFY_SPEC_MARKER.decode() in content:
+                record.verify_specs = scan_test_file_verify_specs(test_file, content)
+            if suffix == '.cs' and CSHARP_CONTRACT_MARKER.decode() in content:
+                record.contract_methods = scan_csharp_contract_methods(content)
+            if wants_imports:
+                record.imports = scan_imports(content)
+            records.append(record)
+        return cls(tests_root, records, collect_imports)
+
+    def test_metadata(self) -> dict:
+        test_metadata = {}
+        for record in self.records:
+            for spec_id, status in record.verify_specs + record.contract_methods:
                 merge_test_status(test_metadata, spec_id, status)
-    return test_metadata
+        return test_metadata
+
+    def verify_spec_refs(self) -> dict:
+        refs = {}
+        for record in self.records:
+            for spec_id, _status in record.verify_specs:
+                refs.setdefault(spec_id, set()).add(record.path.name)
+        return refs
+
+    def csharp_contract_refs(self) -> dict:
+        refs = {}
+        for record in self.records:
+            for spec_id, _status in record.contract_methods:
+                refs.setdefault(spec_id, set()).add(record.path.name)
+        return refs
+
+def scan_existing_tests(tests_root: Path) -> dict:
+    """Scan tests and identify implementation phases (Skeleton, Logic, System)."""
+    return TestIndex.build(tests_root).test_metadata()
 
 def collect_verify_spec_refs(tests_root: Path) -> dict:
     """Collect all @verify_spec references and their source files."""
-    refs = {}
-    for test_file in iter_test_files(tests_root, SUPPORTED_TEST_EXTENSIONS):
-        content = read_text_if_possible(test_file)
-        if content is None:
-            continue
-        for spec_id, _status in scan_test_file_verify_specs(test_file, content):
-            refs.setdefault(spec_id, set()).add(test_file.name)
-    return refs
+    return TestIndex.build(tests_root).verify_spec_refs()
 
 def collect_csharp_contract_method_refs(tests_root: Path) -> dict:
     """Collect inferred L1 contract references from C# xUnit naming convention."""
-    refs = {}
-    for test_file in iter_test_files(tests_root, {'.cs'}):
-        content = read_text_if_possible(test_file)
-        if content is None:
-            continue
-        for spec_id, _status in scan_csharp_contract_methods(content):
-            refs.setdefault(spec_id, set()).add(test_file.name)
-    return refs
+    return TestIndex.build(tests_root).csharp_contract_refs()
+
+def spec_markdown_files(references_dir: Path) -> list:
+    return [
+        spec_file for spec_file in sorted(references_dir.glob('**/*.md'))
+        if not spec_file.name.startswith('.')
+    ]
 
-def validate_references(references_dir: Path, tests_dir: Path = None, project_prefix: str = None, allowed_imports: str = None) -> tuple:
+def load_spec_references(references_dir: Path, use_cache: bool = True) -> dict:
+    """Parse every spec under `references_dir`, reusing cached parses of unchanged files."""
+    profile_phase('spec_discovery')
+    cache = open_parse_cache(references_dir) if use_cache else None
+    spec_files = spec_markdown_files(references_dir)
+    profile_phase('parse_specs')
+    references = {}
+    for spec_file in spec_files:
+        result = parse_spec_file(spec_file, cache)
+        if result: references[str(spec_file)] = result
+    if cache is not None:
+        cache.prune()
+    return references
+
+def git_changed_paths(start: Path, rev: str) -> set | None:
+    """Resolved paths changed since `rev`, including untracked files; None if git cannot answer."""
+    def git(*args, cwd):
+        return subprocess.run(
+            ['git', *args], cwd=cwd, capture_output=True, text=True, check=True
+        ).stdout
+
+    try:
+        top = Path(git('rev-parse', '--show-toplevel', cwd=start).strip())
+        names = git('diff', '--name-only', '-z', rev, '--', cwd=top).split('\0')
+        names += git('ls-files', '-z', '--others', '--exclude-standard', cwd=top).split('\0')
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return {(top / name).resolve() for name in names if name}
+
+def validate_references(references_dir: Path, tests_dir: Path = None, project_prefix: str = None, allowed_imports: str = None, use_cache: bool = True, since: str = None) -> tuple:
+    references = load_spec_references(references_dir, use_cache)
+    scope, scope_warnings = None, []
+    if since:
+        scope = git_changed_paths(references_dir, since)
+        if scope is None:
+            scope_warnings.append(f"Could not diff against `{since}`; validated the full tree instead.")
+    errors, warnings, coverage, _test_index = check_references(
+        references_dir, references, tests_dir, project_prefix, allowed_imports, scope=scope
+    )
+    if scope is not None:
+        coverage['changed_files'] = len(scope)
+    return errors, scope_warnings + warnings, coverage
+
+def check_references(references_dir: Path, references: dict, tests_dir: Path = None, project_prefix: str = None, allowed_imports: str = None, previous_tests: "TestIndex | None" = None, scope: set | None = None) -> tuple:
+    """Run every check over already-parsed specs; returns errors, warnings, coverage and the test index.
+
+    With `scope` (resolved changed paths), the per-file checks -- L3 quality,
+    custom rules and black-box imports -- only examine those files, while
+    cross-file checks still see every spec and test.
+    """
     errors, warnings = [], []
+    scoped_references = references
+    if scope is not None:
+        scoped_references = {
+            file_path: data for file_path, data in references.items()
+            if Path(file_path).resolve() in scope
+        }
     coverage = {
         'total': 0, 
         'system': 0,
@@ -424,12 +928,9 @@ def validate_references(references_dir: Path, tests_dir: Path = None, project_pr
         'implemented': 0,
         'missing_ids': set()
     }
-    references = {}
-    for spec_file in sorted(references_dir.glob('**/*.md')):
-        if spec_file.name.startswith('.'): continue
-        result = parse_spec_file(spec_file)
-        if result: references[str(spec_file)] = result
+    test_index = None
 
+    profile_phase('index_exports')
     exports_map = {}
     testable_ids = set()
     for file_path, data in references.items():
@@ -447,12 +948,19 @@ def validate_references(references_dir: Path, tests_dir: Path = None, project_pr
                     testable_ids.add(item_id)
 
     if tests_dir:
+        profile_phase('scan_tests')
         effective_tests_dir, discovery_warnings = resolve_tests_root(references_dir, tests_dir)
         warnings.extend(discovery_warnings)
         coverage['tests_dir'] = str(effective_tests_dir)
-        test_metadata = scan_existing_tests(effective_tests_dir)
-        verify_refs = collect_verify_spec_refs(effective_tests_dir)
-        inferred_contract_refs = collect_csharp_contract_method_refs(effective_tests_dir)
+        test_index = TestIndex.build(
+            effective_tests_dir,
+            collect_imports=bool(project_prefix and allowed_imports),
+            previous=previous_tests,
+            import_scope=scope,
+        )
+        test_metadata = test_index.test_metadata()
+        verify_refs = test_index.verify_spec_refs()
+        inferred_contract_refs = test_index.csharp_contract_refs()
         
         system_ids = {sid for sid, status in test_metadata.items() if status == "system"}
         logic_ids = {sid for sid, status in test_metadata.items() if status == "logic"}
@@ -487,6 +995,8 @@ def validate_references(references_dir: Path, tests_dir: Path = None, project_pr
                 )
 
     # Structural L1-L0 Traceability (Section Level)
+    profile_phase('traceability')
+    traceability = TraceabilityIndex(references)
     for file_path, data in references.items():
         if data['layer'] == 1:
             l1_ids = {
@@ -496,7 +1006,7 @@ def validate_references(references_dir: Path, tests_dir: Path = None, project_pr
             for item_id, item_data in data['items'].items():
                 if not is_testable_l1_contract(item_id, l1_ids):
                     continue
-                explicit_targets = extract_covers_l0_targets(item_data.get('body', ''))
+                explicit_targets = traceability.covers_for(file_path, item_id)
                 if explicit_targets:
                     missing_targets = sorted(
                         target for target in explicit_targets if target not in exports_map
@@ -523,31 +1033,12 @@ def validate_references(references_dir: Path, tests_dir: Path = None, project_pr
                 elif item_id.startswith('VISION.') and re.match(r'^(?:\d+\.|-)\s+\*\*', header):
                     if re.search(r'\((?:HOLD(?:,\s*)?)?Context\)', header, re.IGNORECASE): continue
                     suffix = item_id.split('VISION.')[1] if 'VISION.' in item_id else item_id.replace('L0-VISION.', '')
-                    l1_hit = False
-                    # Build explicit coverage set from L1 annotations: "> Covers L0: ITEM1, ITEM2"
-                    explicit_l0_coverage = set()
-                    for l1_file, l1_data in references.items():
-                        if l1_data['layer'] == 1:
-                            for l1_item_id, l1_item_data in l1_data.get('items', {}).items():
-                                explicit_l0_coverage.update(
-                                    extract_covers_l0_targets(l1_item_data.get('body', ''))
-                                )
-                            # Also check section-level Traces to annotations for > Covers L0:
-                            explicit_l0_coverage.update(extract_covers_l0_targets(l1_data.get('body', '')))
-                    if item_id in explicit_l0_coverage or suffix in explicit_l0_coverage:
-                        l1_hit = True
-                    else:
-                        for l1_file, l1_data in references.items():
-                            if l1_data['layer'] == 1:
-                                for l1_item in l1_data['exports']:
-                                    if l1_item.endswith(f".{suffix}") or l1_item.endswith(f".{suffix}_CMD"):
-                                        l1_hit = True
-                                        break
-                    if not l1_hit:
+                    if not traceability.covers_l0(item_id, suffix):
                         errors.append(f"L0_L1_COVERAGE Error: L0 bullet item `{item_id}` has no tracking coverage in L1. Every substantive L0 item MUST have a corresponding L1 Contract.")
 
     # L3 Detailed Quality Checks
-    for file_path, data in references.items():
+    profile_phase('l3_quality')
+    for file_path, data in scoped_references.items():
         if data['layer'] != 3: continue
         for item_id, item_data in data['items'].items():
             header, body = item_data['header'], item_data['body']
@@ -560,44 +1051,162 @@ def validate_references(references_dir: Path, tests_dir: Path = None, project_pr
             elif '[workflow]' in header:
                 if '**Steps' not in body: warnings.append(f"L3 Quality: `{item_id}` (Workflow) missing `**Steps**...` section.")
 
+    profile_phase('custom_rules')
     custom_rules = extract_rules_from_l1(references)
     if custom_rules:
-        ce, cw = apply_custom_rules(custom_rules, references)
+        ce, cw = apply_custom_rules(custom_rules, scoped_references)
         errors.extend(ce); warnings.extend(cw)
         
     if tests_dir and project_prefix and allowed_imports:
-        effective_tests_dir, _ = resolve_tests_root(references_dir, tests_dir)
-        for test_file in iter_test_files(effective_tests_dir, IMPORT_CHECK_EXTENSIONS):
-            content = read_text_if_possible(test_file)
-            if content is None:
-                continue
-            
-            imports = []
-            imports.extend(re.findall(r'^\s*use\s+([a-zA-Z0-9_:]+)', content, re.MULTILINE))
-            imports.extend(re.findall(r'^\s*from\s+([a-zA-Z0-9_\.]+)', content, re.MULTILINE))
-            imports.extend(re.findall(r'^\s*import\s+([a-zA-Z0-9_\.]+)', content, re.MULTILINE))
-            
-            for imp in imports:
+        profile_phase('import_check')
+        for record in test_index.records:
+            for imp in record.imports:
                 if imp.startswith(project_prefix):
                     if not re.search(allowed_imports, imp):
-                        errors.append(f"Black-Box Violation in {test_file.name}: Import `{imp}` is an internal path not matching allowed pattern `{allowed_imports}`.")
-            
-    return errors, warnings, coverage
+                        errors.append(f"Black-Box Violation in {record.path.name}: Import `{imp}` is an internal path not matching allowed pattern `{allowed_imports}`.")
+
+    profile_phase(None)
+    return errors, warnings, coverage, test_index
+
+class SpecWatcher:
+    """Keep parsed specs and the test index in memory across `--watch` polls.
+
+    Only spec and test files whose `(mtime_ns, size)` stamp changed are re-read;
+    the cross-file checks then re-run over the in-memory state.
+    """
+
+    def __init__(self, references_dir: Path, tests_dir: Path = None, project_prefix: str = None, allowed_imports: str = None, use_cache: bool = True):
+        self.references_dir = references_dir
+        self.tests_dir = tests_dir
+        self.project_prefix = project_prefix
+        self.allowed_imports = allowed_imports
+        self.cache = open_parse_cache(references_dir) if use_cache else None
+        self.spec_stamps = {}
+        self.references = {}
+        self.test_index = None
+        self.test_stamps = None
+        self.result = None
+
+    def refresh_specs(self) -> list:
+        """Re-parse added or modified specs and drop deleted ones; returns the changed paths."""
+        changed = []
+        stamps, references = {}, {}
+        for spec_file in spec_markdown_files(self.references_dir):
+            key = str(spec_file)
+            stamps[key] = file_stamp(spec_file)
+            if key in self.spec_stamps and self.spec_stamps[key] == stamps[key]:
+                if key in self.references:
+                    references[key] = self.references[key]
+                continue
+            changed.append(key)
+            result = parse_spec_file(spec_file, self.cache)
+            if result:
+                references[key] = result
+        changed.extend(sorted(set(self.spec_stamps) - set(stamps)))
+        self.spec_stamps, self.references = stamps, references
+        return changed
+
+    def refresh_test_stamps(self) -> bool:
+        """Return True when any supported test file was added, removed, or modified."""
+        if not self.tests_dir:
+            return False
+        tests_root = Path(self.result[2].get('tests_dir', self.tests_dir)) if self.result else self.tests_dir
+        stamps = (tests_root, {
+            test_file: file_stamp(test_file)
+            for test_file in iter_test_files(tests_root, SUPPORTED_TEST_EXTENSIONS)
+        })
+        changed = stamps != self.test_stamps
+        self.test_stamps = stamps
+        return changed
+
+    def poll(self) -> list | None:
+        """Refresh changed inputs; returns diagnostic diff lines, or None when nothing changed."""
+        changed_specs = self.refresh_specs()
+        tests_changed = self.refresh_test_stamps()
+        if self.result is not None and not changed_specs and not tests_changed:
+            return None
+        previous = self.result
+        errors, warnings, coverage, self.test_index = check_references(
+            self.references_dir, self.references, self.tests_dir,
+            self.project_prefix, self.allowed_imports, previous_tests=self.test_index,
+        )
+        self.result = (errors, warnings, coverage)
+        if self.cache is not None and changed_specs:
+            self.cache.prune()
+        lines = []
+        if previous is None:
+            lines.extend(f"   + ❌ ERROR: {e}" for e in errors)
+            lines.extend(f"   + ⚠️  WARNING: {w}" for w in warnings)
+        else:
+            lines.extend(diff_diagnostics(previous[0], errors, "❌ ERROR"))
+            lines.extend(diff_diagnostics(previous[1], warnings, "⚠️  WARNING"))
+        summary = f"{len(errors)} error(s), {len(warnings)} warning(s)"
+        if coverage['total'] > 0:
+            summary += f", {coverage['implemented']}/{coverage['total']} contracts implemented"
+        if previous is None:
+            changes = f"initial scan of {len(self.references)} spec file(s)"
+        else:
+            changes = f"{len(changed_specs)} spec file(s) changed" + (", tests changed" if tests_changed else "")
+        return [f"[watch] {changes}: {summary}"] + lines
+
+def diff_diagnostics(before: list, after: list, label: str) -> list:
+    """Render `+`/`-` lines for messages added to or resolved from `before`."""
+    before_counts, after_counts = Counter(before), Counter(after)
+    resolved, added = before_counts - after_counts, after_counts - before_counts
+    lines = [f"   - {label}: {message}" for message in resolved]
+    lines.extend(f"   + {label}: {message}" for message in added)
+    return lines
+
+def watch_references(watcher: SpecWatcher, interval: float) -> int:
+    """Poll until interrupted, printing a diagnostics diff whenever specs or tests change."""
+    try:
+        while True:
+            started = time.perf_counter()
+            lines = watcher.poll()
+            if lines is not None:
+                elapsed_ms = (time.perf_counter() - started) * 1000
+                print(f"{lines[0]} ({elapsed_ms:.1f} ms)")
+                for line in lines[1:]: print(line)
+                sys.stdout.flush()
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        return 1 if watcher.result and watcher.result[0] else 0
 
 def main():
     parser = argparse.ArgumentParser(description="Unified Vibespec Validator & Auditor")
     parser.add_argument('specs_dir', nargs='?', default='./specs'); parser.add_argument('--tests-dir', default='./tests/specs')
     parser.add_argument('--project-prefix', help='Prefix of project modules for black-box test enforcement (e.g. datanix)')
     parser.add_argument('--allowed-imports', help='Regex pattern for allowed project imports in L1 tests')
+    parser.add_argument('--no-cache', action='store_true', help=f'Re-parse every spec instead of reusing `.git/{PARSE_CACHE_DIRNAME}/`')
+    parser.add_argument('--since', metavar='REV', help='Limit per-file checks (L3 quality, custom rules, black-box imports) to files changed since REV')
+    parser.add_argument('--profile', nargs='?', const='table', choices=['table', 'json'], help='Report per-phase timings and I/O counters on stderr (default format: table)')
+    parser.add_argument('--profile-dump', metavar='PATH', help='Write a cProfile/pstats dump of the validation run to PATH')
+    parser.add_argument('--watch', action='store_true', help='Keep running and re-validate only what changed, printing diagnostic diffs')
+    parser.add_argument('--interval', type=float, default=1.0, help='Polling interval in seconds for --watch (default: 1.0)')
     args = parser.parse_args()
     specs_p = Path(args.specs_dir)
     raw_tests_p = Path(args.tests_dir)
     tests_p = raw_tests_p if raw_tests_p.is_absolute() else specs_p.parent / raw_tests_p
     if not specs_p.exists(): return 1
+
+    if args.watch:
+        print(f"=== Vibespec Unified Validator (watching {specs_p}, Ctrl-C to stop) ===\n")
+        watcher = SpecWatcher(specs_p, tests_p, args.project_prefix, args.allowed_imports, use_cache=not args.no_cache)
+        return watch_references(watcher, args.interval)
     
     print(f"=== Vibespec Unified Validator ===\n")
-    errors, warnings, coverage = validate_references(specs_p, tests_p, args.project_prefix, args.allowed_imports)
+    profile = ValidationProfile() if args.profile else None
+    profiler = cProfile.Profile() if args.profile_dump else None
+    if profiler is not None:
+        profiler.enable()
+    with activate_profile(profile):
+        errors, warnings, coverage = validate_references(specs_p, tests_p, args.project_prefix, args.allowed_imports, use_cache=not args.no_cache, since=args.since)
+    if profiler is not None:
+        profiler.disable()
+        profiler.dump_stats(args.profile_dump)
     print(f"✔️  Step 1: Structural Validation")
+    if 'changed_files' in coverage:
+        print(f"   Scope: per-file checks limited to {coverage['changed_files']} file(s) changed since {args.since}")
     for e in errors: print(f"   ❌ ERROR: {e}")
     for w in warnings: print(f"   ⚠️  WARNING: {w}")
     if not errors and not warnings: print("   ✅ Specs are structuraly valid.")
@@ -642,6 +1251,14 @@ def main():
             print(f"   👉 [SYSTEM] Promote {coverage['logic']} Phase 2 tests to Phase 3 System/E2E verification.")
         elif pct_system == 100:
             print("   👉 [COMPLETE] L1 is fully verified at System level. Proceed to Code implementation.")
+
+    if profile is not None:
+        if args.profile == 'json':
+            print(json.dumps(profile.as_dict(), indent=2), file=sys.stderr)
+        else:
+            print(f"\n⏱️  Validation Profile\n{profile.format_table()}", file=sys.stderr)
+    if args.profile_dump:
+        print(f"cProfile stats written to {args.profile_dump} (inspect with `python -m pstats {args.profile_dump}`)", file=sys.stderr)
     
     return 1 if errors else 0
 
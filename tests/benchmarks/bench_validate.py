@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Synthetic-scale benchmarks for the vibespec validator.
+
+Generates deterministic spec and test trees at several scales, times
+`parse_spec_file`, `scan_existing_tests` and `validate_references`, and
+optionally compares the medians against a stored baseline.
+
+Usage (from the repository root):
+    python -m tests.benchmarks.bench_validate --scales 1,10 --output bench.json
+    python -m tests.benchmarks.bench_validate --baseline bench.json --threshold 0.25
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from src.skills.vibespec.scripts.validate import (
+    parse_spec_file,
+    scan_existing_tests,
+    spec_markdown_files,
+    validate_references,
+)
+
+# Item counts at scale 1x; every count grows linearly with the scale factor.
+BASE_COUNTS = {
+    "l0_bullets": 20,
+    "l1_leaves_per_bullet": 5,
+    "l2_components": 20,
+    "l3_interfaces": 20,
+    "l3_workflows": 20,
+    "custom_rules": 10,
+    "white_box_tests": 20,
+}
+DEFAULT_SCALES = (1, 10)
+DEFAULT_REPEAT = 3
+DEFAULT_THRESHOLD = 0.25
+BENCHMARKS = ("parse_spec_file", "scan_existing_tests", "validate_references")
+FRONTMATTER = "---\nversion: 1.0.0\n---\n"
+
+
+def scaled_counts(scale: int) -> dict:
+    counts = {key: value * scale for key, value in BASE_COUNTS.items()}
+    counts["l1_leaves_per_bullet"] = BASE_COUNTS["l1_leaves_per_bullet"]
+    counts["custom_rules"] = min(BASE_COUNTS["custom_rules"] * scale, 200)
+    return counts
+
+
+def build_rules_block(count: int, rng: random.Random) -> str:
+    lines = ["```yaml", "rules:"]
+    for index in range(count):
+        kind = ("forbidden_terms", "forbidden_pattern", "required_pattern")[index % 3]
+        lines.append(f"  - id: RULE_{index:04d}")
+        lines.append(f"    layer: {rng.choice(['1', '2', '3', 'all'])}")
+        lines.append(f"    type: {kind}")
+        if kind == "forbidden_terms":
+            terms = ", ".join(f'"forbidden_{index}_{term}"' for term in range(3))
+            lines.append(f"    terms: [{terms}]")
+        elif kind == "forbidden_pattern":
+            lines.append(f"    pattern: 'TODO\\({index}\\)'")
+        else:
+            lines.append("    match_header: '[interface]'")
+            lines.append("    pattern: 'Rationale'")
+        lines.append("    severity: warning")
+    lines.append("```")
+    return "\n".join(lines)
+
+
+def generate_tree(root: Path, scale: int, seed: int = 0) -> dict:
+    """Write a deterministic `specs/` + `tests/` tree under `root`; returns its item counts."""
+    rng = random.Random(f"{seed}:{scale}")
+    counts = scaled_counts(scale)
+    specs_dir, tests_dir = root / "specs", root / "tests"
+    specs_dir.mkdir(parents=True)
+    tests_dir.mkdir(parents=True)
+
+    features = [f"FEATURE_{index:05d}" for index in range(counts["l0_bullets"])]
+    l0 = [FRONTMATTER, "# L0: Synthetic Vision\n", "### VISION.SCOPE\n"]
+    l0.extend(f"- **{feature}**: User wants {feature.lower()} to behave.\n" for feature in features)
+    (specs_dir / "L0-VISION.md").write_text("".join(l0))
+
+    leaves = []
+    l1 = [FRONTMATTER, "# L1: Synthetic Contracts\n", "## CONTRACTS.VIBE_SPEC_RULES\n"]
+    l1.append(build_rules_block(counts["custom_rules"], rng) + "\n")
+    for feature in features:
+        l1.append(f"## CONTRACTS.{feature}\n> Covers L0: VISION.{feature}\n")
+        for rule in range(counts["l1_leaves_per_bullet"]):
+            leaf = f"CONTRACTS.{feature}.RULE_{rule}"
+            leaves.append(leaf)
+            l1.append(f"### {leaf}\n> Covers L0: VISION.{feature}\n- MUST hold invariant {rule}.\n")
+    (specs_dir / "L1-CONTRACTS.md").write_text("".join(l1))
+
+    l2 = [FRONTMATTER, "# L2: Synthetic Architecture\n", "## COMPONENTS\n"]
+    for index in range(counts["l2_components"]):
+        l2.append(f"### COMPONENTS.Component{index:05d}\n- Owns {rng.choice(features)}.\n")
+    (specs_dir / "L2-ARCHITECTURE.md").write_text("".join(l2))
+
+    l3 = [FRONTMATTER, "# L3: Synthetic Runtime\n"]
+    for index in range(counts["l3_interfaces"]):
+        l3.append(
+            f"## [interface] Interface{index:05d}\n"
+            f"_Implements: COMPONENTS.Component{index % max(counts['l2_components'], 1):05d}_\n"
+            "**Rationale**: keeps callers decoupled.\n"
+            "```python\ndef handle(request: dict) -> dict: ...\n```\n"
+        )
+    for index in range(counts["l3_workflows"]):
+        l3.append(f"## [workflow] Workflow{index:05d}\n**Steps**:\n1. Receive.\n2. Respond.\n")
+    (specs_dir / "L3-RUNTIME.md").write_text("".join(l3))
+
+    for index in range(0, len(leaves), 10):
+        chunk, language = leaves[index : index + 10], ("py", "js")[(index // 10) % 2]
+        if language == "py":
+            body = "".join(
+                f'@verify_spec("{leaf}")\ndef test_{leaf.lower().replace(".", "_")}():\n'
+                + ("    pytest.skip('todo')\n" if rng.random() < 0.3 else "    assert True\n")
+                for leaf in chunk
+            )
+            (tests_dir / f"test_contracts_{index:06d}.py").write_text("import pytest\n" + body)
+        else:
+            body = "".join(f'// @verify_spec("{leaf}")\ntest("{leaf}", () => {{}});\n' for leaf in chunk)
+            (tests_dir / f"contracts_{index:06d}.test.js").write_text(body)
+    for index in range(counts["white_box_tests"]):
+        (tests_dir / f"test_internal_{index:05d}.py").write_text(
+            "from myproj.internal import engine\n\n"
+            f"def test_engine_{index}():\n    assert engine.run({index}) is not None\n"
+        )
+    return {**counts, "l1_leaves": len(leaves)}
+
+
+def time_call(func, repeat: int) -> dict:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - started) * 1000)
+    return {"min_ms": min(samples), "median_ms": statistics.median(samples)}
+
+
+def run_scale(scale: int, repeat: int, seed: int) -> dict:
+    root = Path(tempfile.mkdtemp(prefix=f"vibespec-bench-{scale}x-"))
+    try:
+        counts = generate_tree(root, scale, seed)
+        specs_dir, tests_dir = root / "specs", root / "tests"
+        spec_files = spec_markdown_files(specs_dir)
+        timings = {
+            "parse_spec_file": time_call(lambda: [parse_spec_file(path) for path in spec_files], repeat),
+            "scan_existing_tests": time_call(lambda: scan_existing_tests(tests_dir), repeat),
+            "validate_references": time_call(
+                lambda: validate_references(specs_dir, tests_dir, "myproj", r"^myproj\.api", use_cache=False),
+                repeat,
+            ),
+        }
+        return {"counts": counts, "timings": timings}
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+def compare_to_baseline(results: dict, baseline: dict, threshold: float) -> list:
+    """Return `(scale, benchmark, baseline_ms, current_ms, ratio)` rows that regressed."""
+    regressions = []
+    for scale, current in results["scales"].items():
+        previous = baseline.get("scales", {}).get(scale)
+        if not previous:
+            continue
+        for name in BENCHMARKS:
+            before = previous["timings"].get(name, {}).get("median_ms")
+            after = current["timings"][name]["median_ms"]
+            if before and after / before > 1 + threshold:
+                regressions.append((scale, name, before, after, after / before))
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the vibespec validator on synthetic spec trees.")
+    parser.add_argument("--scales", default=",".join(str(scale) for scale in DEFAULT_SCALES), help="Comma-separated scale factors (e.g. 1,10,100)")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Timed runs per benchmark; the median is compared")
+    parser.add_argument("--seed", type=int, default=0, help="Generator seed")
+    parser.add_argument("--output", help="Write results JSON to this path (reuse it later as --baseline)")
+    parser.add_argument("--baseline", help="Compare medians against a previous results JSON")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="Allowed slowdown ratio before failing (default: 0.25 = 25%%)")
+    args = parser.parse_args()
+
+    scales = [int(scale) for scale in args.scales.split(",") if scale.strip()]
+    results = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": args.repeat,
+            "seed": args.seed,
+        },
+        "scales": {},
+    }
+    print(f"{'scale':>6} {'benchmark':<22} {'min ms':>10} {'median ms':>10}")
+    for scale in scales:
+        entry = run_scale(scale, args.repeat, args.seed)
+        results["scales"][f"{scale}x"] = entry
+        for name in BENCHMARKS:
+            timing = entry["timings"][name]
+            print(f"{scale:>5}x {name:<22} {timing['min_ms']:>10.1f} {timing['median_ms']:>10.1f}")
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2) + "\n")
+        print(f"\nResults written to {args.output}")
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())
+        regressions = compare_to_baseline(results, baseline, args.threshold)
+        if regressions:
+            print(f"\nRegressions beyond {args.threshold:.0%}:")
+            for scale, name, before, after, ratio in regressions:
+                print(f"   {scale} {name}: {before:.1f} ms -> {after:.1f} ms ({ratio:.2f}x)")
+            return 1
+        print(f"\nNo regressions beyond {args.threshold:.0%} against {args.baseline}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
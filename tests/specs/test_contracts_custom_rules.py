@@ -2,7 +2,7 @@ import unittest
 import shutil
 import tempfile
 from pathlib import Path
-from src.skills.vibespec.scripts.validate import validate_references
+from src.skills.vibespec.scripts.validate import apply_custom_rules, validate_references
 from tests.specs.conftest import verify_spec
 
 class TestContractsCustomRules(unittest.TestCase):
@@ -50,5 +50,32 @@ This contains bad_word.
         rule_triggered = any("NO_FORBIDDEN" in e and "BadAlgo" in e for e in errors)
         self.assertTrue(rule_triggered, "Custom rule should trigger error on forbidden term")
 
+    @verify_spec("CONTRACTS.CUSTOM_RULES")
+    def test_compiled_plan_matches_overlapping_terms_per_rule(self):
+        """CONTRACTS.CUSTOM_RULES: Shared term scanning MUST still attribute overlapping terms to every rule."""
+        rules = [
+            {"id": "SHORT", "layer": 3, "type": "forbidden_terms", "terms": ["TODO"], "severity": "error"},
+            {"id": "LONG", "layer": "all", "type": "forbidden_terms", "terms": ["TODO:"]},
+            {"id": "RATIONALE", "layer": 3, "type": "required_pattern", "pattern": r"\*\*Rationale\*\*",
+             "match_header": "[algorithm]"},
+        ]
+        references = {
+            "L3-RUNTIME.md": {"layer": 3, "items": {
+                "Algo": {"header": "## [algorithm] Algo", "body": "TODO: fill in\n"},
+                "Note": {"header": "## [decision] Note", "body": "- TODO later\n"},
+            }},
+        }
+
+        errors, warnings = apply_custom_rules(rules, references)
+
+        self.assertEqual(errors, [
+            "L3-RUNTIME.md: Rule SHORT violation. Item `Algo`.",
+            "L3-RUNTIME.md: Rule SHORT violation. Item `Note`.",
+        ])
+        self.assertEqual(warnings, [
+            "L3-RUNTIME.md: Rule LONG violation. Item `Algo`.",
+            "L3-RUNTIME.md: Rule RATIONALE violation. Item `Algo`.",
+        ])
+
 if __name__ == "__main__":
     unittest.main()
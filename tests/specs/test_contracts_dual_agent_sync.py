@@ -1,13 +1,24 @@
+import contextlib
+import io
 import json
+import os
 import subprocess
 import sys
 import tempfile
+import threading
 import time
 import unittest
 from pathlib import Path
+from unittest import mock
 
 from tests.specs.conftest import verify_spec
-from src.skills.vibespec.scripts.agent_sync import CoordinationError, CoordinationStore
+from src.skills.vibespec.scripts import agent_sync
+from src.skills.vibespec.scripts.agent_sync import (
+    PROTOCOL_VERSION,
+    CoordinationError,
+    CoordinationStore,
+    TurnLock,
+)
 
 
 class TestContractsDualAgentSync(unittest.TestCase):
@@ -199,6 +210,572 @@ class TestContractsDualAgentSync(unittest.TestCase):
         self.assertEqual(verdict["state"]["worker_state"], "dormant")
         self.assertFalse(verdict["state"]["fix_gate_open"])
 
+    @verify_spec("CONTRACTS.DUAL_AGENT_GATE")
+    def test_wait_for_turn_wakes_on_state_write_not_poll_interval(self):
+        """CONTRACTS.DUAL_AGENT_GATE.BLOCKING_RUNNERS: Handoffs MUST wake waiters without waiting out the poll interval."""
+        store = CoordinationStore(self.root)
+        store.init_task()
+        result = {}
+
+        def wait():
+            started = time.monotonic()
+            result["verdict"] = CoordinationStore(self.root).wait_for_turn(
+                "fix", poll_interval=30.0, timeout=20.0
+            )
+            result["elapsed"] = time.monotonic() - started
+
+        waiter = threading.Thread(target=wait)
+        waiter.start()
+        time.sleep(0.2)
+        state = store.read_state()
+        state.update(
+            worker_state="released",
+            fix_gate_open=True,
+            open_defects=["R1-1"],
+            state_revision=state["state_revision"] + 1,
+        )
+        store._write_state(state)
+        waiter.join(timeout=10)
+
+        self.assertFalse(waiter.is_alive())
+        self.assertEqual(result["verdict"]["result"], "actionable")
+        self.assertLess(result["elapsed"], 5.0)
+        self.assertEqual(list((store.sync_dir / "wakeup").rglob("*.fifo")), [])
+
+    @verify_spec("CONTRACTS.DUAL_AGENT_GATE")
+    def test_wait_for_turn_rechecks_a_handoff_written_during_the_first_inspect(self):
+        """CONTRACTS.DUAL_AGENT_GATE.BLOCKING_RUNNERS: A handoff racing the first inspect MUST NOT be lost."""
+        store = CoordinationStore(self.root)
+        store.init_task()
+        inspect_actor = store.inspect_actor
+
+        def inspect_then_hand_off(actor, worker=None):
+            verdict = inspect_actor(actor, worker)
+            if verdict["result"] == "wait":
+                state = store.read_state()
+                state.update(
+                    worker_state="released",
+                    fix_gate_open=True,
+                    open_defects=["R1-1"],
+                    state_revision=state["state_revision"] + 1,
+                )
+                store._write_state(state)
+            return verdict
+
+        with mock.patch.object(store, "inspect_actor", side_effect=inspect_then_hand_off):
+            verdict = store.wait_for_turn("fix", poll_interval=0.05, timeout=2.0)
+
+        self.assertEqual(verdict["result"], "actionable")
+
+    @verify_spec("CONTRACTS.DUAL_AGENT_GATE")
+    def test_turn_lock_waits_for_holder_and_breaks_stale_locks(self):
+        """CONTRACTS.DUAL_AGENT_GATE: Transitions MUST queue on the turn lock and recover from dead holders."""
+        lease_dir = self.root / "lease"
+        lease_dir.mkdir()
+        (lease_dir / "turn.lock").mkdir()
+        (lease_dir / "turn.owner.json").write_text('{"pid": 999999999, "host": "gone"}')
+        lock = TurnLock(lease_dir, timeout=5.0)
+
+        with lock.hold():
+            self.assertEqual(lock.read_owner()["pid"], os.getpid())
+        self.assertEqual(lock.stats()["stale_breaks"], 1)
+        self.assertIsNone(lock.read_owner())
+
+        held, release = threading.Event(), threading.Event()
+
+        def holder():
+            with TurnLock(lease_dir).hold():
+                held.set()
+                release.wait(5)
+
+        thread = threading.Thread(target=holder)
+        thread.start()
+        held.wait(5)
+        with self.assertRaisesRegex(CoordinationError, "held by another transition"):
+            with TurnLock(lease_dir, timeout=0.05).hold():
+                pass
+        threading.Timer(0.1, release.set).start()
+        with lock.hold():
+            pass
+        thread.join(5)
+
+        stats = lock.stats()
+        self.assertEqual(stats["contended_acquisitions"], 1)
+        self.assertGreater(stats["max_wait_ms"], 0)
+
+    @verify_spec("CONTRACTS.DUAL_AGENT_GATE")
+    def test_repo_gate_profile_is_memoized_until_the_file_changes(self):
+        """CONTRACTS.DUAL_AGENT_GATE: The repo gate profile SHOULD be validated once per file revision."""
+        for directory in ("specs", "src", "tests"):
+            (self.root / directory).mkdir()
+        (self.root / "specs" / "L1-CONTRACTS.md").write_text("# L1\n")
+        profile = {
+            "version": PROTOCOL_VERSION,
+            "triage": {"spec_roots": ["specs"], "source_roots": ["src"]},
+            "coverage": {
+                "black_box": {"test_globs": ["tests/**/*.py"], "contract_spec": "specs/L1-CONTRACTS.md"},
+                "white_box": {"test_globs": ["tests/**/*.py"], "source_roots": ["src"]},
+            },
+            "run": {"commands": ["python -m pytest -q"]},
+        }
+        profile_path = self.root / "specs" / "gate-profile.json"
+        profile_path.write_text(json.dumps(profile))
+        store = CoordinationStore(self.root)
+
+        with mock.patch.object(store, "_read_repo_gate_profile", wraps=store._read_repo_gate_profile) as reader:
+            first = store._load_repo_gate_profile()
+            first["run"]["commands"].clear()
+            second = store._load_repo_gate_profile()
+            self.assertEqual(reader.call_count, 1)
+            self.assertEqual(second["run"]["commands"][0]["argv"], ["python", "-m", "pytest", "-q"])
+
+            profile["run"]["commands"] = ["make test"]
+            profile_path.write_text(json.dumps(profile))
+            os.utime(profile_path, ns=(time.time_ns(), time.time_ns() + 1_000_000))
+            self.assertEqual(store._load_repo_gate_profile()["run"]["commands"][0]["argv"], ["make", "test"])
+            self.assertEqual(reader.call_count, 2)
+
+        profile_path.unlink()
+        with self.assertRaisesRegex(CoordinationError, "Missing required repo gate profile"):
+            store._load_repo_gate_profile()
+
+    @verify_spec("CONTRACTS.DUAL_AGENT_GATE")
+    def test_white_box_suggestions_use_a_cached_token_index(self):
+        """CONTRACTS.DUAL_AGENT_GATE: White-box suggestions SHOULD read each test file once per change."""
+        (self.root / "tests").mkdir()
+        (self.root / "tests" / "test_engine.py").write_text("from pkg.engine import run\n")
+        (self.root / "tests" / "test_paths.py").write_text('SOURCE = "src/pkg/loader.py"\n')
+        tests = ["tests/test_engine.py", "tests/test_paths.py"]
+        store = CoordinationStore(self.root)
+
+        index = store._white_box_test_index(tests)
+        self.assertEqual(store._suggested_white_box_tests("src/pkg/engine.py", tests, index), tests[:1])
+        self.assertEqual(store._suggested_white_box_tests("src/pkg/loader.py", tests, index), tests[1:])
+        self.assertEqual(store._suggested_white_box_tests("src/pkg/unrelated.py", tests, index), tests)
+
+        with mock.patch.object(Path, "read_text", side_effect=AssertionError("re-read")):
+            self.assertEqual(store._white_box_test_index(tests), index)
+
+        (self.root / "tests" / "test_paths.py").write_text("from pkg import engine, loader_v2\n")
+        index = store._white_box_test_index(tests)
+        self.assertEqual(store._suggested_white_box_tests("src/pkg/engine.py", tests, index), tests)
+
+        (self.root / "tests" / "test_paths.py").write_text('load("my-module.py")\nimport "./foo.test"\n')
+        index = store._white_box_test_index(tests)
+        self.assertEqual(store._suggested_white_box_tests("src/pkg/my-module.py", tests, index), tests[1:])
+        self.assertEqual(store._suggested_white_box_tests("web/foo.test.ts", tests, index), tests[1:])
+        self.assertEqual(store._suggested_white_box_tests("src/pkg/my.py", tests, index), tests[1:])
+
+    @verify_spec("CONTRACTS.DUAL_AGENT_GATE")
+    def test_progress_unit_table_is_materialized_once_per_submission(self):
+        """CONTRACTS.DUAL_AGENT_GATE: Progress units SHOULD be resolved from a per-submission table."""
+        units = [
+            {"unit_id": f"src-drift::src/app.py::{defect_type}", "target": "src/app.py", "defect_type": defect_type}
+            for defect_type in ("missing_contract", "dead_code")
+        ]
+        store = CoordinationStore(self.root)
+        with mock.patch.object(store, "_required_progress_units", return_value=units) as builder:
+            table = store._progress_unit_table(3, "src-drift")
+            self.assertIs(store._progress_unit_table(3, "src-drift"), table)
+            reloaded = CoordinationStore(self.root)._progress_unit_table(3, "src-drift")
+            self.assertEqual(builder.call_count, 1)
+
+        self.assertTrue((store.progress_dir / "submission-0003" / "src-drift.units.json").is_file())
+        self.assertEqual(reloaded.unit_ids, {unit["unit_id"] for unit in units})
+        self.assertEqual(reloaded.matching("src/app.py", "dead_code"), [units[1]])
+        self.assertEqual(reloaded.matching("src/app.py", None), [])
+
+    @verify_spec("CONTRACTS.DUAL_AGENT_GATE")
+    def test_triage_progress_batch_publishes_in_one_transition(self):
+        """CONTRACTS.DUAL_AGENT_GATE: Batched progress MUST be validated as a whole and bump state once."""
+        units = [
+            {"unit_id": f"spec-drift::{spec}", "target": spec, "defect_type": None}
+            for spec in ("specs/L0-VISION.md", "specs/L1-CONTRACTS.md")
+        ]
+        store = CoordinationStore(self.root)
+        state = store.init_task()
+        entries = [
+            {"target": unit["target"], "decision": "aligned", "evidence_summary": "Read fully.", "evidence_files": [unit["target"]]}
+            for unit in units
+        ]
+        with mock.patch.object(store, "_required_progress_units", return_value=units):
+            with self.assertRaisesRegex(CoordinationError, "record 2: `specs/L9.md`"):
+                store.publish_triage_progress_batch(
+                    state["submission_id"], "spec-drift", [entries[0], {**entries[1], "target": "specs/L9.md"}]
+                )
+            with self.assertRaisesRegex(CoordinationError, "record 1: `evidence_files` must be a list of strings"):
+                store.publish_triage_progress_batch(
+                    state["submission_id"], "spec-drift", [{**entries[0], "evidence_files": units[0]["target"]}]
+                )
+            with self.assertRaisesRegex(CoordinationError, "record 2: `evidence_summary` must be a string"):
+                store.publish_triage_progress_batch(
+                    state["submission_id"], "spec-drift", [entries[0], {**entries[1], "evidence_summary": 1}]
+                )
+            with self.assertRaisesRegex(CoordinationError, "more than once"):
+                store.publish_triage_progress_batch(state["submission_id"], "spec-drift", [entries[0], entries[0]])
+            self.assertEqual(store._load_progress_records(state["submission_id"], "spec-drift"), {})
+            write_json_atomic = agent_sync.write_json_atomic
+            calls = []
+
+            def fail_second_write(path, payload):
+                if store.progress_dir in path.parents:
+                    calls.append(path)
+                    if len(calls) == 2:
+                        raise OSError("disk full")
+                write_json_atomic(path, payload)
+
+            with mock.patch.object(agent_sync, "write_json_atomic", side_effect=fail_second_write):
+                with self.assertRaisesRegex(OSError, "disk full"):
+                    store.publish_triage_progress_batch(state["submission_id"], "spec-drift", entries)
+            self.assertEqual(store._load_progress_records(state["submission_id"], "spec-drift"), {})
+
+            result = store.publish_triage_progress_batch(state["submission_id"], "spec-drift", entries)
+
+        self.assertEqual(len(result["progress_record_paths"]), 2)
+        self.assertEqual(result["state"]["state_revision"], state["state_revision"] + 1)
+        self.assertEqual(result["state"]["progress_record_count"], 2)
+        self.assertEqual(result["state"]["last_progress_unit_id"], units[1]["unit_id"])
+        self.assertEqual(
+            set(store._load_progress_records(state["submission_id"], "spec-drift")),
+            {unit["unit_id"] for unit in units},
+        )
+
+    @verify_spec("CONTRACTS.DUAL_AGENT_GATE")
+    def test_reviewer_pool_claims_units_through_expiring_leases(self):
+        """CONTRACTS.DUAL_AGENT_GATE: Pooled reviewers MUST publish only units they lease, and expired leases MUST re-queue."""
+        units = [
+            {"unit_id": f"spec-drift::specs/L{layer}.md", "target": f"specs/L{layer}.md", "defect_type": None}
+            for layer in range(3)
+        ]
+        store = CoordinationStore(self.root)
+        state = store.init_task()
+        submission_id = state["submission_id"]
+
+        def entry(unit):
+            return {"target": unit["target"], "decision": "aligned", "evidence_summary": "Read fully.", "evidence_files": [unit["target"]]}
+
+        with mock.patch.object(store, "_required_progress_units", return_value=units):
+            first = store.claim_review_units("reviewer-a", count=2, lease_seconds=60)
+            second = store.claim_review_units("reviewer-b", count=2, lease_seconds=60)
+            self.assertEqual(first["units"], units[:2])
+            self.assertEqual(second["units"], units[2:])
+            self.assertEqual(second["unclaimed_unit_count"], 0)
+
+            with self.assertRaisesRegex(CoordinationError, "leased to reviewer `reviewer-b`"):
+                store.publish_triage_progress_batch(submission_id, "spec-drift", [entry(units[2])], reviewer="reviewer-a")
+            result = store.publish_triage_progress_batch(submission_id, "spec-drift", [entry(units[2])], reviewer=" reviewer-b ")
+            self.assertEqual(result["state"]["progress_record_count"], 1)
+
+            with mock.patch.object(agent_sync.time, "time", return_value=time.time() + 120):
+                requeued = store.claim_review_units("reviewer-c", count=5)
+            self.assertEqual(requeued["units"], units[:2])
+            self.assertEqual(requeued["pending_unit_count"], 2)
+
+        records = store._load_progress_records(submission_id, "spec-drift")
+        self.assertEqual(records[units[2]["unit_id"]]["reviewer"], "reviewer-b")
+
+        review_phase = store._review_phase
+
+        def phase_then_finalize(state):
+            resolved = review_phase(state)
+            store._write_state(dict(store.read_state(), next_triage_class_index=1))
+            return resolved
+
+        with mock.patch.object(store, "_required_progress_units", return_value=units):
+            with mock.patch.object(store, "_review_phase", side_effect=phase_then_finalize):
+                with self.assertRaisesRegex(CoordinationError, "claim again"):
+                    store.claim_review_units("reviewer-a")
+
+    @verify_spec("CONTRACTS.DUAL_AGENT_GATE")
+    def test_sqlite_storage_keeps_progress_records_in_one_database(self):
+        """CONTRACTS.DUAL_AGENT_GATE: Progress storage SHOULD be selectable between JSON files and SQLite."""
+        units = [
+            {"unit_id": f"spec-drift::{spec}", "target": spec, "defect_type": None}
+            for spec in ("specs/L0-VISION.md", "specs/L1-CONTRACTS.md")
+        ]
+        with mock.patch.dict(os.environ, {agent_sync.STORAGE_BACKEND_ENV: "sqlite"}):
+            store = CoordinationStore(self.root)
+        self.assertIsInstance(store.storage, agent_sync.SqliteProgressStorage)
+        state = store.init_task()
+        submission_id = state["submission_id"]
+        entry = {"target": units[0]["target"], "decision": "aligned", "evidence_summary": "Read fully.", "evidence_files": [units[0]["target"]]}
+        with mock.patch.object(store, "_required_progress_units", return_value=units):
+            result = store.publish_triage_progress_batch(submission_id, "spec-drift", [entry])
+            with self.assertRaisesRegex(CoordinationError, "already exists"):
+                store.publish_triage_progress_batch(submission_id, "spec-drift", [entry])
+
+        self.assertTrue(result["progress_record_paths"][0].endswith(f"#progress/submission-{submission_id:04d}/spec-drift/{units[0]['unit_id']}"))
+        self.assertFalse((store.progress_dir / f"submission-{submission_id:04d}" / "spec-drift").exists())
+        records = store._load_progress_records(submission_id, "spec-drift")
+        self.assertEqual(list(records), [units[0]["unit_id"]])
+        self.assertEqual(records[units[0]["unit_id"]]["decision"], "aligned")
+        self.assertNotIn("reviewer", records[units[0]["unit_id"]])
+        with mock.patch.object(store, "_required_progress_units", return_value=units):
+            with self.assertRaisesRegex(CoordinationError, f"missing progress units: {units[1]['unit_id']}\\."):
+                store.publish_triage(submission_id, "accept", "spec-drift", evidence_summary="Read fully.", review_artifact="review.json")
+        with mock.patch.dict(os.environ, {agent_sync.STORAGE_BACKEND_ENV: "yaml"}):
+            with self.assertRaisesRegex(CoordinationError, "json, sqlite"):
+                CoordinationStore(self.root)
+
+    @verify_spec("CONTRACTS.DUAL_AGENT_GATE")
+    def test_multi_worker_gate_shards_repairs_and_merges_partial_submissions(self):
+        """CONTRACTS.DUAL_AGENT_GATE: Parallel fix workers MUST receive disjoint shards that merge into one submission."""
+        plan = [
+            {"id": "R1-1", "summary": "a", "defect_type": "quality", "repair_logic": "fix", "targets": ["src/a.py"]},
+            {"id": "R1-2", "summary": "b", "defect_type": "quality", "repair_logic": "fix", "targets": ["src/b.py"]},
+            {"id": "R1-3", "summary": "ac", "defect_type": "quality", "repair_logic": "fix", "targets": ["src/a.py", "src/c.py"]},
+            {"id": "R1-4", "summary": "c", "defect_type": "quality", "repair_logic": "fix", "targets": ["src/c.py"]},
+            {"id": "R1-5", "summary": "none", "defect_type": "quality", "repair_logic": "fix", "targets": []},
+        ]
+        shards = agent_sync.shard_repair_plan(plan, ["fix-1", "fix-2"], 100.0)
+        self.assertEqual(shards["fix-1"]["defect_ids"], ["R1-1", "R1-3", "R1-4"])
+        self.assertEqual(shards["fix-1"]["targets"], ["src/a.py", "src/c.py"])
+        self.assertEqual(shards["fix-2"]["defect_ids"], ["R1-2", "R1-5"])
+        self.assertEqual(shards["fix-2"]["lease_expires_at"], 100.0)
+        untargeted = [dict(defect, targets=[]) for defect in plan[:2]]
+        self.assertEqual(list(agent_sync.shard_repair_plan(untargeted, ["fix-1", "fix-2"], 100.0)), ["fix-1"])
+
+        store = CoordinationStore(self.root)
+        state = store.init_task(fix_workers=2)
+        self.assertEqual(state["coordination_model"], "coordinator-plus-n-workers")
+        fields, owner, worker_state = store.adapter.coverage_transition_fields(
+            report_id=1,
+            coverage_kind="white-box",
+            published_coverage_kinds=list(agent_sync.COVERAGE_KINDS),
+            open_defects=[defect["id"] for defect in plan],
+            active_repair_plan=plan,
+            next_coverage_kind_index=len(agent_sync.COVERAGE_KINDS),
+            fix_worker_count=2,
+        )
+        store._write_state(store.engine.transition(state, fields, active_owner=owner, worker_state=worker_state))
+
+        with self.assertRaisesRegex(CoordinationError, "fix-1, fix-2"):
+            store.inspect_actor("fix")
+        with mock.patch.object(store, "_deferred_run_plan", return_value=None):
+            packet = store.run_fix_pass(timeout=0, worker="fix-2")
+        self.assertEqual(packet["result"], "actionable")
+        self.assertEqual(packet["open_defects"], ["R1-2", "R1-5"])
+        with self.assertRaisesRegex(CoordinationError, "released to other shards: src/a.py"):
+            store.publish_submission("base", "head-2", ["src/a.py"], repair_responses={"R1-2": "fixed", "R1-5": "fixed"}, worker="fix-2")
+
+        state = store.publish_submission("base", "head-2", ["src/b.py"], repair_responses={"R1-2": "fixed", "R1-5": "fixed"}, worker="fix-2")
+        self.assertEqual(state["active_owner"], "fix")
+        self.assertEqual(state["fix_shards"]["fix-2"]["status"], "submitted")
+        self.assertEqual(store.inspect_actor("fix", "fix-2")["result"], "wait")
+
+        responses = {"R1-1": "fixed", "R1-3": "fixed", "R1-4": "fixed"}
+        state = store.publish_submission("base", "head-1", ["src/a.py", "src/c.py"], repair_responses=responses, worker="fix-1")
+        self.assertEqual(state["active_owner"], "triage")
+        self.assertEqual(state["fix_shards"], {})
+        merged = json.loads((store.submissions_dir / "submission-0001.json").read_text())
+        self.assertEqual(merged["head_rev"], "head-1")
+        self.assertEqual(set(merged["repair_responses"]), {defect["id"] for defect in plan})
+        self.assertEqual(merged["changed_files"], ["src/a.py", "src/c.py", "src/b.py"])
+        self.assertEqual(set(merged["partial_submissions"]), {"fix-1", "fix-2"})
+
+    @verify_spec("CONTRACTS.DUAL_AGENT_GATE")
+    def test_expired_fix_shard_can_be_reassigned_to_another_worker(self):
+        """CONTRACTS.DUAL_AGENT_GATE: A fix shard whose lease lapsed MUST be reassignable to another worker."""
+        plan = [
+            {"id": "R1-1", "summary": "a", "defect_type": "quality", "repair_logic": "fix", "targets": ["src/a.py"]},
+            {"id": "R1-2", "summary": "b", "defect_type": "quality", "repair_logic": "fix", "targets": ["src/b.py"]},
+        ]
+        store = CoordinationStore(self.root)
+        state = store.init_task(fix_workers=2)
+        fields, owner, worker_state = store.adapter.coverage_transition_fields(
+            report_id=1,
+            coverage_kind="white-box",
+            published_coverage_kinds=list(agent_sync.COVERAGE_KINDS),
+            open_defects=["R1-1", "R1-2"],
+            active_repair_plan=plan,
+            next_coverage_kind_index=len(agent_sync.COVERAGE_KINDS),
+            fix_worker_count=2,
+        )
+        store._write_state(store.engine.transition(state, fields, active_owner=owner, worker_state=worker_state))
+        self.assertGreater(store.read_state()["fix_shards"]["fix-1"]["lease_expires_at"], time.time())
+
+        with self.assertRaisesRegex(CoordinationError, "still leased"):
+            store.reassign_fix_shard("fix-1", "fix-2")
+        state = store.read_state()
+        state["fix_shards"]["fix-1"]["lease_expires_at"] = time.time() - 1
+        store._write_state(state)
+        with mock.patch.object(store, "_deferred_run_plan", return_value=None):
+            packet = store.run_fix_pass(timeout=0, worker="fix-1")
+            self.assertGreater(packet["fix_shard"]["lease_expires_at"], time.time())
+            revision = store.read_state()["state_revision"]
+            store.run_fix_pass(timeout=0, worker="fix-1")
+        self.assertEqual(store.read_state()["state_revision"], revision, "A fresh lease MUST NOT be rewritten")
+        with self.assertRaisesRegex(CoordinationError, "still leased"):
+            store.reassign_fix_shard("fix-1", "fix-2")
+
+        store.publish_submission("base", "head-2", ["src/b.py"], repair_responses={"R1-2": "fixed"}, worker="fix-2")
+        state = store.read_state()
+        state["fix_shards"]["fix-1"]["lease_expires_at"] = time.time() - 1
+        store._write_state(state)
+        state = store.reassign_fix_shard("fix-1", "fix-2")
+        shard = state["fix_shards"]["fix-2"]
+        self.assertEqual(list(state["fix_shards"]), ["fix-2"])
+        self.assertEqual((shard["status"], shard["defect_ids"]), ("released", ["R1-1"]))
+        self.assertEqual(shard["targets"], ["src/a.py", "src/b.py"])
+        self.assertTrue((self.root / shard["earlier_submissions"][0]).is_file())
+        self.assertEqual(store.inspect_actor("fix", "fix-1")["result"], "wait")
+        with self.assertRaisesRegex(CoordinationError, "no released shard"):
+            store.reassign_fix_shard("fix-1", "fix-2", force=True)
+
+        state = store.publish_submission("base", "head-1", ["src/a.py"], repair_responses={"R1-1": "fixed"}, worker="fix-2")
+        self.assertEqual(state["active_owner"], "triage")
+        merged = json.loads((store.submissions_dir / "submission-0001.json").read_text())
+        self.assertEqual(set(merged["partial_submissions"]), {"fix-2", "fix-2.earlier-1"})
+        self.assertEqual(merged["repair_responses"], {"R1-1": "fixed", "R1-2": "fixed"})
+        self.assertEqual(merged["head_rev"], "head-1")
+
+    @verify_spec("CONTRACTS.DUAL_AGENT_GATE")
+    def test_gate_namespaces_keep_separate_state_and_profile_scope(self):
+        """CONTRACTS.DUAL_AGENT_GATE: Gate namespaces MUST keep independent state and triage scope."""
+        for directory in ("specs/payments", "src/payments", "src/search", "tests"):
+            (self.root / directory).mkdir(parents=True)
+        (self.root / "specs" / "L1-CONTRACTS.md").write_text("# L1\n")
+        profile = {
+            "version": PROTOCOL_VERSION,
+            "triage": {"spec_roots": ["specs"], "source_roots": ["src"]},
+            "namespaces": {"payments": {"spec_roots": ["specs/payments"], "source_roots": ["src/payments"]}, "search": {"source_roots": ["src/search"]}},
+            "coverage": {
+                "black_box": {"test_globs": ["tests/**/*.py"], "contract_spec": "specs/L1-CONTRACTS.md"},
+                "white_box": {"test_globs": ["tests/**/*.py"], "source_roots": ["src"]},
+            },
+            "run": {"commands": ["python -m pytest -q"]},
+        }
+        (self.root / "specs" / "gate-profile.json").write_text(json.dumps(profile))
+
+        default_store = CoordinationStore(self.root)
+        payments = CoordinationStore(self.root, "payments")
+        default_store.init_task()
+        payments_state = payments.init_task()
+        default_store.mark_blocked("waiting on another team")
+
+        self.assertEqual(payments_state["gate"], "payments")
+        self.assertEqual(payments.read_state()["status"], "active")
+        self.assertNotEqual(payments.turn_lock.lock_path, default_store.turn_lock.lock_path)
+        self.assertEqual(payments._load_repo_gate_profile()["triage"], {"spec_roots": ["specs/payments"], "source_roots": ["src/payments"]})
+        self.assertEqual(CoordinationStore(self.root, "search")._load_repo_gate_profile()["triage"]["spec_roots"], ["specs"])
+        with self.assertRaisesRegex(CoordinationError, "namespaces.billing"):
+            CoordinationStore(self.root, "billing").init_task()
+        self.assertFalse(CoordinationStore(self.root, "billing").state_file.exists())
+        with self.assertRaisesRegex(CoordinationError, "must not contain"):
+            CoordinationStore(self.root, "all-defects-archived-v2")
+        with mock.patch.object(agent_sync, "call_server", side_effect=AssertionError("connected")):
+            with contextlib.redirect_stderr(io.StringIO()) as stderr, self.assertRaises(SystemExit):
+                agent_sync.main(["--root", str(self.root), "--namespace", "../../x", "state"])
+        self.assertIn("Gate namespace `../../x`", stderr.getvalue())
+
+        gates = {entry["gate"]: entry for entry in default_store.list_gates()["gates"]}
+        self.assertEqual(sorted(gates), ["all-defects", "payments", "search"])
+        self.assertEqual(gates["all-defects"]["status"], "blocked")
+        self.assertFalse(gates["all-defects"]["declared"])
+        self.assertEqual(gates["payments"]["status"], "active")
+        self.assertFalse(gates["search"]["initialized"])
+
+    @verify_spec("CONTRACTS.DUAL_AGENT_GATE")
+    def test_cli_forwards_to_a_running_server_and_falls_back_to_direct_mode(self):
+        """CONTRACTS.DUAL_AGENT_GATE: The CLI SHOULD reuse a resident server when one is listening."""
+        deep_root = self.root.joinpath(*["nested-directory"] * 12)
+        self.assertLess(len(os.fsencode(agent_sync.serve_socket_path(deep_root, "g" * 64))), 100)
+        gettempdir = mock.patch.object(agent_sync.tempfile, "gettempdir", return_value=str(self.root))
+        gettempdir.start()
+        self.addCleanup(gettempdir.stop)
+        socket_path = agent_sync.serve_socket_path(self.root)
+        agent_sync.ensure_serve_socket_dir(socket_path)
+        server = agent_sync.AgentSyncServer(CoordinationStore(self.root), socket_path)
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        try:
+            with mock.patch.object(agent_sync, "CoordinationStore", side_effect=AssertionError("direct mode")):
+                with contextlib.redirect_stdout(io.StringIO()) as stdout:
+                    self.assertEqual(agent_sync.main(["--root", str(self.root), "init"]), 0)
+                with contextlib.redirect_stderr(io.StringIO()) as stderr:
+                    self.assertEqual(agent_sync.main(["--root", str(self.root), "init"]), 1)
+            self.assertEqual(json.loads(stdout.getvalue())["active_owner"], "triage")
+            self.assertIn("already initialized", stderr.getvalue())
+        finally:
+            server.shutdown()
+            server.server_close()
+            thread.join(5)
+        socket_path.unlink()
+
+        with contextlib.redirect_stdout(io.StringIO()) as stdout:
+            self.assertEqual(agent_sync.main(["--root", str(self.root), "state"]), 0)
+        self.assertEqual(json.loads(stdout.getvalue())["command"], "state")
+
+    @verify_spec("CONTRACTS.DUAL_AGENT_GATE")
+    def test_discovery_snapshot_reuses_results_until_their_scope_changes(self):
+        """CONTRACTS.DUAL_AGENT_GATE: Runner discovery SHOULD be reused while the worktree is unchanged."""
+        self._init_git_repo()
+        (self.root / "src").mkdir()
+        (self.root / "tests").mkdir()
+        (self.root / "src" / "app.py").write_text("x = 1\n")
+        (self.root / "tests" / "test_app.py").write_text("def test_app(): pass\n")
+        (self.root / ".gitignore").write_text("tests/generated/\n")
+        git = ["git", "-c", "user.name=t", "-c", "user.email=t@example.com"]
+        subprocess.run(git + ["add", "."], cwd=self.root, check=True, capture_output=True)
+        subprocess.run(git + ["commit", "-m", "init"], cwd=self.root, check=True, capture_output=True)
+        store = CoordinationStore(self.root)
+        scan = mock.patch.object(store, "_scan_test_globs", wraps=store._scan_test_globs)
+
+        with scan as scanner:
+            for _ in range(2):
+                with store._discovery_snapshot_scope():
+                    self.assertEqual(store._resolve_test_globs(["tests/**/*.py"]), ["tests/test_app.py"])
+            self.assertEqual(scanner.call_count, 1)
+            self.assertTrue(store.discovery_snapshot_path.is_file())
+
+            (self.root / "src" / "app.py").write_text("x = 2\n")
+            with store._discovery_snapshot_scope():
+                store._resolve_test_globs(["tests/**/*.py"])
+            self.assertEqual(scanner.call_count, 1)
+
+            (self.root / "tests" / "test_more.py").write_text("def test_more(): pass\n")
+            with store._discovery_snapshot_scope():
+                self.assertEqual(
+                    store._resolve_test_globs(["tests/**/*.py"]),
+                    ["tests/test_app.py", "tests/test_more.py"],
+                )
+            self.assertEqual(scanner.call_count, 2)
+
+            generated = self.root / "tests" / "generated" / "test_gen.py"
+            generated.parent.mkdir()
+            generated.write_text("def test_gen(): pass\n")
+            with store._discovery_snapshot_scope():
+                self.assertIn("tests/generated/test_gen.py", store._resolve_test_globs(["tests/**/*.py"]))
+            generated.unlink()
+            with store._discovery_snapshot_scope():
+                self.assertNotIn("tests/generated/test_gen.py", store._resolve_test_globs(["tests/**/*.py"]))
+            self.assertEqual(scanner.call_count, 4)
+
+    @verify_spec("CONTRACTS.DUAL_AGENT_GATE")
+    def test_state_writes_append_journal_deltas_and_compact(self):
+        """CONTRACTS.DUAL_AGENT_GATE: State transitions SHOULD append deltas instead of rewriting the state file."""
+        store = CoordinationStore(self.root)
+        state = store.init_task()
+        snapshot = store.state_file.read_text()
+
+        with mock.patch.object(agent_sync, "JOURNAL_COMPACT_ENTRIES", 3):
+            for revision in range(1, 4):
+                state = dict(state, state_revision=state["state_revision"] + 1, last_event=f"event-{revision}")
+                store._write_state(state)
+            self.assertEqual(store.state_file.read_text(), snapshot)
+            self.assertEqual(len(store.journal.journal_path.read_text().splitlines()), 3)
+            with store.journal.journal_path.open("a") as journal:
+                journal.write('{"rev": 99, "set": {"last_event": "torn"')
+            self.assertEqual(CoordinationStore(self.root).read_state(), state)
+
+            state = dict(state, state_revision=state["state_revision"] + 1, open_defects=["R1-1"])
+            store._write_state(state)
+
+        self.assertEqual(json.loads(store.state_file.read_text()), state)
+        self.assertEqual(store.journal.journal_path.read_text(), "")
+        self.assertEqual(CoordinationStore(self.root).read_state(), state)
+        self.assertEqual(store.read_state(), state)
+
     @verify_spec("CONTRACTS.DUAL_AGENT_GATE")
     def test_triage_must_publish_defect_classes_in_priority_order(self):
         """CONTRACTS.DUAL_AGENT_GATE.TRIAGE_PRIORITY: Triage MUST classify in configured order."""
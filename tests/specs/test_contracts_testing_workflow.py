@@ -1,9 +1,13 @@
+import os
+import subprocess
 import unittest
 import shutil
 import tempfile
 from pathlib import Path
+from unittest import mock
 from tests.specs.conftest import verify_spec
-from src.skills.vibespec.scripts.validate import validate_references
+from src.skills.vibespec.scripts import discovery, validate
+from src.skills.vibespec.scripts.validate import iter_test_files, validate_references
 
 class TestContractsTestingWorkflow(unittest.TestCase):
     """Verifies CONTRACTS.TESTING_WORKFLOW requirements."""
@@ -43,5 +47,106 @@ def test_covered(): pass
         self.assertIn("CONTRACTS.UNCOVERED", coverage['missing_ids'])
         self.assertNotIn("CONTRACTS.COVERED", coverage['missing_ids'])
 
+    @verify_spec("CONTRACTS.TESTING_WORKFLOW")
+    def test_single_index_feeds_coverage_orphans_and_imports(self):
+        """CONTRACTS.TESTING_WORKFLOW.UNCOVERED_LIST: One test scan MUST drive coverage, orphan, and import checks."""
+        (self.specs_dir / "L1-CONTRACTS.md").write_text(
+            "---\nversion: 1.0\n---\n# L1\n## CONTRACTS.SCOPE\n### CONTRACTS.SCOPE.ALPHA\n## CONTRACTS.SKELETON\n"
+        )
+        (self.tests_dir / "test_skeleton.py").write_text(
+            "import myproj.internal.engine\n"
+            "from tests.specs.conftest import verify_spec\n"
+            "@verify_spec(\"CONTRACTS.SKELETON\")\n"
+            "def test_skeleton():\n    pytest.skip('todo')\n"
+            "@verify_spec(\"CONTRACTS.GONE\")\n"
+            "def test_gone(): pass\n"
+        )
+        (self.tests_dir / "ScopeTests.cs").write_text(
+            "[Fact]\npublic void Contracts_SCOPE_ALPHA() {}\n"
+        )
+
+        errors, _, coverage = validate_references(
+            self.specs_dir, self.tests_dir, "myproj", r"^myproj\.api"
+        )
+
+        self.assertEqual(coverage["logic"], 1)
+        self.assertEqual(coverage["skeletons"], 1)
+        self.assertTrue(any("Orphan @verify_spec: `CONTRACTS.GONE`" in e for e in errors))
+        self.assertTrue(any("Black-Box Violation in test_skeleton.py" in e for e in errors))
+
+    @verify_spec("CONTRACTS.TESTING_WORKFLOW")
+    def test_test_walk_prunes_ignored_dirs_and_gitignore(self):
+        """CONTRACTS.TESTING_WORKFLOW: Test discovery MUST skip vendored dirs and MAY honour .gitignore."""
+        for rel in ("test_a.py", "node_modules/pkg/test_b.js", "gen/test_c.py", "sub/test_d.py"):
+            path = self.tests_dir / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("")
+        (self.tests_dir / ".gitignore").write_text("gen/\n")
+
+        def walk(**kwargs):
+            return [
+                path.relative_to(self.tests_dir).as_posix()
+                for path in iter_test_files(self.tests_dir, {".py", ".js"}, **kwargs)
+            ]
+
+        self.assertEqual(walk(), ["gen/test_c.py", "sub/test_d.py", "test_a.py"])
+        self.assertEqual(walk(respect_gitignore=True), ["sub/test_d.py", "test_a.py"])
+
+    @verify_spec("CONTRACTS.TESTING_WORKFLOW")
+    def test_test_discovery_lists_git_worktrees_with_ls_files(self):
+        """CONTRACTS.TESTING_WORKFLOW: In git mode, test discovery SHOULD use the index and skip ignored files."""
+        subprocess.run(["git", "init"], cwd=self.test_dir, check=True, capture_output=True)
+        for rel in ("test_a.py", "gen/test_c.py", "sub/test_d.py", "node_modules/test_e.js", "test_gone.py"):
+            path = self.tests_dir / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("")
+        (self.test_dir / ".gitignore").write_text("gen/\n")
+        subprocess.run(["git", "add", "-A"], cwd=self.test_dir, check=True, capture_output=True)
+        (self.tests_dir / "test_gone.py").unlink()
+
+        def listed():
+            return [
+                path.relative_to(self.tests_dir).as_posix()
+                for path in iter_test_files(self.tests_dir, {".py", ".js"})
+            ]
+
+        with mock.patch.dict(os.environ, {discovery.DISCOVERY_MODE_ENV: "git"}):
+            with mock.patch.object(discovery.subprocess, "run", wraps=discovery.subprocess.run) as run:
+                self.assertEqual(listed(), ["sub/test_d.py", "test_a.py"])
+        self.assertEqual(run.call_args.args[0], discovery.GIT_LIST_FILES_COMMAND)
+        with mock.patch.object(discovery.subprocess, "run", side_effect=AssertionError("git is opt-in")):
+            self.assertEqual(listed(), ["gen/test_c.py", "sub/test_d.py", "test_a.py"])
+
+    @verify_spec("CONTRACTS.TESTING_WORKFLOW")
+    def test_glob_discovery_matches_across_walk_and_git_modes(self):
+        """CONTRACTS.TESTING_WORKFLOW: Glob discovery MUST match the same files in walk and git mode."""
+        subprocess.run(["git", "init"], cwd=self.test_dir, check=True, capture_output=True)
+        for rel in ("setup.py", "specs/L1-CONTRACTS.md", "tests/test_a.py", "tests/unit/test_b.py", "tests/unit/deep/test_c.ts"):
+            path = self.test_dir / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("")
+        patterns = ["tests/**/*.py", "*.py", "**/*.md", "tests/unit/*", "tests/**/test_?.ts"]
+
+        walked = discovery.glob_tree_files(self.test_dir, patterns, mode="walk")
+        self.assertEqual(discovery.glob_tree_files(self.test_dir, patterns, mode="git"), walked)
+        self.assertEqual(
+            [path.relative_to(self.test_dir).as_posix() for path in walked],
+            ["tests/test_a.py", "tests/unit/test_b.py", "setup.py", "specs/L1-CONTRACTS.md", "tests/unit/deep/test_c.ts"],
+        )
+
+    @verify_spec("CONTRACTS.TESTING_WORKFLOW")
+    def test_unannotated_test_files_skip_ast_parsing(self):
+        """CONTRACTS.TESTING_WORKFLOW: Files without verify_spec markers MUST NOT be AST-parsed."""
+        (self.tests_dir / "test_white_box.py").write_text("def test_internal():\n    assert True\n")
+        (self.tests_dir / "test_contract.py").write_text(
+            "@verify_spec(\"CONTRACTS.COVERED\")\ndef test_covered(): pass\n"
+        )
+
+        with mock.patch.object(validate.ast, "parse", wraps=validate.ast.parse) as parse:
+            metadata = validate.scan_existing_tests(self.tests_dir)
+
+        self.assertEqual(metadata, {"CONTRACTS.COVERED": "logic"})
+        self.assertEqual(parse.call_count, 1)
+
 if __name__ == "__main__":
     unittest.main()
@@ -26,5 +26,23 @@ class TestContractsTraceability(unittest.TestCase):
         # We fill Phase 2 to ensure the requirement is tracked.
         pass
 
+    @verify_spec("CONTRACTS.TRACEABILITY")
+    def test_l0_bullets_resolve_through_traceability_index(self):
+        """CONTRACTS.TRACEABILITY: L0 bullets MUST be covered by `Covers L0`, export suffix, or `_CMD` suffix."""
+        (self.specs_dir / "L0-VISION.md").write_text(
+            "---\nversion: 1.0\n---\n# L0\n## VISION.SCOPE\n"
+            "- **ALPHA**: a.\n- **BETA**: b.\n- **GAMMA**: c.\n- **DELTA**: d.\n"
+        )
+        (self.specs_dir / "L1-CONTRACTS.md").write_text(
+            "---\nversion: 1.0\n---\n# L1\n## CONTRACTS.SCOPE\n> Covers L0: ALPHA\n"
+            "### CONTRACTS.SCOPE.BETA\n### CONTRACTS.SCOPE.GAMMA_CMD\n"
+        )
+
+        errors, _, _ = validate_references(self.specs_dir, use_cache=False)
+
+        uncovered = [error for error in errors if error.startswith("L0_L1_COVERAGE")]
+        self.assertEqual(len(uncovered), 1)
+        self.assertIn("`VISION.DELTA`", uncovered[0])
+
 if __name__ == "__main__":
     unittest.main()
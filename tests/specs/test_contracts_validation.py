@@ -1,9 +1,19 @@
 import unittest
 import shutil
+import subprocess
 import tempfile
 from pathlib import Path
 from tests.specs.conftest import verify_spec
-from src.skills.vibespec.scripts.validate import validate_references
+from tests.benchmarks.bench_validate import generate_tree
+from src.skills.vibespec.scripts.validate import (
+    PARSE_CACHE_DIRNAME,
+    SpecParseCache,
+    SpecWatcher,
+    ValidationProfile,
+    activate_profile,
+    parse_spec_file,
+    validate_references,
+)
 
 class TestContractsValidation(unittest.TestCase):
     """Verifies CONTRACTS.VALIDATION logic"""
@@ -37,3 +47,134 @@ class TestContractsValidation(unittest.TestCase):
         # Should detect orphan traceability break (missing L0)
         orphan_warnings = [w for w in warnings if "Traceability break" in w]
         self.assertTrue(len(orphan_warnings) > 0, "Should report traceability warning for orphan L1 item")
+
+    @verify_spec("CONTRACTS.VALIDATION")
+    def test_parse_cache_reuses_unchanged_specs(self):
+        """CONTRACTS.VALIDATION.FULL_SCAN: Repeated scans MUST reflect edits while reusing cached parses."""
+        (self.test_dir / ".git").mkdir()
+        spec_file = self.specs_dir / "L1-CONTRACTS.md"
+        spec_file.write_text("---\nversion: 1.0.0\n---\n# L1\n## CONTRACTS.TIMEOUT\n")
+
+        first = validate_references(self.specs_dir, self.tests_dir)
+        cache_dir = self.test_dir / ".git" / PARSE_CACHE_DIRNAME
+        (entry,) = cache_dir.glob("*.json")
+        entry.write_text("{")
+        SpecParseCache(cache_dir).prune()
+        self.assertTrue(entry.exists(), "Pruning MUST go by the manifest, not by reading entries")
+        self.assertEqual(validate_references(self.specs_dir, self.tests_dir)[:2], first[:2])
+
+        spec_file.write_text("---\nversion: 1.0.0\n---\n# L1\n## CONTRACTS.TIMEOUT\n## CONTRACTS.TIMEOUT\n")
+        errors, _warnings, _coverage = validate_references(self.specs_dir, self.tests_dir)
+        self.assertTrue(any("Duplicate ID" in e for e in errors), "Edited spec MUST be re-parsed")
+
+        spec_file.unlink()
+        validate_references(self.specs_dir, self.tests_dir)
+        self.assertEqual(list(cache_dir.glob("*.json")), [], "Entries for deleted specs MUST be evicted")
+
+    @verify_spec("CONTRACTS.VALIDATION")
+    def test_item_bodies_are_sliced_from_spec_text(self):
+        """CONTRACTS.VALIDATION.FULL_SCAN: Item bodies MUST survive a cache round trip without being stored in it."""
+        spec_file = self.specs_dir / "L1-CONTRACTS.md"
+        spec_file.write_text(
+            "---\nversion: 1.0.0\n---\n# L1\n## CONTRACTS.ALPHA\nalpha-marker\n```\n## CONTRACTS.NOT_AN_ITEM\n```\n"
+            "## CONTRACTS.BETA\nbeta-marker"
+        )
+        cache = SpecParseCache(self.test_dir / "cache")
+
+        fresh = parse_spec_file(spec_file, cache)
+        cached = parse_spec_file(spec_file, cache)
+
+        for result in (fresh, cached):
+            self.assertEqual(list(result["items"]), ["CONTRACTS.ALPHA", "CONTRACTS.BETA"])
+            self.assertEqual(
+                result["items"]["CONTRACTS.ALPHA"]["body"], "alpha-marker\n```\n## CONTRACTS.NOT_AN_ITEM\n```\n"
+            )
+            self.assertEqual(result["items"]["CONTRACTS.BETA"]["body"], "beta-marker\n")
+        (entry,) = (self.test_dir / "cache").glob("*.json")
+        self.assertNotIn("alpha-marker", entry.read_text())
+
+        spec_file.write_text("---\nversion: 1.0.0\n---\n# L1\n## CONTRACTS.ALPHA\nalpha-marker\n## CONTRACTS.EMPTY")
+        self.assertEqual(parse_spec_file(spec_file)["items"]["CONTRACTS.EMPTY"]["body"], "")
+
+    @verify_spec("CONTRACTS.VALIDATION")
+    def test_watch_mode_reports_only_diagnostic_changes(self):
+        """CONTRACTS.VALIDATION.FULL_SCAN: Watch mode MUST re-parse changed specs and diff diagnostics."""
+        (self.specs_dir / "L1-CONTRACTS.md").write_text("---\nversion: 1.0.0\n---\n# L1\n## CONTRACTS.TIMEOUT\n")
+        extra = self.specs_dir / "L1-EXTRA.md"
+        extra.write_text("---\nversion: 1.0.0\n---\n# L1\n## CONTRACTS.OTHER\n")
+        watcher = SpecWatcher(self.specs_dir, self.tests_dir, use_cache=False)
+
+        self.assertIsNotNone(watcher.poll())
+        self.assertIsNone(watcher.poll(), "Unchanged inputs MUST NOT trigger a re-run")
+
+        extra.write_text("---\nversion: 1.0.0\n---\n# L1\n## CONTRACTS.OTHER\n## CONTRACTS.TIMEOUT\n")
+        lines = watcher.poll()
+        self.assertIn("1 spec file(s) changed", lines[0])
+        self.assertTrue(any(line.startswith("   + ❌ ERROR: Duplicate ID: CONTRACTS.TIMEOUT") for line in lines))
+
+        extra.unlink()
+        lines = watcher.poll()
+        self.assertTrue(any(line.startswith("   - ❌ ERROR: Duplicate ID: CONTRACTS.TIMEOUT") for line in lines))
+        self.assertEqual(validate_references(self.specs_dir, self.tests_dir, use_cache=False)[:2], watcher.result[:2])
+
+    @verify_spec("CONTRACTS.VALIDATION")
+    def test_profile_attributes_io_to_phases(self):
+        """CONTRACTS.VALIDATION.FULL_SCAN: `--profile` MUST report timings and counters per phase."""
+        (self.specs_dir / "L1-CONTRACTS.md").write_text("---\nversion: 1.0.0\n---\n# L1\n## CONTRACTS.TIMEOUT\n")
+        (self.tests_dir / "test_timeout.py").write_text(
+            "@verify_spec(\"CONTRACTS.TIMEOUT\")\ndef test_timeout(): pass\n"
+        )
+        (self.tests_dir / "test_internal.py").write_text("def test_internal(): pass\n")
+
+        with activate_profile(ValidationProfile()) as profile:
+            validate_references(self.specs_dir, self.tests_dir, use_cache=False)
+
+        phases = profile.as_dict()["phases"]
+        by_name = {phase["phase"]: phase for phase in phases}
+        self.assertEqual(
+            [phase["phase"] for phase in phases],
+            ["spec_discovery", "parse_specs", "index_exports", "scan_tests", "traceability", "l3_quality", "custom_rules"],
+        )
+        self.assertEqual(by_name["parse_specs"]["files_read"], 1)
+        self.assertEqual(by_name["scan_tests"]["ast_parses"], 1)
+        self.assertGreaterEqual(profile.as_dict()["total"]["wall_ms"], 0.0)
+        self.assertIn("scan_tests", profile.format_table())
+
+    @verify_spec("CONTRACTS.VALIDATION")
+    def test_benchmark_generator_is_deterministic_and_valid(self):
+        """CONTRACTS.VALIDATION.FULL_SCAN: Synthetic benchmark trees MUST be reproducible and structurally valid."""
+        first, second = self.test_dir / "a", self.test_dir / "b"
+        counts = generate_tree(first, 1)
+        generate_tree(second, 1)
+
+        files = sorted(path.relative_to(first) for path in first.rglob("*") if path.is_file())
+        self.assertEqual(files, sorted(path.relative_to(second) for path in second.rglob("*") if path.is_file()))
+        for rel in files:
+            self.assertEqual((first / rel).read_text(), (second / rel).read_text())
+
+        errors, _warnings, coverage = validate_references(first / "specs", first / "tests", use_cache=False)
+        self.assertEqual(errors, [])
+        self.assertEqual(coverage["total"], counts["l1_leaves"] + 1)
+        self.assertEqual(coverage["missing_ids"], {"CONTRACTS.VIBE_SPEC_RULES"})
+
+    @verify_spec("CONTRACTS.VALIDATION")
+    def test_since_scopes_per_file_checks_to_changed_specs(self):
+        """CONTRACTS.VALIDATION.FULL_SCAN: `--since` MUST limit per-file checks but keep global ones."""
+        git = ["git", "-c", "user.name=t", "-c", "user.email=t@example.com"]
+        subprocess.run(["git", "init"], cwd=self.test_dir, check=True, capture_output=True)
+        stale = "---\nversion: 1.0.0\n---\n# L3\n## [workflow] STALE.FLOW\nno steps\n"
+        (self.specs_dir / "L3-STALE.md").write_text(stale)
+        touched = self.specs_dir / "L3-TOUCHED.md"
+        touched.write_text("---\nversion: 1.0.0\n---\n# L3\n## [workflow] TOUCHED.FLOW\n**Steps**\n")
+        subprocess.run(["git", "add", "."], cwd=self.test_dir, check=True, capture_output=True)
+        subprocess.run(git + ["commit", "-m", "specs"], cwd=self.test_dir, check=True, capture_output=True)
+
+        touched.write_text("---\nversion: 1.0.0\n---\n# L3\n## [workflow] TOUCHED.FLOW\n## [workflow] STALE.FLOW\n")
+        errors, warnings, coverage = validate_references(self.specs_dir, use_cache=False, since="HEAD")
+
+        self.assertEqual(coverage["changed_files"], 1)
+        self.assertTrue(any("Duplicate ID: STALE.FLOW" in e for e in errors), "Global checks MUST see untouched specs")
+        quality = [w for w in warnings if w.startswith("L3 Quality")]
+        self.assertEqual(len(quality), 2)
+        self.assertTrue(all("STALE.FLOW" in w or "TOUCHED.FLOW" in w for w in quality))
+        self.assertEqual(len(validate_references(self.specs_dir, use_cache=False)[1]), 3)